@@ -9,7 +9,6 @@ from backend.database import GameModel
 from backend.schemas import NewGameRequest, GameRequest, LegalMovesRequest
 from backend.services.game_service import get_game, get_player_info
 from backend.state import games, game_variants, RULES_MAP
-from v_chess.rules.standard import StandardRules
 from v_chess.game import Game
 from v_chess.square import Square
 
@@ -25,12 +24,11 @@ async def new_game(req: NewGameRequest, request: Request):
         if variant == "random":
             variant = random.choice([v for v in RULES_MAP.keys() if v != 'random'])
             
-        variant_cls = RULES_MAP.get(variant.lower(), StandardRules)
+        rules = RULES_MAP.get(variant.lower(), RULES_MAP["standard"])
         
-        if variant_cls == RelayGame:
+        if rules is RelayGame:
             game = RelayGame(state=req.fen, time_control=req.time_control)
         else:
-            rules = variant_cls()
             game = Game(state=req.fen, rules=rules, time_control=req.time_control)
 
         games[game_id], game_variants[game_id] = game, variant
@@ -106,4 +104,4 @@ async def get_legal_moves(req: LegalMovesRequest):
     piece = game.state.board.get_piece(square)
     if not piece: return {"moves": [], "status": "success"}
     if piece.color != game.state.turn: raise HTTPException(status_code=400, detail="Piece belongs to the opponent")
-    return {"moves": [m.uci for m in game.legal_moves if m.start == square], "status": "success"}
+    return {"moves": [m.uci for m in game.legal_moves_from(square)], "status": "success"}
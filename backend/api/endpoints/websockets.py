@@ -16,7 +16,6 @@ from backend.database import GameModel
 from backend.socket_manager import manager
 from backend.state import games, game_variants, seeks, quick_match_queue, pending_takebacks, RULES_MAP
 from backend.services.game_service import get_game, get_player_info, save_game_to_db, trigger_ai_move
-from v_chess.rules.standard import StandardRules
 
 router = APIRouter()
 
@@ -74,7 +73,7 @@ async def lobby_websocket(websocket: WebSocket):
                     game_id = str(uuid4())
                     variant = seek["variant"]
                     if variant == "random": variant = random.choice([v for v in RULES_MAP.keys() if v != 'random'])
-                    rules = RULES_MAP.get(variant.lower(), StandardRules)()
+                    rules = RULES_MAP.get(variant.lower(), RULES_MAP["standard"])
                     game = Game(rules=rules, time_control=seek["time_control"])
                     games[game_id], game_variants[game_id] = game, variant
                     seeker_id, joiner_id = seek["user_id"], message.get("user", {}).get("id")
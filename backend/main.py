@@ -22,7 +22,6 @@ from backend.tasks.monitors import timeout_monitor, quick_match_monitor
 from backend.state import games, game_variants, RULES_MAP
 from v_chess.game import Game
 from v_chess.enums import Color
-from v_chess.rules.standard import StandardRules
 
 from v_chess.relay_game import RelayGame
 
@@ -38,13 +37,12 @@ async def lifespan(app: FastAPI):
         models = result.scalars().all()
         for model in models:
             try:
-                rules_cls = RULES_MAP.get(model.variant.lower(), StandardRules)
+                rules = RULES_MAP.get(model.variant.lower(), RULES_MAP["standard"])
                 time_control = json.loads(model.time_control) if model.time_control else None
                 
                 if model.variant.lower() == "grape":
                     game = RelayGame(state=model.fen, time_control=time_control)
                 else:
-                    rules = rules_cls()
                     game = Game(state=model.fen, rules=rules, time_control=time_control)
                 
                 game.move_history = json.loads(model.move_history)
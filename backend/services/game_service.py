@@ -73,9 +73,7 @@ async def get_game(game_id: str) -> Game:
             result = await session.execute(stmt)
             model = result.scalar_one_or_none()
             if model:
-                from v_chess.rules.standard import StandardRules
-                rules_cls = RULES_MAP.get(model.variant.lower(), StandardRules)
-                rules = rules_cls()
+                rules = RULES_MAP.get(model.variant.lower(), RULES_MAP["standard"])
                 time_control = json.loads(model.time_control) if model.time_control else None
                 game = Game(state=model.fen, rules=rules, time_control=time_control)
                 game.move_history = json.loads(model.move_history)
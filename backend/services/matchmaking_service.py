@@ -5,7 +5,6 @@ from uuid import uuid4
 from sqlalchemy import select
 
 from v_chess.game import Game
-from v_chess.rules.standard import StandardRules
 from v_chess.relay_game import RelayGame
 from backend import database
 from backend.database import GameModel
@@ -93,8 +92,7 @@ async def match_players():
             if variant.lower() == "grape":
                 game = RelayGame(time_control=m["time_control"])
             else:
-                rules_cls = RULES_MAP.get(variant.lower(), StandardRules)
-                rules = rules_cls()
+                rules = RULES_MAP.get(variant.lower(), RULES_MAP["standard"])
                 game = Game(rules=rules, time_control=m["time_control"])
             
             games[game_id] = game
@@ -13,15 +13,17 @@ seeks: dict[str, dict] = {}
 quick_match_queue: list[dict] = []
 pending_takebacks: dict[str, str] = {}
 
+# Rules are stateless, so every game of a variant shares one instance and its
+# compiled pipeline. "grape" maps to the RelayGame class, which has no rules.
 RULES_MAP = {
-    "standard": StandardRules,
-    "antichess": AntichessRules,
-    "atomic": AtomicRules,
-    "chess960": Chess960Rules,
-    "crazyhouse": CrazyhouseRules,
-    "horde": HordeRules,
-    "kingofthehill": KingOfTheHillRules,
-    "racingkings": RacingKingsRules,
-    "threecheck": ThreeCheckRules,
+    "standard": StandardRules(),
+    "antichess": AntichessRules(),
+    "atomic": AtomicRules(),
+    "chess960": Chess960Rules(),
+    "crazyhouse": CrazyhouseRules(),
+    "horde": HordeRules(),
+    "kingofthehill": KingOfTheHillRules(),
+    "racingkings": RacingKingsRules(),
+    "threecheck": ThreeCheckRules(),
     "grape": RelayGame,
 }
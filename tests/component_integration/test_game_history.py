@@ -36,3 +36,22 @@ def test_repetitions_counts_accurately():
     game.take_turn(Move("f6g8", player_to_move=game.state.turn))
 
     assert game.repetitions_of_position == 3
+
+def test_undo_rolls_back_repetition_counts():
+    """Verify undo_move rolls back position occurrences, including across pawn moves."""
+    game = Game()
+    shuffle = ["g1f3", "g8f6", "f3g1", "f6g8"]
+    for uci in shuffle:
+        game.take_turn(Move(uci, player_to_move=game.state.turn))
+    assert game.repetitions_of_position == 2
+
+    game.take_turn(Move("e2e4", player_to_move=game.state.turn))
+    game.undo_move()
+    game.undo_move()
+    game.take_turn(Move("f6g8", player_to_move=game.state.turn))
+    assert game.repetitions_of_position == 2
+
+    for uci in shuffle:
+        game.take_turn(Move(uci, player_to_move=game.state.turn))
+    assert game.repetitions_of_position == 3
+    assert game.is_draw
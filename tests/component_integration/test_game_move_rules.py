@@ -1,6 +1,7 @@
 import pytest
 from v_chess.game import Game, IllegalMoveException
 from v_chess.move import Move
+from v_chess.square import Square
 
 def test_take_turn_raises_illegal_move():
     """Verify take_turn raises exception for illegal moves."""
@@ -52,3 +53,26 @@ def test_san_generation_ambiguous_knight():
     game = Game("7k/8/8/8/8/2N1N3/8/K7 w - - 0 1")
     move = Move("c3d5", player_to_move=game.state.turn)
     assert move.get_san(game) == "Ncd5"
+
+def test_legal_move_index_is_reused_until_the_position_changes():
+    """Verify the legal moves are generated once per position and indexed."""
+    game = Game()
+    index = game.legal_move_index
+    assert game.legal_move_index is index
+    assert [m.uci for m in game.legal_moves_from(Square("g1"))] == [m.uci for m in game.legal_moves if m.start == Square("g1")]
+    assert game.legal_moves_from(Square("e4")) == []
+    assert index.get("e2e4") == Move("e2e4", player_to_move=game.state.turn)
+    assert index.get("e2e5") is None
+    assert index.get("not a move") is None
+    assert game.is_move_legal(Move("e2e4"))
+    assert not game.is_move_legal(Move("e2e5"))
+
+    game.take_turn(Move("e2e4", player_to_move=game.state.turn))
+    assert game.legal_move_index is not index
+    assert game.is_move_legal(Move("e7e5"))
+
+def test_take_turn_reports_validator_reason():
+    """Verify rejected moves still carry the validator's reason."""
+    game = Game("4k3/8/8/8/8/8/4r3/4K3 w - - 0 1")
+    with pytest.raises(IllegalMoveException, match="king left in check"):
+        game.take_turn(Move("e1f2"))
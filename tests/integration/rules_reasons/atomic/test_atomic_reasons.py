@@ -12,7 +12,7 @@ def test_atomic_board_legality_kings_adjacent():
     # Kings adjacent: White K e1, Black k e2. Only those pieces.
     fen = "8/8/8/8/8/8/4k3/4K3 w - - 0 1"
     state = state_from_fen(fen)
-    assert rules.validate_board_state(state) == BoardLegalityReason.KINGS_ADJACENT
+    assert rules.validate_board_state(state) == BoardLegalityReason.VALID
 
 def test_atomic_move_legality_king_exploded_own():
     rules = AtomicRules()
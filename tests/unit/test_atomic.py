@@ -71,11 +71,53 @@ def test_atomic_illegal_own_king_explosion():
     # Nxe2 is illegal
     assert game.rules.validate_move(game.state, Move("f3e2")) != MoveLegalityReason.LEGAL
 
-def test_atomic_adjacent_kings_illegal():
-    """Verify Kings cannot be adjacent."""
+def test_atomic_adjacent_kings_legal():
+    """Verify a King may step next to the enemy King."""
     # Black King on a1 (7,0). White King on c1 (7,2).
     # Kc1-b1 (7,1) is adjacent to a1.
     fen = "8/8/8/8/8/8/8/k1K5 w - - 0 1"
     game = Game(fen, rules=AtomicRules())
     
-    assert game.rules.validate_move(game.state, Move("c1b1")) != MoveLegalityReason.LEGAL
+    assert game.rules.validate_move(game.state, Move("c1b1")) == MoveLegalityReason.LEGAL
+
+def test_atomic_touching_kings_ignore_attacks():
+    """Verify a King touching the enemy King may stand on attacked squares."""
+    # The Rook on f3 covers rank 3; b4 touches the White King on b3.
+    fen = "8/8/8/1k6/8/1K3R2/8/8 b - - 0 1"
+    game = Game(fen, rules=AtomicRules())
+
+    assert {"b5a4", "b5b4", "b5c4"} <= {m.uci for m in game.legal_moves}
+
+def test_atomic_checked_king_escapes_by_touching():
+    """Verify a checked King escapes onto an attacked square next to the enemy King."""
+    # Ra8 checks the King on f8; e7 is covered by Re1 but touches Kd6.
+    fen = "R4k2/8/3K4/8/8/8/8/4R3 b - - 0 1"
+    game = Game(fen, rules=AtomicRules())
+
+    assert game.is_check
+    assert "f8e7" in [m.uci for m in game.legal_moves]
+    game.take_turn(Move("f8e7"))
+    assert game.rules.inactive_player_in_check(game.state) is False
+
+def test_atomic_exploding_king_ignores_check():
+    """Verify exploding the enemy King is legal even when in check."""
+    # White King e1 is checked by the Rook on e8; Nxf7 explodes the King on g8.
+    fen = "4r1k1/5p2/8/6N1/8/8/8/4K3 w - - 0 1"
+    game = Game(fen, rules=AtomicRules())
+
+    assert game.is_check
+    assert "g5f7" in [m.uci for m in game.legal_moves]
+    assert game.rules.validate_move(game.state, Move("g5h7")) == MoveLegalityReason.KING_LEFT_IN_CHECK
+
+def test_atomic_en_passant_explosion():
+    """Verify en passant explodes around the capture square."""
+    # White Pawn e5 takes d6 en passant; the Black Knight on c7 explodes.
+    fen = "4k3/2n5/8/3pP3/8/8/8/4K3 w - d6 0 1"
+    game = Game(fen, rules=AtomicRules())
+
+    assert "e5d6" in [m.uci for m in game.legal_moves]
+    game.take_turn(Move("e5d6"))
+
+    from v_chess.square import Square
+    for sq in ("d6", "d5", "e5", "c7"):
+        assert game.state.board.get_piece(Square(sq)) is None
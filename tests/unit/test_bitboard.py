@@ -0,0 +1,151 @@
+import pytest
+from v_chess.bitboard import BETWEEN, LINE, PSEUDO_MOVES, AttackTables, Bitboard
+from v_chess.board import Board
+from v_chess.enums import Color, Direction
+from v_chess.piece import Knight, Queen
+from v_chess.square import Square
+
+
+def mask_of(*squares: str) -> int:
+    mask = 0
+    for sq in squares:
+        mask |= 1 << Square(sq).index
+    return mask
+
+
+def test_rook_attacks_empty_board():
+    attacks = AttackTables.rook_attacks(Square("a1").index, 0)
+    assert attacks == mask_of(
+        "a2", "a3", "a4", "a5", "a6", "a7", "a8",
+        "b1", "c1", "d1", "e1", "f1", "g1", "h1"
+    )
+
+def test_rook_attacks_stop_at_blockers():
+    occupied = mask_of("d6", "b4", "d2")
+    attacks = AttackTables.rook_attacks(Square("d4").index, occupied)
+    assert attacks == mask_of(
+        "d5", "d6",
+        "d3", "d2",
+        "c4", "b4",
+        "e4", "f4", "g4", "h4"
+    )
+
+def test_bishop_attacks_stop_at_blockers():
+    occupied = mask_of("f6", "b2")
+    attacks = AttackTables.bishop_attacks(Square("d4").index, occupied)
+    assert attacks == mask_of(
+        "e5", "f6",
+        "c3", "b2",
+        "c5", "b6", "a7",
+        "e3", "f2", "g1"
+    )
+
+def test_edge_blockers_do_not_change_attacks():
+    sq = Square("d4").index
+    edges = mask_of("d8", "d1", "a4", "h4", "a7", "g1", "a1", "h8")
+    assert AttackTables.rook_attacks(sq, edges) == AttackTables.rook_attacks(sq, 0)
+    assert AttackTables.bishop_attacks(sq, edges) == AttackTables.bishop_attacks(sq, 0)
+
+def test_queen_attacks_is_rook_and_bishop_union():
+    sq = Square("e5").index
+    occupied = mask_of("e7", "c3", "g5", "b8")
+    assert AttackTables.queen_attacks(sq, occupied) == (
+        AttackTables.rook_attacks(sq, occupied) | AttackTables.bishop_attacks(sq, occupied)
+    )
+
+@pytest.mark.parametrize("fen, square, color, expected", [
+    ("8/8/8/8/8/8/8/R7", "a8", Color.WHITE, True),
+    ("8/8/8/8/P7/8/8/R7", "a8", Color.WHITE, False),
+    ("8/8/8/8/8/8/8/B7", "h8", Color.WHITE, True),
+    ("8/8/8/8/3p4/8/8/B7", "h8", Color.WHITE, False),
+    ("8/8/8/8/8/8/8/q7", "e5", Color.BLACK, True),
+    ("8/8/8/8/8/8/8/q7", "e6", Color.BLACK, False),
+])
+def test_is_attacked_by_sliders(fen, square, color, expected):
+    board = Board(fen)
+    assert board.bitboard.is_attacked(Square(square).index, color) is expected
+
+def test_is_attacked_respects_occupancy_override():
+    board = Board("8/8/8/8/P7/8/8/R7")
+    sq = Square("a8").index
+    without_blocker = board.bitboard.occupied & ~mask_of("a4")
+    assert board.bitboard.is_attacked(sq, Color.WHITE, occupancy_override=without_blocker)
+
+@pytest.mark.parametrize("direction, square, expected", [
+    (Direction.UP, "e4", ("e5",)),
+    (Direction.UP_RIGHT, "e4", ("f5",)),
+    (Direction.DOWN_LEFT, "e4", ("d3",)),
+    (Direction.UP_LEFT, "a4", ()),
+    (Direction.DOWN_RIGHT, "h4", ()),
+    (Direction.L_RIGHT_UP, "g1", ()),
+])
+def test_direction_shift(direction, square, expected):
+    assert direction.shift(mask_of(square)) == mask_of(*expected)
+
+def test_between_and_line_tables():
+    a1, h8, c3 = Square("a1").index, Square("h8").index, Square("c3").index
+    assert BETWEEN[a1][c3] == mask_of("b2")
+    assert BETWEEN[c3][a1] == BETWEEN[a1][c3]
+    assert LINE[a1][c3] == LINE[c3][h8] == mask_of("a1", "b2", "c3", "d4", "e5", "f6", "g7", "h8")
+    assert BETWEEN[a1][Square("b3").index] == LINE[a1][Square("b3").index] == 0
+
+def test_pseudo_moves_match_theoretical_moves():
+    for color in Color:
+        for p_type, table in PSEUDO_MOVES[color].items():
+            piece = p_type(color)
+            for idx in range(64):
+                square = Square(divmod(idx, 8))
+                assert table[idx] == mask_of(*(str(sq) for sq in piece.theoretical_moves(square)))
+
+def test_attackers_mask():
+    board = Board("8/8/8/8/P7/1N6/8/R3K3")
+    assert board.bitboard.attackers(Square("b1").index, Color.WHITE) == mask_of("a1")
+    assert board.bitboard.attackers(Square("c1").index, Color.WHITE) == mask_of("a1", "b3")
+    without_blocker = board.bitboard.occupied & ~mask_of("a4")
+    assert board.bitboard.attackers(Square("a8").index, Color.WHITE, without_blocker) == mask_of("a1")
+
+def test_mailbox_tracks_set_and_remove():
+    bb = Bitboard()
+    e4 = Square("e4").index
+    bb.set_piece(e4, Knight(Color.WHITE))
+    assert bb.piece_at(e4) == (Knight, Color.WHITE)
+    assert bb.occupied == bb.occupied_co[Color.WHITE] == 1 << e4
+
+    bb.set_piece(e4, Queen(Color.BLACK))
+    assert bb.mailbox[e4] is Queen(Color.BLACK)
+    assert bb.pieces[Color.WHITE][Knight] == 0
+    assert bb.occupied_co[Color.WHITE] == 0
+    assert bb.occupied == bb.occupied_co[Color.BLACK] == 1 << e4
+
+    bb.remove_piece(e4, Knight(Color.WHITE))
+    assert bb.piece_at(e4) == (Queen, Color.BLACK)
+    bb.remove_piece(e4, Queen(Color.BLACK))
+    assert bb.piece_at(e4) == (None, None)
+    assert bb.occupied == 0
+
+def test_mailbox_matches_masks_after_fen():
+    bb = Board("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R").bitboard
+    for idx in range(64):
+        piece = bb.mailbox[idx]
+        assert (piece is not None) == bool(bb.occupied >> idx & 1)
+        if piece is not None:
+            assert bb.pieces[piece.color][type(piece)] >> idx & 1
+    assert bb.copy().mailbox == bb.mailbox
+
+@pytest.mark.parametrize("color", [Color.WHITE, Color.BLACK])
+def test_attacks_by_matches_is_attacked(color):
+    bb = Board("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R").bitboard
+    expected = sum(1 << idx for idx in range(64) if bb.is_attacked(idx, color))
+    assert bb.attacks_by(color) == expected
+
+def test_attacks_by_follows_board_changes_and_occupancy():
+    board = Board("4k3/8/8/8/8/8/8/R3K3")
+    bb = board.bitboard
+    assert not bb.attacks_by(Color.WHITE) & mask_of("h1")
+    assert bb.attacks_by(Color.WHITE, bb.occupied & ~mask_of("e1")) & mask_of("h1")
+
+    bb.remove_piece(Square("e1").index, bb.mailbox[Square("e1").index])
+    assert bb.attacks_by(Color.WHITE) & mask_of("h1")
+    assert not bb.attacks_by(Color.WHITE) & mask_of("h8")
+    bb.toggle_piece(Square("d4").index, Queen, Color.WHITE)
+    assert bb.attacks_by(Color.WHITE) & mask_of("h8")
@@ -1,5 +1,9 @@
+import pickle
 import pytest
 from v_chess.board import Board
+from v_chess.game_state import GameState
+from v_chess.move import Move
+from v_chess.piece.knight import Knight
 from v_chess.piece.pawn import Pawn
 from v_chess.piece.king import King
 from v_chess.piece.rook import Rook
@@ -98,3 +102,19 @@ def test_starting_setup():
     assert len(board.get_pieces(piece_type=Rook, color=Color.WHITE)) == 2
     assert len(board.get_pieces(piece_type=King, color=Color.WHITE)) == 1
     assert len(board.get_pieces(piece_type=King, color=Color.BLACK)) == 1
+
+def test_pieces_are_interned():
+    board = Board()
+    board.set_piece(Knight(Color.WHITE), Square("g1"))
+    assert board.get_piece("g1") is Knight(Color.WHITE)
+    assert next(board.values()) is Knight(Color.WHITE)
+    assert board.get_pieces(Knight, Color.WHITE)[0] is Knight(Color.WHITE)
+    assert Knight(Color.WHITE) is not Knight(Color.BLACK)
+    assert pickle.loads(pickle.dumps(Knight(Color.WHITE))) is Knight(Color.WHITE)
+
+def test_value_types_use_slots():
+    state = GameState.starting_setup()
+    for value in (Square("e4"), Move("e2e4"), Knight(Color.WHITE), state):
+        assert not hasattr(value, "__dict__")
+    assert pickle.loads(pickle.dumps(Square("e4"))) is Square("e4")
+    assert state.fen == GameState.STARTING_FEN
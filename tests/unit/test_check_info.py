@@ -0,0 +1,41 @@
+from v_chess.game_state import GameState
+from v_chess.move import Move
+from v_chess.rules import StandardRules
+from v_chess.square import Square
+
+
+def bit(square: str) -> int:
+    return 1 << Square(square).index
+
+
+def test_check_info_is_computed_once_per_state():
+    state = GameState.from_fen("4k3/8/8/8/8/8/8/4K3 w - - 0 1")
+    assert state.check_info is state.check_info
+    assert state.check_info.king_sq == Square("e1").index
+    assert GameState.from_fen("8/8/8/8/8/8/8/8 w - - 0 1").check_info.king_sq == -1
+
+def test_checkers_pins_and_attacked_squares():
+    state = GameState.from_fen("4r1k1/8/8/8/1b6/8/3N4/4K3 w - - 0 1")
+    info = state.check_info
+    assert info.checkers == bit("e8")
+    assert info.evasions == bit("e8") | bit("e7") | bit("e6") | bit("e5") | bit("e4") | bit("e3") | bit("e2")
+    assert info.pins == {Square("d2").index: bit("d2") | bit("c3") | bit("b4")}
+    assert info.attacked & bit("e2")
+    assert not info.attacked & bit("f1")
+
+def test_attacked_squares_see_through_the_king():
+    state = GameState.from_fen("4r1k1/8/8/8/4K3/8/8/8 w - - 0 1")
+    assert state.check_info.attacked & bit("e3")
+    assert sorted(m.uci for m in StandardRules().generate_legal_moves(state)) == [
+        "e4d3", "e4d4", "e4d5", "e4f3", "e4f4", "e4f5"
+    ]
+
+def test_king_safety_uses_check_info():
+    rules = StandardRules()
+    state = GameState.from_fen("4r1k1/8/8/8/1b6/8/3N4/4K3 w - - 0 1")
+    reasons = {uci: rules.validate_move(state, Move(uci)) for uci in ("d2e4", "d2b3", "e1f1", "e1e2")}
+    assert reasons["d2e4"] == rules.MoveLegalityReason.KING_LEFT_IN_CHECK
+    assert reasons["d2b3"] == rules.MoveLegalityReason.KING_LEFT_IN_CHECK
+    assert reasons["e1f1"] == rules.MoveLegalityReason.LEGAL
+    assert reasons["e1e2"] == rules.MoveLegalityReason.KING_LEFT_IN_CHECK
+    assert sorted(m.uci for m in rules.generate_legal_moves(state)) == ["e1d1", "e1f1", "e1f2"]
@@ -1,7 +1,7 @@
 from v_chess.game import Game
 from v_chess.move import Move
 from v_chess.rules import Chess960Rules
-from v_chess.enums import Color, MoveLegalityReason
+from v_chess.enums import CastlingRight, Color, MoveLegalityReason
 from v_chess.piece import King, Rook
 
 def test_chess960_castling_non_standard():
@@ -38,3 +38,39 @@ def test_chess960_castling_blocked():
     
     move = Move("f1g1")
     assert game.rules.validate_move(game.state, move) != MoveLegalityReason.LEGAL
+
+def test_chess960_castling_with_king_on_target():
+    """Verify O-O when the king already stands on g1."""
+    fen = "k7/8/8/8/8/8/8/6KR w K - 3 1"
+    game = Game(fen, rules=Chess960Rules())
+
+    move = Move("g1h1")
+    assert game.rules.validate_move(game.state, move) == MoveLegalityReason.LEGAL
+
+    game.take_turn(move)
+    assert game.state.board.fen == "k7/8/8/8/8/8/8/5RK1"
+    # Castling onto the rook is not a capture.
+    assert game.state.halfmove_clock == 4
+
+def test_chess960_shorthand_rights_name_outermost_rook():
+    """Verify K and Q name the outermost rooks when they are off the a and h files."""
+    fen = "k7/8/8/8/8/8/8/1R2K1R1 w KQ - 0 1"
+    game = Game(fen, rules=Chess960Rules())
+
+    assert game.rules.validate_move(game.state, Move("e1g1")) == MoveLegalityReason.LEGAL
+    assert game.rules.validate_move(game.state, Move("e1b1")) == MoveLegalityReason.LEGAL
+
+    game.take_turn(Move("g1g2"))
+    assert game.state.castling_rights == (CastlingRight.WHITE_LONG,)
+
+def test_chess960_castling_listed_once_but_target_notation_accepted():
+    """Verify each castle is listed as KxR while e1g1 is still playable."""
+    fen = "1k6/8/8/8/8/8/8/R3K2R w HA - 0 1"
+    game = Game(fen, rules=Chess960Rules())
+    ucis = {m.uci for m in game.legal_moves}
+    assert {"e1h1", "e1a1"} <= ucis
+    assert not {"e1g1", "e1c1"} & ucis
+
+    game.take_turn(Move("e1g1"))
+    assert game.state.board.fen == "1k6/8/8/8/8/8/8/R4RK1"
+    assert game.move_history[-1] == "O-O"
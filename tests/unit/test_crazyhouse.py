@@ -3,7 +3,7 @@ from v_chess.move import Move
 from v_chess.rules import CrazyhouseRules
 from v_chess.enums import Color, GameOverReason
 from v_chess.game_state import CrazyhouseGameState
-from v_chess.piece import Queen, Pawn, Knight
+from v_chess.piece import Queen, Pawn, Knight, POCKET_INDEX, EMPTY_POCKETS
 
 def test_crazyhouse_capture_to_pocket():
     """Verify that capturing a piece adds it to the pocket."""
@@ -17,9 +17,9 @@ def test_crazyhouse_capture_to_pocket():
     assert isinstance(game.state, CrazyhouseGameState)
     # White should now have a Pawn in their pocket
     white_pocket = game.state.pockets[0]
-    assert len(white_pocket) == 1
-    assert isinstance(white_pocket[0], Pawn)
-    assert white_pocket[0].color == Color.WHITE
+    assert sum(white_pocket) == 1
+    assert white_pocket[POCKET_INDEX[Pawn]] == 1
+    assert game.state.pockets[1] == EMPTY_POCKETS[1]
 
 def test_crazyhouse_drop_move():
     """Verify that dropping a piece works."""
@@ -27,7 +27,7 @@ def test_crazyhouse_drop_move():
     fen = "k7/8/8/8/8/8/8/7K[N] w - - 0 1"
     game = Game(fen, rules=CrazyhouseRules())
     
-    assert len(game.state.pockets[0]) == 1
+    assert game.state.pockets[0][POCKET_INDEX[Knight]] == 1
     
     # Drop Knight to e4
     drop_move = Move("N@e4")
@@ -40,7 +40,7 @@ def test_crazyhouse_drop_move():
     assert piece.color == Color.WHITE
     
     # Pocket should be empty
-    assert len(game.state.pockets[0]) == 0
+    assert sum(game.state.pockets[0]) == 0
 
 def test_crazyhouse_legal_moves_include_drops():
     """Verify that legal_moves includes possible drops."""
@@ -86,4 +86,21 @@ def test_crazyhouse_checkmate_with_drop():
     game.take_turn(Move("Q@a8"))
     
     assert game.is_over
-    assert game.game_over_reason == GameOverReason.CHECKMATE
\ No newline at end of file
+    assert game.game_over_reason == GameOverReason.CHECKMATE
+
+def test_crazyhouse_drops_block_check():
+    """Verify that in check, drops are limited to the squares between king and checker."""
+    fen = "4r1k1/8/8/8/8/8/8/4K3[NP] w - - 0 1"
+    game = Game(fen, rules=CrazyhouseRules())
+
+    drops = sorted(m.uci for m in game.legal_moves if m.is_drop)
+    assert drops == sorted(f"{p}@e{rank}" for p in "NP" for rank in range(2, 8))
+
+def test_crazyhouse_no_drops_in_double_check():
+    """Verify that no drop answers a double check."""
+    fen = "4r1k1/8/8/8/1b6/8/8/4K3[Q] w - - 0 1"
+    game = Game(fen, rules=CrazyhouseRules())
+
+    assert game.is_check
+    assert game.legal_moves
+    assert not any(m.is_drop for m in game.legal_moves)
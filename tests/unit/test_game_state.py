@@ -58,3 +58,43 @@ def test_gamestate_immutability():
     state = GameState.starting_setup()
     with pytest.raises(AttributeError):
         state.halfmove_clock = 10
+
+def test_zobrist_key_ignores_move_clocks():
+    a = GameState.from_fen("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1")
+    b = GameState.from_fen("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 7 12")
+    assert a.zobrist_key == b.zobrist_key
+
+@pytest.mark.parametrize("other", [
+    "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR b KQkq - 0 1",
+    "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w Kkq - 0 1",
+    "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR[P] w KQkq - 0 1",
+    "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1 +1+0",
+])
+def test_zobrist_key_covers_position_fields(other):
+    base = GameState.from_fen("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1")
+    assert GameState.from_fen(other).zobrist_key != base.zobrist_key
+
+def test_zobrist_key_covers_en_passant_file():
+    a = GameState.from_fen("rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq e3 0 1")
+    b = GameState.from_fen("rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq - 0 1")
+    assert a.zobrist_key != b.zobrist_key
+
+def test_incremental_zobrist_key_matches_recomputed_key():
+    from v_chess.rules import StandardRules, AtomicRules, CrazyhouseRules, ThreeCheckRules
+    from v_chess.move import Move
+    from v_chess.zobrist import compute_key
+
+    cases = [
+        (StandardRules(), "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1", ["e1g1", "a8b8", "d5e6"]),
+        (StandardRules(), "8/8/8/3pP3/8/8/8/4K2k w - d6 0 1", ["e5d6"]),
+        (StandardRules(), "r3k3/1P6/8/8/8/8/8/4K3 w q - 0 1", ["b7a8q"]),
+        (AtomicRules(), "rnbqkbnr/ppp1pppp/8/3p4/4P3/8/PPPP1PPP/RNBQKBNR w KQkq d6 0 2", ["e4d5"]),
+        (CrazyhouseRules(), "rnbqkbnr/ppp1pppp/8/3p4/4P3/8/PPPP1PPP/RNBQKBNR[] w KQkq d6 0 2", ["e4d5", "d8d5", "P@e4"]),
+        (ThreeCheckRules(), "rnbqkbnr/pppp1ppp/8/4p3/4P3/8/PPPP1PPP/RNBQKBNR w KQkq - 0 2 +0+0", ["f1b5", "c7c6"]),
+    ]
+    for rules, fen, ucis in cases:
+        state = GameState.from_fen(fen)
+        for uci in ucis:
+            state = rules.apply_move(state, Move(uci, player_to_move=state.turn))
+            assert state.zobrist_key == compute_key(state)
+            assert state.zobrist_key == GameState.from_fen(state.fen).zobrist_key
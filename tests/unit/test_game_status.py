@@ -0,0 +1,41 @@
+import pytest
+from v_chess.enums import Color, GameOverReason
+from v_chess.game import Game
+from v_chess.game_state import GameState
+from v_chess.move import Move
+from v_chess.rules import StandardRules, AntichessRules, GameStatus
+
+
+@pytest.mark.parametrize("rules, fen, expected", [
+    (StandardRules(), "rnb1kbnr/pppp1ppp/8/4p3/6Pq/5P2/PPPPP2P/RNBQKBNR w KQkq - 1 3",
+     GameStatus(True, False, GameOverReason.CHECKMATE, Color.BLACK)),
+    (StandardRules(), "7k/5Q2/6K1/8/8/8/8/8 b - - 0 1",
+     GameStatus(False, False, GameOverReason.STALEMATE, None)),
+    (StandardRules(), "4k3/8/8/8/8/8/8/4K2R b K - 0 1",
+     GameStatus(False, True, GameOverReason.ONGOING, None)),
+    (AntichessRules(), "8/8/8/8/8/8/8/K7 b - - 0 1",
+     GameStatus(False, False, GameOverReason.ALL_PIECES_CAPTURED, Color.BLACK)),
+])
+def test_evaluate_status(rules, fen, expected):
+    assert rules.evaluate_status(GameState.from_fen(fen)) == expected
+
+def test_legal_move_search_is_shared_by_conditions(monkeypatch):
+    rules = StandardRules()
+    state = GameState.from_fen("7k/5Q2/6K1/8/8/8/8/8 b - - 0 1")
+    calls = []
+    generate = rules.generate_legal_moves
+    monkeypatch.setattr(rules, "generate_legal_moves", lambda s: calls.append(s) or generate(s))
+    assert not rules.has_legal_moves(state)
+    assert rules.get_game_over_reason(state) == GameOverReason.STALEMATE
+    assert rules.evaluate_status(state).reason == GameOverReason.STALEMATE
+    assert calls == [state]
+
+def test_game_evaluates_status_once_per_state():
+    game = Game(rules=StandardRules())
+    for uci in ["f2f3", "e7e5", "g2g4", "d8h4"]:
+        game.take_turn(Move(uci, player_to_move=game.state.turn))
+    status = game.status
+    assert status is game.status
+    assert game.is_checkmate and game.is_over and not game.is_draw
+    assert game.winner == Color.BLACK.value
+    assert game.move_history[-2:] == ["Qh4#", "0-1"]
@@ -0,0 +1,79 @@
+import pytest
+from v_chess.game_state import GameState
+from v_chess.move_generator import generate_moves, has_capture
+from v_chess.rules import (
+    Rules, StandardRules, AntichessRules, AtomicRules, Chess960Rules,
+    CrazyhouseRules, HordeRules, KingOfTheHillRules, RacingKingsRules,
+    ThreeCheckRules
+)
+
+
+def uci_set(moves):
+    return sorted(m.uci for m in moves)
+
+
+@pytest.mark.parametrize("fen, expected", [
+    ("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1", 20),
+    ("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1", 48),
+    ("8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1", 14),
+    ("r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1", 6),
+    ("rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8", 44),
+])
+def test_standard_legal_move_counts(fen, expected):
+    assert len(StandardRules().generate_legal_moves(GameState.from_fen(fen))) == expected
+
+def test_pinned_piece_moves_along_pin_ray():
+    state = GameState.from_fen("4k3/4r3/8/8/8/8/4R3/4K3 w - - 0 1")
+    moves = uci_set(StandardRules().generate_legal_moves(state))
+    rook_moves = [m for m in moves if m.startswith("e2")]
+    assert rook_moves == ["e2e3", "e2e4", "e2e5", "e2e6", "e2e7"]
+
+def test_double_check_allows_only_king_moves():
+    state = GameState.from_fen("4k3/8/8/8/8/5n2/3P4/r3K3 w - - 0 1")
+    moves = StandardRules().generate_legal_moves(state)
+    assert moves
+    assert all(str(m.start) == "e1" for m in moves)
+
+def test_en_passant_exposing_king_is_excluded():
+    state = GameState.from_fen("8/8/8/K2Pp2r/8/8/8/7k w - e6 0 1")
+    moves = uci_set(StandardRules().generate_legal_moves(state))
+    assert "d5e6" not in moves
+    assert "d5d6" in moves
+
+def test_pinned_pawn_captures_only_along_pin():
+    state = GameState.from_fen("4k3/8/8/1b1n4/2P5/3K4/8/8 w - - 0 1")
+    moves = uci_set(StandardRules().generate_legal_moves(state))
+    assert [m for m in moves if m.startswith("c4")] == ["c4b5"]
+
+@pytest.mark.parametrize("fen, expected", [
+    ("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w - - 0 1", False),
+    ("rnbqkbnr/pppp1ppp/8/4p3/3P4/8/PPP1PPPP/RNBQKBNR w - - 0 2", True),
+    ("4k3/8/8/3Pp3/8/8/8/8 w - e6 0 1", True),
+    ("4k3/8/8/8/8/8/8/R3r2K w - - 0 1", True),
+    ("4k3/8/8/8/8/8/8/R1N1r2K w - - 0 1", False),
+])
+def test_has_capture(fen, expected):
+    assert has_capture(GameState.from_fen(fen)) is expected
+
+def test_captures_only_includes_en_passant():
+    state = GameState.from_fen("4k3/8/8/3Pp3/8/8/8/4K2r w - e6 0 1")
+    moves = generate_moves(state, king_safety=False, captures_only=True)
+    assert uci_set(moves) == ["d5e6"]
+
+@pytest.mark.parametrize("rules_cls, fen", [
+    (StandardRules, "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1"),
+    (StandardRules, "r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1"),
+    (AntichessRules, "rnbqkbnr/pppp1ppp/8/4p3/3P4/8/PPP1PPPP/RNBQKBNR w - - 0 2"),
+    (AtomicRules, "rnbqkbnr/ppp1pppp/8/3p4/4P3/5N2/PPPP1PPP/RNBQKB1R b KQkq - 1 2"),
+    (Chess960Rules, "bqnb1rkr/pp3ppp/3ppn2/2p5/5P2/P2P4/NPP1P1PP/BQ1BNRKR w HFhf - 2 9"),
+    (CrazyhouseRules, "r1bqkbnr/pppp1ppp/2n5/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R[Pp] w KQkq - 2 3"),
+    (HordeRules, "rnbqkbnr/pppppppp/8/1PP2PP1/PPPPPPPP/PPPPPPPP/PPPPPPPP/PPPPPPPP w kq - 0 1"),
+    (KingOfTheHillRules, "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"),
+    (RacingKingsRules, "8/8/8/8/8/8/krbnNBRK/qrbnNBRQ w - - 0 1"),
+    (ThreeCheckRules, "rnbqkbnr/pppp1ppp/8/4p3/4P3/8/PPPP1PPP/RNBQKBNR w KQkq - 0 2 +0+0"),
+])
+def test_native_generator_matches_validator_pipeline(rules_cls, fen):
+    rules = rules_cls()
+    state = GameState.from_fen(fen)
+    expected = set(uci_set(Rules.generate_legal_moves(rules, state)))
+    assert uci_set(rules.generate_legal_moves(state)) == sorted(expected)
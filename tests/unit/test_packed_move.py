@@ -0,0 +1,58 @@
+import pytest
+from v_chess.enums import Color
+from v_chess.game_state import GameState
+from v_chess.move import Move
+from v_chess.move_generator import generate_packed_moves, generate_moves
+from v_chess.packed_move import MoveList, from_move, to_move, from_uci, to_uci
+
+
+@pytest.mark.parametrize("uci, color", [
+    ("e2e4", Color.WHITE),
+    ("a7a8q", Color.WHITE),
+    ("h2h1n", Color.BLACK),
+    ("b7b8k", Color.WHITE),
+    ("N@f3", Color.WHITE),
+    ("P@e5", Color.BLACK),
+])
+def test_round_trips_through_move_and_uci(uci, color):
+    move = Move(uci, player_to_move=color)
+    packed = from_move(move)
+    assert 0 <= packed < 1 << 16
+    assert to_move(packed, color) == move
+    assert from_uci(uci) == packed
+    assert to_uci(packed, color) == move.uci
+
+def test_to_move_reuses_instances():
+    packed = from_uci("g1f3")
+    assert to_move(packed, Color.WHITE) is to_move(packed, Color.WHITE)
+    assert to_move(packed, Color.WHITE) != to_move(packed, Color.BLACK)
+
+def test_distinct_moves_pack_differently():
+    moves = ["a7a8q", "a7a8r", "a7a8b", "a7a8n", "a7a8k", "a7a8", "Q@a8", "N@a8"]
+    assert len({from_uci(uci) for uci in moves}) == len(moves)
+
+def test_invalid_uci_raises():
+    with pytest.raises(ValueError):
+        from_uci("e9e4")
+    with pytest.raises(ValueError):
+        from_uci("X@e4")
+
+def test_move_list_grows_and_clears():
+    moves = MoveList(capacity=2)
+    for packed in range(5):
+        moves.append(packed)
+    assert len(moves) == 5
+    assert list(moves) == [0, 1, 2, 3, 4]
+    assert moves[-1] == 4
+    moves.clear()
+    assert len(moves) == 0
+    with pytest.raises(IndexError):
+        moves[0]
+
+def test_packed_generation_matches_generate_moves():
+    state = GameState.from_fen("1r5k/P7/8/8/8/8/8/K7 w - - 0 1")
+    moves = MoveList()
+    generate_packed_moves(state, moves)
+    assert len(moves) == 9
+    assert moves.to_moves(state.turn) == generate_moves(state)
+    assert Move("a7b8q") in generate_moves(state)
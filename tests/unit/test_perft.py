@@ -0,0 +1,63 @@
+import pytest
+from v_chess.__main__ import build_parser
+from v_chess.game_state import GameState
+from v_chess.perft import VARIANTS, REFERENCE_POSITIONS, perft, divide, run_perft
+
+
+SHALLOW_CASES = [
+    (variant, position)
+    for variant, positions in REFERENCE_POSITIONS.items()
+    for position in positions
+]
+
+
+@pytest.mark.parametrize("variant, position", SHALLOW_CASES, ids=lambda p: getattr(p, "name", p))
+def test_reference_positions_shallow(variant, position):
+    rules = VARIANTS[variant]()
+    state = GameState.from_fen(position.fen)
+    for depth, expected in enumerate(position.counts[:2], start=1):
+        assert perft(rules, state, depth) == expected
+
+def test_every_variant_has_reference_positions():
+    assert set(REFERENCE_POSITIONS) == set(VARIANTS)
+
+def test_divide_sums_to_perft():
+    rules = VARIANTS["standard"]()
+    state = GameState.from_fen("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1")
+    breakdown = divide(rules, state, 2)
+    assert len(breakdown) == 48
+    assert breakdown["e1g1"] == 43
+    assert sum(breakdown.values()) == 2039
+
+def test_transposition_table_gives_same_count():
+    rules = VARIANTS["standard"]()
+    state = GameState.from_fen(rules.starting_fen)
+    table = {}
+    assert perft(rules, state, 3, table) == 8902
+    assert table
+    assert perft(rules, state, 3, table) == 8902
+
+def test_terminal_variant_position_has_no_children():
+    rules = VARIANTS["kingofthehill"]()
+    state = GameState.from_fen("8/8/8/3k4/8/8/3K4/8 w - - 0 1")
+    assert perft(rules, state, 1) == 0
+
+def test_run_perft_reports_speed():
+    result = run_perft(VARIANTS["standard"](), REFERENCE_POSITIONS["standard"][0].fen, 2, split=True)
+    assert result.nodes == 400
+    assert sum(result.divide.values()) == 400
+    assert result.nodes_per_second > 0
+
+def test_perft_command_suite(capsys):
+    args = build_parser().parse_args(["perft", "--suite", "--variant", "horde", "--depth", "2"])
+    assert args.handler(args) == 0
+    out = capsys.readouterr().out
+    assert "0 failed" in out
+
+def test_divide_lists_each_chess960_castle_once():
+    rules = VARIANTS["chess960"]()
+    state = GameState.from_fen("brqnkr1b/pppppppp/5n2/8/3P4/4P3/PPP2PPP/BRQNKRNB b FBfb - 0 2")
+    breakdown = divide(rules, state, 1)
+    assert "e8f8" in breakdown
+    assert "e8g8" not in breakdown
+    assert len(breakdown) == 23
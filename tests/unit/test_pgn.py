@@ -0,0 +1,77 @@
+import io
+from v_chess.game import Game
+from v_chess.move import Move
+from v_chess.pgn import TokenKind, tokenize, read_games, write_game
+from v_chess.rules import StandardRules, KingOfTheHillRules, CrazyhouseRules, Chess960Rules
+
+
+PGN = """[Event "Casual"]
+[White "A \\"quoted\\" name"]
+[Variant "King of the Hill"]
+[Result "1-0"]
+
+1. e4 {best by test} e5 2. Nf3!? (2. f4 exf4 {gambit} 3. Nf3) 2... Nc6 $1
+; rest of line comment
+3. Bb5 {multi
+line} a6 1-0
+
+[Event "Second"]
+
+1. d4 d5 *
+"""
+
+
+def test_tokenize_streams_lines():
+    tokens = list(tokenize(io.StringIO(PGN)))
+    assert tokens[1] == (TokenKind.TAG, ("White", 'A "quoted" name'))
+    assert (TokenKind.COMMENT, "best by test") in tokens
+    assert (TokenKind.NAG, 5) in tokens
+    assert (TokenKind.COMMENT, "multi\nline") in tokens
+    assert [v for k, v in tokens if k is TokenKind.RESULT] == ["1-0", "*"]
+
+def test_read_games_skips_variations():
+    first, second = read_games(io.StringIO(PGN))
+    assert first.moves == ["e4", "e5", "Nf3", "Nc6", "Bb5", "a6"]
+    assert first.comments == {1: "best by test", 4: "rest of line comment", 5: "multi\nline"}
+    assert first.nags == {3: [5], 4: [1]}
+    assert first.result == "1-0"
+    assert first.variant == "kingofthehill"
+    assert isinstance(first.rules, KingOfTheHillRules)
+    assert second.headers == {"Event": "Second"} and second.moves == ["d4", "d5"]
+
+def test_castling_with_check_suffix_is_read():
+    game = Game("4k3/8/8/8/8/8/8/R3K3 w Q - 0 1")
+    assert Move.from_san("O-O-O+", game).uci == "e1c1"
+
+def test_zero_castling_is_read():
+    pgn = '[FEN "4k3/8/8/8/8/8/8/R3K2R w KQ - 0 1"]\n\n1. 0-0 Kd7 2.0-0-0 *\n'
+    assert [v for k, v in tokenize(io.StringIO(pgn)) if k is TokenKind.SAN] == ["0-0", "Kd7", "0-0-0"]
+    pgn = '[FEN "4k3/8/8/8/8/8/8/R3K2R w KQ - 0 1"]\n\n1. 0-0 Kd7 *\n'
+    (read,) = read_games(io.StringIO(pgn))
+    assert read.to_game().uci_history == ["e1g1", "e8d7"]
+
+def test_write_game_round_trips():
+    game = Game(rules=StandardRules())
+    for uci in ["f2f3", "e7e5", "g2g4", "d8h4"]:
+        game.take_turn(Move(uci, player_to_move=game.state.turn))
+    pgn = write_game(game, {"White": "Fool"})
+    assert '[White "Fool"]' in pgn and '[Result "0-1"]' in pgn
+    assert "1. f3 e5 2. g4 Qh4# 0-1" in pgn
+    (read,) = read_games(io.StringIO(pgn))
+    assert read.to_game().uci_history == game.uci_history
+
+def test_write_game_adds_variant_and_fen():
+    fen = "7k/R5pp/8/8/8/8/8/7K[Q] b - - 0 1"
+    game = Game(fen, rules=CrazyhouseRules())
+    game.take_turn(Move("h8g8", player_to_move=game.state.turn))
+    pgn = write_game(game)
+    assert '[Variant "Crazyhouse"]' in pgn and f'[FEN "{game.history[0].fen}"]' in pgn
+    assert "1... Kg8 *" in pgn
+
+def test_chess960_castling_round_trips():
+    game = Game("1k6/8/8/8/8/8/8/R1K4R w HA - 0 1", rules=Chess960Rules())
+    game.take_turn(Move("c1a1", player_to_move=game.state.turn))
+    pgn = write_game(game)
+    assert "1. O-O-O *" in pgn
+    (read,) = read_games(io.StringIO(pgn))
+    assert read.to_game().uci_history == game.uci_history
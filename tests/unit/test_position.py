@@ -0,0 +1,79 @@
+import pytest
+from v_chess.castling import rights_mask
+from v_chess.enums import CastlingRight
+from v_chess.game_state import GameState
+from v_chess.move import Move
+from v_chess.position import Position
+from v_chess.rules import (
+    StandardRules, AtomicRules, Chess960Rules, CrazyhouseRules, ThreeCheckRules
+)
+from v_chess.zobrist import compute_key
+
+
+def state_signature(state):
+    return (state.fen, state.zobrist_key, state.explosion_square,
+            getattr(state, "pockets", None), getattr(state, "checks", None))
+
+
+@pytest.mark.parametrize("rules, fen", [
+    (StandardRules(), "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1"),
+    (StandardRules(), "r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1"),
+    (StandardRules(), "rnbqkbnr/ppp1p1pp/8/3pPp2/8/8/PPPP1PPP/RNBQKBNR w KQkq f6 0 3"),
+    (Chess960Rules(), "bqnb1rkr/pp3ppp/3ppn2/2p5/5P2/P2P4/NPP1P1PP/BQ1BNRKR w HFhf - 2 9"),
+    (AtomicRules(), "rnbqkb1r/pp1p1ppp/2p2n2/4p3/4P3/2N2N2/PPPP1PPP/R1BQKB1R w KQkq - 0 4"),
+    (CrazyhouseRules(), "r1bqkbnr/pppp1ppp/2n5/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R[Pp] w KQkq - 2 3"),
+    (ThreeCheckRules(), "r1bqkbnr/pppp1ppp/2n5/1B2p3/4P3/5N2/PPPP1PPP/RNBQK2R w KQkq - 4 4 +2+0"),
+])
+def test_push_matches_apply_move_and_pop_restores(rules, fen):
+    state = GameState.from_fen(fen)
+    position = Position(state, rules)
+    for move in rules.generate_legal_moves(state):
+        position.push(move)
+        pushed = position.snapshot()
+        assert state_signature(pushed) == state_signature(rules.apply_move(state, move))
+        assert pushed.zobrist_key == compute_key(pushed)
+        assert position.pop() == move
+        assert state_signature(position.snapshot()) == state_signature(state)
+
+def test_pop_unwinds_a_sequence():
+    rules = StandardRules()
+    state = GameState.from_fen(rules.starting_fen)
+    position = Position(state, rules)
+    for uci in ["e2e4", "d7d5", "e4d5", "g8f6", "f1b5", "c7c6", "g1f3", "c6b5", "e1g1"]:
+        position.push(Move(uci, player_to_move=position.turn))
+    assert len(position) == 9
+    assert position.snapshot().fen == "rnbqkb1r/pp2pppp/5n2/1p1P4/8/5N2/PPPP1PPP/RNBQ1RK1 b kq - 1 5"
+    while len(position):
+        position.pop()
+    assert position.board.bitboard.occupied == state.board.bitboard.occupied
+    assert state_signature(position.snapshot()) == state_signature(state)
+
+def test_push_updates_castling_mask():
+    rules = StandardRules()
+    position = Position.from_fen("r3k2r/8/8/8/8/8/8/R3K2R w KQkq - 0 1", rules)
+    position.push(Move("h1h2", player_to_move=position.turn))
+    assert position.castling_mask == rights_mask((CastlingRight.WHITE_LONG, CastlingRight.BLACK_SHORT, CastlingRight.BLACK_LONG))
+    assert position.castling_rights == (CastlingRight.WHITE_LONG, CastlingRight.BLACK_SHORT, CastlingRight.BLACK_LONG)
+    assert position.zobrist_key == compute_key(position.view())
+    position.pop()
+    assert position.castling_rights == (
+        CastlingRight.WHITE_SHORT, CastlingRight.WHITE_LONG, CastlingRight.BLACK_SHORT, CastlingRight.BLACK_LONG
+    )
+
+def test_snapshot_is_detached_from_later_pushes():
+    rules = StandardRules()
+    position = Position.from_fen(rules.starting_fen, rules)
+    position.push(Move("e2e4", player_to_move=position.turn))
+    snapshot = position.snapshot()
+    position.push(Move("e7e5", player_to_move=position.turn))
+    assert snapshot.fen == "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq e3 0 1"
+    assert len(position.legal_moves()) == 29
+
+def test_atomic_push_records_explosion():
+    rules = AtomicRules()
+    position = Position.from_fen("rnbqkbnr/ppp1pppp/8/3p4/4P3/8/PPPP1PPP/RNBQKBNR w KQkq d6 0 2", rules)
+    position.push(Move("e4d5", player_to_move=position.turn))
+    assert str(position.explosion_square) == "d5"
+    assert position.board.get_piece(position.explosion_square) is None
+    position.pop()
+    assert position.explosion_square is None
@@ -60,3 +60,13 @@ def test_rk_illegal_check():
     
     # Kh1 is illegal
     assert game.rules.validate_move(game.state, Move("g1h1")) != MoveLegalityReason.LEGAL
+
+def test_rk_discovered_check_is_illegal():
+    """Verify moves uncovering a check on the enemy King are illegal."""
+    # White Rook on a1 behind the White Knight on a4; Black King on a8.
+    fen = "k7/8/8/8/N7/8/8/R6K w - - 0 1"
+    game = Game(fen, rules=RacingKingsRules())
+
+    legal = [m.uci for m in game.legal_moves]
+    assert not any(uci.startswith("a4") for uci in legal)
+    assert game.rules.validate_move(game.state, Move("a4b6")) == MoveLegalityReason.GIVES_CHECK
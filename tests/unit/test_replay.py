@@ -0,0 +1,48 @@
+import io
+import json
+from v_chess.__main__ import build_parser
+from v_chess.pgn import read_games
+from v_chess.replay import ReplayStats, replay_games
+
+
+PGN = """[Variant "Standard"]
+
+1. f3 e5 2. g4 Qh4# 0-1
+
+[Variant "King of the Hill"]
+
+1. e4 e5 2. Ke2 d5 3. Ke3 dxe4 4. Kxe4 1-0
+
+[Event "Broken"]
+
+1. e4 e5 2. Ke3 *
+"""
+
+
+def test_replay_games_reports_results_in_order():
+    results = list(replay_games(read_games(io.StringIO(PGN))))
+    assert [r.index for r in results] == [0, 1, 2]
+    assert [(r.variant, r.plies, r.result, r.ok) for r in results] == [
+        ("standard", 4, "0-1", True), ("kingofthehill", 7, "1-0", True), ("standard", 2, "*", False)
+    ]
+    assert results[2].san == "Ke3" and "ambiguous or illegal" in results[2].error
+
+def test_replay_is_deterministic_across_workers():
+    serial = list(replay_games(read_games(io.StringIO(PGN))))
+    parallel = list(replay_games(read_games(io.StringIO(PGN)), workers=2, chunksize=1))
+    assert parallel == serial
+
+def test_replay_stats():
+    stats = ReplayStats()
+    for result in replay_games(read_games(io.StringIO(PGN))):
+        stats.add(result)
+    assert (stats.games, stats.plies, stats.failures) == (3, 13, 1)
+
+def test_replay_command_json(tmp_path, capsys):
+    path = tmp_path / "games.pgn"
+    path.write_text(PGN)
+    args = build_parser().parse_args(["replay", str(path), "--workers", "1", "--json"])
+    assert args.handler(args) == 1
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [r["error"] is None for r in records] == [True, True, False]
+    assert "seconds" not in records[0]
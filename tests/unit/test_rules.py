@@ -1,7 +1,9 @@
 from v_chess.rules import StandardRules
 from v_chess.game_state import GameState
 from v_chess.move import Move
-from v_chess.enums import CastlingRight
+from v_chess.castling import rights_after_move
+from v_chess.enums import CastlingRight, Color
+from v_chess.piece import Bishop, Rook
 from v_chess.square import Square
 
 def test_castling_rights_king_move_revokes_all():
@@ -40,6 +42,24 @@ def test_castling_rights_captured_rook_revokes_side():
     assert CastlingRight.WHITE_LONG not in next_state.castling_rights
     assert CastlingRight.WHITE_SHORT in next_state.castling_rights
 
+def test_castling_rights_file_letter_rook_move_revokes_side():
+    fen = "1r2k1r1/8/8/8/8/8/8/1R2K1R1 w GBgb - 0 1"
+    state = GameState.from_fen(fen)
+    rules = StandardRules()
+
+    next_state = rules.apply_move(state, Move("g1g2"))
+
+    assert next_state.castling_rights == (CastlingRight.WB, CastlingRight.BB, CastlingRight.BG)
+
+def test_rights_after_move_ignores_non_rook_on_rook_square():
+    rights = (CastlingRight.WHITE_SHORT, CastlingRight.BLACK_SHORT)
+    pieces = GameState.from_fen("4k2r/8/8/8/8/8/8/4K2R w Kk - 0 1").board.bitboard.pieces
+
+    assert rights_after_move(rights, pieces, Bishop(Color.BLACK), None, Square("h8").index, Square("c3").index) == rights
+    assert rights_after_move(rights, pieces, Rook(Color.BLACK), None, Square("h8").index, Square("h5").index) == (
+        CastlingRight.WHITE_SHORT,
+    )
+
 def test_en_passant_square_set_on_double_push():
     fen = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
     state = GameState.from_fen(fen)
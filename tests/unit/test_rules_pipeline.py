@@ -0,0 +1,38 @@
+import pytest
+from v_chess.game_state import GameState
+from v_chess.move import Move
+from v_chess.move_validators import validate_king_safety, validate_mandatory_capture
+from v_chess.rules import (
+    StandardRules, AntichessRules, Chess960Rules, HordeRules, CrazyhouseRules
+)
+
+
+def test_pipeline_is_compiled_once():
+    rules = StandardRules()
+    assert rules.pipeline is rules.pipeline
+    assert rules.pipeline.move_validators == tuple(rules.move_validators)
+    assert validate_king_safety in rules.pipeline.move_validators
+    assert validate_king_safety not in rules.pipeline.pseudo_legality_validators
+
+def test_pipeline_splits_global_move_rules():
+    pipeline = CrazyhouseRules().pipeline
+    assert all(getattr(r, "is_global", False) for r in pipeline.global_move_rules)
+    assert pipeline.global_move_rules
+    assert not any(getattr(r, "is_global", False) for r in pipeline.piece_move_rules)
+    assert validate_mandatory_capture in AntichessRules().pipeline.move_validators
+    assert validate_mandatory_capture not in AntichessRules().pipeline.pseudo_legality_validators
+
+@pytest.mark.parametrize("rules, flag", [
+    (Chess960Rules(), "allows_king_rook_castling"),
+    (AntichessRules(), "king_promotion_allowed"),
+    (HordeRules(), "horde_first_rank_double_push"),
+])
+def test_capability_flags(rules, flag):
+    assert getattr(rules, flag)
+    assert not getattr(StandardRules(), flag)
+
+def test_king_promotion_follows_flag():
+    state = GameState.from_fen("8/P7/8/8/8/8/8/k6K w - - 0 1")
+    move = Move("a7a8k")
+    assert StandardRules().validate_move(state, move) == StandardRules.MoveLegalityReason.KING_PROMOTION
+    assert AntichessRules().validate_move(state, move) == AntichessRules.MoveLegalityReason.LEGAL
@@ -0,0 +1,56 @@
+import pytest
+from v_chess.game import Game
+from v_chess.game_state import GameState
+from v_chess.move import Move
+from v_chess.rules import StandardRules, CrazyhouseRules, Chess960Rules
+from v_chess.san import move_to_san, uci_to_san, san_to_uci
+
+
+def test_uci_to_san_matches_game_history():
+    ucis = ["e2e4", "e7e5", "g1f3", "b8c6", "f1c4", "g8f6", "f3g5", "d7d5", "e4d5", "f6d5", "g5f7", "e8f7", "d1f3"]
+    game = Game(rules=StandardRules())
+    for uci in ucis:
+        game.take_turn(Move(uci, player_to_move=game.state.turn))
+    sans = uci_to_san(StandardRules(), GameState.starting_setup(), ucis)
+    assert sans == game.move_history
+    assert sans[-3:] == ["Nxf7", "Kxf7", "Qf3+"]
+    assert san_to_uci(StandardRules(), GameState.starting_setup(), sans) == ucis
+
+def test_round_trip_with_drops_and_mate():
+    rules = CrazyhouseRules()
+    state = GameState.from_fen("7k/R5pp/8/8/8/8/8/7K[Q] w - - 0 1")
+    ucis = ["Q@b8"]
+    assert uci_to_san(rules, state, ucis) == ["Q@b8#"]
+    assert san_to_uci(rules, state, ["Q@b8#"]) == ucis
+
+@pytest.mark.parametrize("fen, uci, san", [
+    ("4k3/8/8/4p3/3P1P2/8/8/4K3 w - - 0 1", "d4e5", "dxe5"),
+    ("4k3/P7/8/8/8/8/8/4K3 w - - 0 1", "a7a8q", "a8=Q"),
+    ("4k3/8/8/8/8/8/8/R3K2R w KQ - 0 1", "e1c1", "O-O-O"),
+    ("4k3/8/8/8/8/8/8/R3K2R w KQ - 0 1", "a1d1", "Rd1"),
+    ("4k3/8/8/8/8/8/8/R3KR2 w Q - 0 1", "a1b1", "Rb1"),
+    ("4k3/8/8/8/R7/8/8/R3K3 w - - 0 1", "a1a2", "R1a2"),
+])
+def test_move_to_san_uses_legal_moves(fen, uci, san):
+    state = GameState.from_fen(fen)
+    legal_moves = StandardRules().legal_moves(state)
+    move = next(m for m in legal_moves if m.uci.lower() == uci)
+    assert move_to_san(state, move, legal_moves) == san
+
+def test_chess960_castling_round_trip():
+    # The king already stands on c1, so O-O-O only moves the rook.
+    rules = Chess960Rules()
+    state = GameState.from_fen("1k6/8/8/8/8/8/8/R1K4R w HA - 0 1")
+    assert uci_to_san(rules, state, ["c1a1"]) == ["O-O-O"]
+    assert san_to_uci(rules, state, ["O-O-O"]) == ["c1a1"]
+    assert san_to_uci(rules, state, ["0-0-0"]) == ["c1a1"]
+
+def test_castling_accepts_zeros():
+    state = GameState.from_fen("4k3/8/8/8/8/8/8/R3K2R w KQ - 0 1")
+    assert san_to_uci(StandardRules(), state, ["0-0"]) == ["e1g1"]
+
+def test_illegal_moves_raise():
+    with pytest.raises(ValueError, match="Illegal move"):
+        uci_to_san(StandardRules(), GameState.starting_setup(), ["e2e5"])
+    with pytest.raises(ValueError, match="ambiguous or illegal"):
+        san_to_uci(StandardRules(), GameState.starting_setup(), ["e4", "Ke7", "Ke3"])
@@ -1,7 +1,11 @@
+import pytest
+from v_chess.board import Board
 from v_chess.game_state import GameState, ThreeCheckGameState, CrazyhouseGameState
-from v_chess.fen_helpers import state_from_fen, state_to_fen
-from v_chess.piece import Queen, Pawn
+from v_chess.fen_helpers import state_from_fen, state_to_fen, bitboard_from_fen, board_from_fen
+from v_chess.piece import Queen, Pawn, POCKET_INDEX
 from v_chess.enums import Color
+from v_chess.square import Square
+from v_chess.zobrist import compute_key
 
 def test_three_check_fen_parsing():
     fen = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1 +2+1"
@@ -23,14 +27,12 @@ def test_crazyhouse_fen_parsing():
     
     white_pocket = state.pockets[0]
     black_pocket = state.pockets[1]
-    
-    assert len(white_pocket) == 1
-    assert isinstance(white_pocket[0], Queen)
-    assert white_pocket[0].color == Color.WHITE
-    
-    assert len(black_pocket) == 1
-    assert isinstance(black_pocket[0], Pawn)
-    assert black_pocket[0].color == Color.BLACK
+
+    assert sum(white_pocket) == 1
+    assert white_pocket[POCKET_INDEX[Queen]] == 1
+
+    assert sum(black_pocket) == 1
+    assert black_pocket[POCKET_INDEX[Pawn]] == 1
     
     # Verify round-trip serialization
     new_fen = state_to_fen(state)
@@ -46,3 +48,25 @@ def test_standard_fen_parsing():
     
     new_fen = state_to_fen(state)
     assert new_fen == fen
+
+def test_fen_placement_round_trip():
+    placement = "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R"
+    board = Board(placement)
+    assert board.fen == placement
+    assert board_from_fen(placement) == dict(board.items())
+    assert board.bitboard.occupied == bitboard_from_fen(placement).occupied
+
+@pytest.mark.parametrize("placement", ["rnbqkbnr/ppxppppp/8/8/8/8/PPPPPPPP/RNBQKBNR", "8/8/8/8/8/8/8/8/K7"])
+def test_invalid_fen_placement_raises(placement):
+    with pytest.raises(ValueError):
+        bitboard_from_fen(placement)
+
+def test_cached_fen_states_do_not_share_boards():
+    fen = "bqnb1rkr/pp3ppp/3ppn2/2p5/5P2/P2P4/NPP1P1PP/BQ1BNRKR w HFhf - 2 9"
+    first = state_from_fen(fen)
+    first.board.remove_piece(Square("a1"))
+    second = state_from_fen(fen)
+    assert second.board is not first.board
+    assert second.board.get_piece(Square("a1")) is not None
+    assert second.fen == fen
+    assert second.zobrist_key == compute_key(second)
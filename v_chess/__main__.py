@@ -1,6 +1,17 @@
+import argparse
+import json
+import os
+import sys
+import time
+from dataclasses import asdict
+from itertools import islice
+
 from v_chess.game import Game, IllegalMoveException
 from v_chess.move import Move
 from v_chess.enums import MoveLegalityReason
+from v_chess.perft import VARIANTS, REFERENCE_POSITIONS, run_perft
+from v_chess.pgn import read_games
+from v_chess.replay import ReplayStats, replay_games
 
 
 def main():
@@ -30,5 +41,150 @@ def main():
             continue
 
 
+def perft_command(args: argparse.Namespace) -> int:
+    """Runs perft on a single position or on the reference suite.
+
+    Args:
+        args: Parsed command line arguments.
+
+    Returns:
+        The process exit code; non-zero if a reference count did not match.
+    """
+    if args.suite:
+        return _perft_suite(args)
+
+    variant = args.variant or "standard"
+    rules = VARIANTS[variant]()
+    fen = args.fen or REFERENCE_POSITIONS[variant][0].fen
+    result = run_perft(rules, fen, args.depth or 1, use_table=args.tt, split=args.divide)
+
+    if result.divide is not None:
+        for uci, nodes in sorted(result.divide.items()):
+            print(f"{uci}: {nodes}")
+        print()
+    print(f"Nodes: {result.nodes}")
+    print(f"Time: {result.seconds:.3f}s")
+    print(f"Nodes/sec: {result.nodes_per_second:,.0f}")
+    return 0
+
+
+def _perft_suite(args: argparse.Namespace) -> int:
+    """Checks every reference position of the selected variants."""
+    variants = [args.variant] if args.variant else list(REFERENCE_POSITIONS)
+    failures = 0
+    total_nodes = 0
+    total_seconds = 0.0
+
+    for variant in variants:
+        rules = VARIANTS[variant]()
+        for position in REFERENCE_POSITIONS[variant]:
+            for depth, expected in enumerate(position.counts, start=1):
+                if args.depth and depth > args.depth:
+                    break
+                result = run_perft(rules, position.fen, depth, use_table=args.tt)
+                total_nodes += result.nodes
+                total_seconds += result.seconds
+                status = "ok" if result.nodes == expected else f"FAIL (expected {expected})"
+                if result.nodes != expected:
+                    failures += 1
+                print(
+                    f"{variant:<14} {position.name:<12} depth {depth} "
+                    f"nodes {result.nodes:>9} {result.nodes_per_second:>10,.0f} n/s  {status}"
+                )
+
+    speed = total_nodes / total_seconds if total_seconds > 0 else 0.0
+    print(f"Total: {total_nodes} nodes in {total_seconds:.3f}s ({speed:,.0f} n/s), {failures} failed")
+    return 1 if failures else 0
+
+
+def replay_command(args: argparse.Namespace) -> int:
+    """Replays the games of a PGN file and reports speed per variant.
+
+    Per-game lines go to stdout as they complete, in input order; the
+    summary follows them, or goes to stderr with --json.
+
+    Args:
+        args: Parsed command line arguments.
+
+    Returns:
+        The process exit code; non-zero if any game failed to replay.
+    """
+    stats: dict[str, ReplayStats] = {}
+    summary = sys.stderr if args.json else sys.stdout
+    start = time.perf_counter()
+
+    with open(args.pgn) as handle:
+        games = read_games(handle)
+        if args.variant:
+            games = (g for g in games if g.variant == args.variant)
+        if args.limit:
+            games = islice(games, args.limit)
+
+        for result in replay_games(games, workers=args.workers, chunksize=args.chunksize):
+            stats.setdefault(result.variant, ReplayStats()).add(result)
+            if args.json:
+                record = asdict(result)
+                del record["seconds"]
+                print(json.dumps(record), flush=True)
+            elif not result.ok:
+                print(f"FAIL game {result.index} ({result.variant}) at ply {result.plies} {result.san}: {result.error}")
+            elif args.all:
+                print(f"ok   game {result.index} ({result.variant}) {result.plies} plies {result.result}")
+
+    wall = time.perf_counter() - start
+    total = ReplayStats()
+    for variant in sorted(stats):
+        s = stats[variant]
+        total.games += s.games
+        total.plies += s.plies
+        total.failures += s.failures
+        print(
+            f"{variant:<14} games {s.games:>6} plies {s.plies:>8} failed {s.failures:>5} "
+            f"{s.games_per_second:>9,.1f} games/s {s.plies_per_second:>10,.0f} plies/s",
+            file=summary
+        )
+    games_per_second = total.games / wall if wall > 0 else 0.0
+    plies_per_second = total.plies / wall if wall > 0 else 0.0
+    print(
+        f"Total: {total.games} games, {total.plies} plies, {total.failures} failed in {wall:.3f}s "
+        f"({games_per_second:,.1f} games/s, {plies_per_second:,.0f} plies/s, {args.workers} workers)",
+        file=summary
+    )
+    return 1 if total.failures else 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Builds the command line parser."""
+    parser = argparse.ArgumentParser(prog="python -m v_chess")
+    subparsers = parser.add_subparsers(dest="command")
+
+    subparsers.add_parser("play", help="Play a standard game in the terminal (default).")
+
+    perft_parser = subparsers.add_parser("perft", help="Count move tree nodes and measure generator speed.")
+    perft_parser.add_argument("--variant", choices=sorted(VARIANTS), help="Variant rules to use (default: standard).")
+    perft_parser.add_argument("--fen", help="Root position (default: the variant's first reference position).")
+    perft_parser.add_argument("--depth", type=int, help="Search depth; caps the reference depths with --suite.")
+    perft_parser.add_argument("--divide", action="store_true", help="Print node counts per root move.")
+    perft_parser.add_argument("--tt", action="store_true", help="Use a transposition table.")
+    perft_parser.add_argument("--suite", action="store_true", help="Verify the reference positions.")
+    perft_parser.set_defaults(handler=perft_command)
+
+    replay_parser = subparsers.add_parser("replay", help="Replay and validate the games of a PGN file.")
+    replay_parser.add_argument("pgn", help="Path to the PGN file.")
+    replay_parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes (default: CPU count).")
+    replay_parser.add_argument("--chunksize", type=int, default=8, help="Games sent to a worker at a time.")
+    replay_parser.add_argument("--variant", choices=sorted(VARIANTS), help="Only replay games of this variant.")
+    replay_parser.add_argument("--limit", type=int, help="Replay at most this many games.")
+    replay_parser.add_argument("--all", action="store_true", help="Print a line for every game, not only failures.")
+    replay_parser.add_argument("--json", action="store_true", help="Print every game as a JSON line; summary to stderr.")
+    replay_parser.set_defaults(handler=replay_command)
+
+    return parser
+
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    args = build_parser().parse_args()
+    if getattr(args, "handler", None) is None:
+        main()
+    else:
+        sys.exit(args.handler(args))
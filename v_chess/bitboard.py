@@ -3,7 +3,7 @@ from typing import TYPE_CHECKING
 import math
 
 from v_chess.enums import Color, Direction
-from v_chess.piece import Pawn, Knight, Bishop, Rook, Queen, King, Piece
+from v_chess.piece import Pawn, Knight, Bishop, Rook, Queen, King, Piece, piece_of
 from v_chess.move import Move
 from v_chess.square import Square
 
@@ -12,10 +12,20 @@ if TYPE_CHECKING:
 
 
 class AttackTables:
-    """Singleton provider for precomputed attack masks."""
+    """Singleton provider for precomputed attack masks.
+
+    Sliding attacks are stored per square in tables indexed by the relevant
+    occupancy (the blockers on the piece's rays, excluding the board edge),
+    so a rook, bishop or queen attack query is a mask, an AND and a lookup.
+    """
 
     _KNIGHT_ATTACKS = [0] * 64
     _KING_ATTACKS = [0] * 64
+    _PAWN_ATTACKS = {Color.WHITE: [0] * 64, Color.BLACK: [0] * 64}
+    _ROOK_MASKS = [0] * 64
+    _BISHOP_MASKS = [0] * 64
+    _ROOK_ATTACKS: list[dict[int, int]] = [{} for _ in range(64)]
+    _BISHOP_ATTACKS: list[dict[int, int]] = [{} for _ in range(64)]
     _INITIALIZED = False
 
     @classmethod
@@ -47,20 +57,175 @@ class AttackTables:
                     mask |= (1 << (nr * 8 + nc))
             cls._KING_ATTACKS[sq] = mask
 
+            for color, nr in ((Color.WHITE, r - 1), (Color.BLACK, r + 1)):
+                mask = 0
+                for nc in (c - 1, c + 1):
+                    if 0 <= nr < 8 and 0 <= nc < 8:
+                        mask |= (1 << (nr * 8 + nc))
+                cls._PAWN_ATTACKS[color][sq] = mask
+
+            cls._ROOK_MASKS[sq], cls._ROOK_ATTACKS[sq] = cls._slider_table(sq, Direction.straight())
+            cls._BISHOP_MASKS[sq], cls._BISHOP_ATTACKS[sq] = cls._slider_table(sq, Direction.diagonal())
+
         cls._INITIALIZED = True
 
+    @staticmethod
+    def _ray_subsets(sq_idx: int, direction: Direction) -> list[tuple[int, int]]:
+        """Returns (blockers, attacks) pairs for every blocker subset of one ray.
+
+        The last square of the ray is never a relevant blocker, since it is
+        attacked regardless of whether it is occupied.
+        """
+        d_col, d_row = direction.value
+        r, c = divmod(sq_idx, 8)
+        ray = []
+        r, c = r + d_row, c + d_col
+        while 0 <= r < 8 and 0 <= c < 8:
+            ray.append(1 << (r * 8 + c))
+            r, c = r + d_row, c + d_col
+
+        relevant = ray[:-1]
+        subsets = []
+        for n in range(1 << len(relevant)):
+            blockers = 0
+            for i, bit in enumerate(relevant):
+                if n >> i & 1:
+                    blockers |= bit
+            attacks = 0
+            for bit in ray:
+                attacks |= bit
+                if blockers & bit:
+                    break
+            subsets.append((blockers, attacks))
+        return subsets
+
+    @classmethod
+    def _slider_table(cls, sq_idx: int, directions: set[Direction]) -> tuple[int, dict[int, int]]:
+        """Builds the relevant-occupancy mask and attack table for one square."""
+        r1, r2, r3, r4 = [cls._ray_subsets(sq_idx, d) for d in directions]
+        table = {
+            o1 | o2 | o3 | o4: a1 | a2 | a3 | a4
+            for o1, a1 in r1 for o2, a2 in r2 for o3, a3 in r3 for o4, a4 in r4
+        }
+        mask = 0
+        for blockers in table:
+            mask |= blockers
+        return mask, table
+
     @classmethod
     def knight_attacks(cls, sq_idx: int) -> int:
-        if not cls._INITIALIZED:
-            cls._initialize()
         return cls._KNIGHT_ATTACKS[sq_idx]
 
     @classmethod
     def king_attacks(cls, sq_idx: int) -> int:
-        if not cls._INITIALIZED:
-            cls._initialize()
         return cls._KING_ATTACKS[sq_idx]
 
+    @classmethod
+    def pawn_attacks(cls, color: Color, sq_idx: int) -> int:
+        """Returns the squares a pawn of the given color on sq_idx attacks."""
+        return cls._PAWN_ATTACKS[color][sq_idx]
+
+    @classmethod
+    def rook_attacks(cls, sq_idx: int, occupied: int) -> int:
+        """Returns the squares a rook on sq_idx attacks given the occupancy."""
+        return cls._ROOK_ATTACKS[sq_idx][occupied & cls._ROOK_MASKS[sq_idx]]
+
+    @classmethod
+    def bishop_attacks(cls, sq_idx: int, occupied: int) -> int:
+        """Returns the squares a bishop on sq_idx attacks given the occupancy."""
+        return cls._BISHOP_ATTACKS[sq_idx][occupied & cls._BISHOP_MASKS[sq_idx]]
+
+    @classmethod
+    def queen_attacks(cls, sq_idx: int, occupied: int) -> int:
+        """Returns the squares a queen on sq_idx attacks given the occupancy."""
+        return (
+            cls._ROOK_ATTACKS[sq_idx][occupied & cls._ROOK_MASKS[sq_idx]] |
+            cls._BISHOP_ATTACKS[sq_idx][occupied & cls._BISHOP_MASKS[sq_idx]]
+        )
+
+
+AttackTables._initialize()
+
+
+def _build_geometry() -> tuple[list[list[int]], list[list[int]]]:
+    """Builds the between and line tables for every pair of square indices."""
+    between = [[0] * 64 for _ in range(64)]
+    line = [[0] * 64 for _ in range(64)]
+    for a in range(64):
+        bit_a = 1 << a
+        for b in range(64):
+            bit_b = 1 << b
+            for attacks in (AttackTables.rook_attacks, AttackTables.bishop_attacks):
+                if a != b and attacks(a, 0) & bit_b:
+                    between[a][b] = attacks(a, bit_b) & attacks(b, bit_a)
+                    line[a][b] = attacks(a, 0) & attacks(b, 0) | bit_a | bit_b
+    return between, line
+
+
+def _build_pseudo_moves() -> dict[Color, dict[type[Piece], list[int]]]:
+    """Builds the empty-board destination masks of every piece type and color."""
+    tables = {}
+    for color in Color:
+        push = -8 if color == Color.WHITE else 8
+        tables[color] = {
+            Pawn: [
+                AttackTables.pawn_attacks(color, sq) | (1 << sq + push if 0 <= sq + push < 64 else 0)
+                for sq in range(64)
+            ],
+            Knight: [AttackTables.knight_attacks(sq) for sq in range(64)],
+            Bishop: [AttackTables.bishop_attacks(sq, 0) for sq in range(64)],
+            Rook: [AttackTables.rook_attacks(sq, 0) for sq in range(64)],
+            Queen: [AttackTables.queen_attacks(sq, 0) for sq in range(64)],
+            King: [AttackTables.king_attacks(sq) for sq in range(64)],
+        }
+    return tables
+
+
+# BETWEEN[a][b] holds the squares strictly between two aligned squares and
+# LINE[a][b] the whole rank, file or diagonal through them; both are 0 for
+# squares that share no line.
+BETWEEN, LINE = _build_geometry()
+
+# PSEUDO_MOVES[color][piece type][sq] holds the squares the piece reaches on
+# an empty board, as Piece.theoretical_moves lists them: for pawns the single
+# push and both captures.
+PSEUDO_MOVES = _build_pseudo_moves()
+
+# Square indices start at a8, so the 8th rank is the lowest byte and the a
+# file the lowest bit of each byte.
+FILE_A = 0x0101010101010101
+FILE_H = FILE_A << 7
+RANK_8 = 0xFF
+RANK_7 = RANK_8 << 8
+RANK_2 = RANK_8 << 48
+RANK_1 = RANK_8 << 56
+# d5, e5, d4 and e4.
+CENTER = 0x1818000000
+ALL_SQUARES = (1 << 64) - 1
+
+
+def pawn_attack_mask(pawns: int, color: Color) -> int:
+    """Returns every square attacked by a set of pawns."""
+    if color == Color.WHITE:
+        return (pawns >> 9 & ~FILE_H) | (pawns >> 7 & ~FILE_A)
+    return (pawns << 7 & ~FILE_H | pawns << 9 & ~FILE_A) & ALL_SQUARES
+
+
+def attack_mask(pieces: dict[type[Piece], int], color: Color, occ: int) -> int:
+    """Returns every square attacked by the given pieces under an occupancy."""
+    attacks = pawn_attack_mask(pieces[Pawn], color)
+    for p_type, table in ((Knight, AttackTables.knight_attacks), (King, AttackTables.king_attacks)):
+        mask = pieces[p_type]
+        while mask:
+            attacks |= table((mask & -mask).bit_length() - 1)
+            mask &= mask - 1
+    for p_type, table in ((Bishop, AttackTables.bishop_attacks), (Rook, AttackTables.rook_attacks)):
+        mask = pieces[p_type] | pieces[Queen]
+        while mask:
+            attacks |= table((mask & -mask).bit_length() - 1, occ)
+            mask &= mask - 1
+    return attacks
+
 
 class Bitboard:
     """Manages the bitwise state of the chess board.
@@ -69,6 +234,7 @@ class Bitboard:
         pieces: Nested dictionary mapping Color -> PieceType -> Bitmask.
         occupied_co: Dictionary mapping Color -> Bitmask of all their pieces.
         occupied: Bitmask of all pieces on the board.
+        mailbox: The interned piece on each square index, or None.
     """
 
     def __init__(self):
@@ -79,6 +245,8 @@ class Bitboard:
         }
         self.occupied_co = {Color.WHITE: 0, Color.BLACK: 0}
         self.occupied = 0
+        self.mailbox: list[Piece | None] = [None] * 64
+        self._attacks: dict[Color, int] = {}
 
     def copy(self) -> Bitboard:
         """Creates a deep copy of the Bitboard."""
@@ -88,10 +256,16 @@ class Bitboard:
                 new_bb.pieces[color][p_type] = mask
         new_bb.occupied_co = self.occupied_co.copy()
         new_bb.occupied = self.occupied
+        new_bb.mailbox = self.mailbox.copy()
+        new_bb._attacks = self._attacks.copy()
         return new_bb
 
     def update_occupancy(self):
-        """Recalculates occupancy bitmasks based on piece positions."""
+        """Recalculates occupancy bitmasks based on piece positions.
+
+        set_piece and remove_piece keep occupancy up to date themselves; this
+        is only needed after editing the piece masks directly.
+        """
         self.occupied_co[Color.WHITE] = (
             self.pieces[Color.WHITE][Pawn] | self.pieces[Color.WHITE][Knight] |
             self.pieces[Color.WHITE][Bishop] | self.pieces[Color.WHITE][Rook] |
@@ -103,16 +277,41 @@ class Bitboard:
             self.pieces[Color.BLACK][Queen] | self.pieces[Color.BLACK][King]
         )
         self.occupied = self.occupied_co[Color.WHITE] | self.occupied_co[Color.BLACK]
+        self._attacks.clear()
 
     def set_piece(self, square_idx: int, piece: Piece):
-        """Sets a piece at the given square index."""
-        self.pieces[piece.color][type(piece)] |= (1 << square_idx)
-        self.update_occupancy()
+        """Sets a piece at the given square index, replacing any piece there."""
+        bit = 1 << square_idx
+        old = self.mailbox[square_idx]
+        if old is not None:
+            self.pieces[old.color][type(old)] ^= bit
+            self.occupied_co[old.color] ^= bit
+            self.occupied ^= bit
+        self.pieces[piece.color][type(piece)] ^= bit
+        self.occupied_co[piece.color] ^= bit
+        self.occupied ^= bit
+        self.mailbox[square_idx] = piece
+        self._attacks.clear()
 
     def remove_piece(self, square_idx: int, piece: Piece):
-        """Removes a piece from the given square index."""
-        self.pieces[piece.color][type(piece)] &= ~(1 << square_idx)
-        self.update_occupancy()
+        """Removes a piece from the given square index, if it is there."""
+        if self.mailbox[square_idx] != piece:
+            return
+        bit = 1 << square_idx
+        self.pieces[piece.color][type(piece)] ^= bit
+        self.occupied_co[piece.color] ^= bit
+        self.occupied ^= bit
+        self.mailbox[square_idx] = None
+        self._attacks.clear()
+
+    def toggle_piece(self, square_idx: int, p_type: type[Piece], color: Color):
+        """Flips one piece bit, adding or removing that piece on the square."""
+        bit = 1 << square_idx
+        self.pieces[color][p_type] ^= bit
+        self.occupied_co[color] ^= bit
+        self.occupied ^= bit
+        self.mailbox[square_idx] = piece_of(p_type, color) if self.pieces[color][p_type] & bit else None
+        self._attacks.clear()
 
     def get_piece_mask(self, piece_type: type, color: Color) -> int:
         """Returns the bitmask for a specific piece type and color."""
@@ -122,21 +321,10 @@ class Bitboard:
         """Returns the piece type and color at the given square index."""
         if square_index < 0:
             return None, None
-
-        mask = 1 << square_index
-        if not (self.occupied & mask):
+        piece = self.mailbox[square_index]
+        if piece is None:
             return None, None
-
-        if self.occupied_co[Color.WHITE] & mask:
-            for p_type, p_mask in self.pieces[Color.WHITE].items():
-                if p_mask & mask:
-                    return p_type, Color.WHITE
-        else:
-            for p_type, p_mask in self.pieces[Color.BLACK].items():
-                if p_mask & mask:
-                    return p_type, Color.BLACK
-
-        return None, None
+        return type(piece), piece.color
 
     def is_attacked(self, square_idx: int, by_color: Color, occupancy_override: int | None = None) -> bool:
         """Checks if a square is attacked by pieces of a specific color."""
@@ -149,11 +337,11 @@ class Bitboard:
             return True
 
         ortho_attackers = self.pieces[by_color][Rook] | self.pieces[by_color][Queen]
-        if ortho_attackers and self._check_slider(square_idx, ortho_attackers, Direction.straight(), occ):
+        if ortho_attackers and AttackTables.rook_attacks(square_idx, occ) & ortho_attackers:
             return True
 
         diag_attackers = self.pieces[by_color][Bishop] | self.pieces[by_color][Queen]
-        if diag_attackers and self._check_slider(square_idx, diag_attackers, Direction.diagonal(), occ):
+        if diag_attackers and AttackTables.bishop_attacks(square_idx, occ) & diag_attackers:
             return True
 
         r, c = divmod(square_idx, 8)
@@ -174,6 +362,38 @@ class Bitboard:
 
         return False
 
+    def attacks_by(self, color: Color, occupancy: int | None = None) -> int:
+        """Returns every square attacked by pieces of a color.
+
+        The mask for the current occupancy is cached until the board changes;
+        an explicit occupancy is computed afresh.
+
+        Args:
+            color: The attacking side.
+            occupancy: Blockers for sliding pieces, if not the current ones.
+
+        Returns:
+            The bitmask of attacked squares.
+        """
+        if occupancy is not None:
+            return attack_mask(self.pieces[color], color, occupancy)
+        attacks = self._attacks.get(color)
+        if attacks is None:
+            attacks = self._attacks[color] = attack_mask(self.pieces[color], color, self.occupied)
+        return attacks
+
+    def attackers(self, square_idx: int, by_color: Color, occupancy_override: int | None = None) -> int:
+        """Returns the mask of pieces of a color that attack a square."""
+        occ = occupancy_override if occupancy_override is not None else self.occupied
+        pieces = self.pieces[by_color]
+        return (
+            AttackTables.knight_attacks(square_idx) & pieces[Knight]
+            | AttackTables.king_attacks(square_idx) & pieces[King]
+            | AttackTables.pawn_attacks(by_color.opposite, square_idx) & pieces[Pawn]
+            | AttackTables.rook_attacks(square_idx, occ) & (pieces[Rook] | pieces[Queen])
+            | AttackTables.bishop_attacks(square_idx, occ) & (pieces[Bishop] | pieces[Queen])
+        )
+
     def is_king_attacked_after_move(self, move: Move, color: Color, board: "Board", ep_square: Square | None = None) -> bool:
         """Checks if the king is under attack after a hypothetical move."""
         start_idx = move.start.index
@@ -224,33 +444,3 @@ class Bitboard:
         self.update_occupancy()
 
         return is_attacked
-
-    def _check_slider(self, square_idx: int, attackers: int, directions: set[Direction], occupied: int) -> bool:
-        """Helper to check sliding piece attacks."""
-        for d in directions:
-            ray = d.get_ray_mask(square_idx)
-            if not (ray & attackers):
-                continue
-
-            blockers = ray & occupied
-            if not blockers:
-                # Ray has an attacker and no blockers, so the square IS attacked.
-                return True
-
-            # Need to find the blocker closest to square_idx
-            d_col, d_row = d.value
-            idx_delta = d_row * 8 + d_col
-            
-            if idx_delta > 0:
-                # Squares in this direction have higher indices
-                first_blocker_mask = blockers & -blockers
-            else:
-                # Squares in this direction have lower indices
-                first_blocker_mask = 1 << (blockers.bit_length() - 1)
-
-            if first_blocker_mask & attackers:
-                return True
-
-        return False
-
-
@@ -1,9 +1,9 @@
 from __future__ import annotations
 from typing import TypeVar, Generator
 
-from v_chess.fen_helpers import board_from_fen, get_fen_from_board
+from v_chess.fen_helpers import bitboard_from_fen, get_fen_from_board
 from v_chess.enums import Color
-from v_chess.piece.piece import Piece
+from v_chess.piece.piece import Piece, piece_of
 from v_chess.square import Coordinate, Square
 from v_chess.bitboard import Bitboard
 
@@ -28,10 +28,7 @@ class Board:
         if isinstance(setup, Bitboard):
             self.bitboard = setup.copy()
         elif isinstance(setup, str):
-            self.bitboard = Bitboard()
-            initial_pieces = board_from_fen(setup)
-            for sq, piece in initial_pieces.items():
-                self.bitboard.set_piece(sq.index, piece)
+            self.bitboard = bitboard_from_fen(setup)
         else:
             raise TypeError(f"setup must be Bitboard or str, not {type(setup)}")
 
@@ -47,10 +44,8 @@ class Board:
         if not isinstance(coordinate, Square):
             coordinate = Square(coordinate)
 
-        p_type, color = self.bitboard.piece_at(coordinate.index)
-        if p_type and color:
-            return p_type(color)
-        return None
+        idx = coordinate.index
+        return self.bitboard.mailbox[idx] if idx >= 0 else None
 
     def set_piece(self, piece: Piece, square: str | tuple | Square):
         """Sets a piece at a specific square.
@@ -62,10 +57,6 @@ class Board:
         if not isinstance(square, Square):
             square = Square(square)
 
-        old_piece = self.get_piece(square)
-        if old_piece:
-             self.bitboard.remove_piece(square.index, old_piece)
-
         self.bitboard.set_piece(square.index, piece)
 
     def remove_piece(self, coordinate: Coordinate) -> Piece | None:
@@ -117,7 +108,7 @@ class Board:
                 mask = self.bitboard.pieces[c][p_cls]
                 while mask:
                     mask &= mask - 1
-                    pieces.append(p_cls(c))
+                    pieces.append(piece_of(p_cls, c))
 
         return pieces
 
@@ -126,10 +117,9 @@ class Board:
         occupied = self.bitboard.occupied
         while occupied:
             idx = (occupied & -occupied).bit_length() - 1
-            sq = Square(divmod(idx, 8))
-            p_type, color = self.bitboard.piece_at(idx)
-            if p_type and color:
-                yield sq, p_type(color)
+            piece = self.bitboard.mailbox[idx]
+            if piece is not None:
+                yield Square(divmod(idx, 8)), piece
             occupied &= occupied - 1
 
     def values(self) -> Generator[Piece, None, None]:
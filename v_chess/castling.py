@@ -0,0 +1,171 @@
+from functools import lru_cache
+
+from v_chess.bitboard import RANK_1, RANK_8
+from v_chess.enums import CastlingRight, Color
+from v_chess.piece import King, Piece, Rook
+
+# Every castling right owns one bit, in the order CastlingRight defines them;
+# NONE owns none. Position carries its rights as such a mask, while GameState
+# keeps the sorted tuples its callers build and compare.
+RIGHT_BITS: dict[CastlingRight, int] = {
+    right: 0 if right == CastlingRight.NONE else 1 << idx for idx, right in enumerate(CastlingRight)
+}
+_RIGHTS_BY_VALUE = sorted((r for r in CastlingRight if r != CastlingRight.NONE), key=lambda r: r.value)
+
+# COLOR_MASKS[color] holds the rights a king move of that color gives up,
+# HOME_RANKS[color] the rank its king and rooks castle on, and TOUCH_MASKS[sq]
+# the rights lost once a rook leaves or is captured on sq.
+COLOR_MASKS: dict[Color, int] = {
+    color: sum(RIGHT_BITS[r] for r in _RIGHTS_BY_VALUE if r.color == color) for color in Color
+}
+HOME_RANKS: dict[Color, int] = {Color.WHITE: RANK_1, Color.BLACK: RANK_8}
+TOUCH_MASKS: list[int] = [0] * 64
+for _right in _RIGHTS_BY_VALUE:
+    TOUCH_MASKS[_right.expected_rook_square.index] |= RIGHT_BITS[_right]
+
+
+# K, Q, k and q name the outermost rook on their side of the king, which in
+# Chess960 need not stand on the h or a file.
+_SHORTHAND = {
+    CastlingRight.WHITE_SHORT: True, CastlingRight.BLACK_SHORT: True,
+    CastlingRight.WHITE_LONG: False, CastlingRight.BLACK_LONG: False,
+}
+
+
+def castling_rook_index(right: CastlingRight, pieces: dict[Color, dict[type[Piece], int]]) -> int:
+    """Returns the square index of the rook a castling right refers to.
+
+    Args:
+        right: The castling right.
+        pieces: The piece masks of the board, by color and type.
+
+    Returns:
+        The expected rook square, or for K/Q shorthand without a rook there
+        the outermost rook on that side of the king.
+    """
+    idx = right.expected_rook_square.index
+    rooks = pieces[right.color][Rook] & HOME_RANKS[right.color]
+    if rooks >> idx & 1 or right not in _SHORTHAND:
+        return idx
+    kings = pieces[right.color][King] & HOME_RANKS[right.color]
+    if not kings:
+        return idx
+    king_bit = kings & -kings
+    if _SHORTHAND[right]:
+        side = rooks & ~(king_bit | king_bit - 1)
+        return side.bit_length() - 1 if side else idx
+    side = rooks & (king_bit - 1)
+    return (side & -side).bit_length() - 1 if side else idx
+
+
+def _rook_rights(mask: int, pieces: dict[Color, dict[type[Piece], int]], sq: int) -> int:
+    """Returns the mask of the rights in mask whose rook stands on sq."""
+    cleared = TOUCH_MASKS[sq]
+    for right in _SHORTHAND:
+        if mask & RIGHT_BITS[right] and castling_rook_index(right, pieces) == sq:
+            cleared |= RIGHT_BITS[right]
+    return cleared
+
+
+def castling_right_for_move(
+    rights: tuple[CastlingRight, ...],
+    pieces: dict[Color, dict[type[Piece], int]],
+    color: Color,
+    start: int,
+    end: int,
+    onto_rook: bool,
+) -> tuple[CastlingRight | None, int]:
+    """Finds the castling right a king move uses.
+
+    A king moving onto its own rook castles with that rook. Otherwise a move
+    to the g or c file picks the side, and any other move its direction.
+
+    Args:
+        rights: The rights of the position.
+        pieces: The piece masks of the board, by color and type.
+        color: The castling side.
+        start: Square index the king starts on.
+        end: Square index the king moves to.
+        onto_rook: Whether end holds the king's own rook.
+
+    Returns:
+        The right and the square index of its rook, or (None, -1).
+    """
+    start_col, end_col = start % 8, end % 8
+    kingside = end_col == 6 or (end_col != 2 and end_col > start_col)
+    for right in rights:
+        if right == CastlingRight.NONE or right.color != color:
+            continue
+        rook = castling_rook_index(right, pieces)
+        if (rook == end) if onto_rook else (rook % 8 > start_col) == kingside:
+            return right, rook
+    return None, -1
+
+
+@lru_cache(maxsize=None)
+def rights_mask(rights: tuple[CastlingRight, ...]) -> int:
+    """Returns the mask of a tuple of castling rights."""
+    mask = 0
+    for right in rights:
+        mask |= RIGHT_BITS[right]
+    return mask
+
+
+@lru_cache(maxsize=None)
+def rights_from_mask(mask: int) -> tuple[CastlingRight, ...]:
+    """Returns the castling rights of a mask, sorted by their FEN letter."""
+    return tuple(r for r in _RIGHTS_BY_VALUE if mask & RIGHT_BITS[r])
+
+
+def mask_after_move(
+    mask: int,
+    pieces: dict[Color, dict[type[Piece], int]],
+    piece: Piece,
+    target: Piece | None,
+    start: int,
+    end: int,
+    rook_start: int | None = None,
+) -> int:
+    """Returns the castling rights mask left after a board move.
+
+    Args:
+        mask: The rights mask before the move.
+        pieces: The piece masks of the board before the move.
+        piece: The moving piece.
+        target: The piece on the destination square, if any.
+        start: Origin square index.
+        end: Destination square index.
+        rook_start: Square index of the rook that castles, if the move castles.
+
+    Returns:
+        The mask of the remaining rights.
+    """
+    cleared = 0
+    if isinstance(piece, Rook):
+        cleared |= _rook_rights(mask, pieces, start)
+    if isinstance(target, Rook):
+        cleared |= _rook_rights(mask, pieces, end)
+    if rook_start is not None:
+        cleared |= TOUCH_MASKS[rook_start]
+    if isinstance(piece, King):
+        cleared |= COLOR_MASKS[piece.color]
+    return mask & ~cleared
+
+
+def rights_after_move(
+    rights: tuple[CastlingRight, ...],
+    pieces: dict[Color, dict[type[Piece], int]],
+    piece: Piece,
+    target: Piece | None,
+    start: int,
+    end: int,
+    rook_start: int | None = None,
+) -> tuple[CastlingRight, ...]:
+    """Returns the castling rights left after a board move.
+
+    The tuple form of mask_after_move, for GameState.
+
+    Returns:
+        The remaining rights, sorted by their FEN letter.
+    """
+    return rights_from_mask(mask_after_move(rights_mask(rights), pieces, piece, target, start, end, rook_start))
@@ -1,4 +1,5 @@
 from enum import Enum, StrEnum
+from functools import cache
 from typing import TYPE_CHECKING
 
 
@@ -95,37 +96,16 @@ class CastlingRight(StrEnum):
     @property
     def expected_rook_square(self) -> "Square":
         """Returns the square where the rook is expected to be for this right."""
-        from v_chess.square import Square
-        if self == CastlingRight.WHITE_SHORT: return Square("h1")
-        if self == CastlingRight.WHITE_LONG: return Square("a1")
-        if self == CastlingRight.BLACK_SHORT: return Square("h8")
-        if self == CastlingRight.BLACK_LONG: return Square("a8")
-        if self == CastlingRight.NONE: return Square(None)
-
-        val = self.value
-        col = ord(val.lower()) - ord('a')
-        row = 7 if val.isupper() else 0
-        return Square(row, col)
+        return _expected_squares()[self][0]
 
     @property
     def expected_king_square(self) -> "Square":
-        """Returns the square where the king is expected to be for this right."""
-        from v_chess.square import Square
-        # Standard rights
-        if self in (CastlingRight.WHITE_SHORT, CastlingRight.WHITE_LONG):
-            return Square("e1")
-        if self in (CastlingRight.BLACK_SHORT, CastlingRight.BLACK_LONG):
-            return Square("e8")
-            
-        # 960 rights (A-H, a-h) - we need to find where the king actually is.
-        # But wait, castling rights in 960 FEN (HAha) only tell us where the ROOKS are.
-        # The king's expected square is STILL its starting square.
-        # In Chess960, we just need to ensure A king exists on that rank.
-        if self.value.isupper():
-            return Square(7, 4) # Default e1, but in 960 it could be anywhere on rank 1.
-        if self.value.islower():
-            return Square(0, 4) # Default e8
-        return Square(None)
+        """Returns the square where the king is expected to be for this right.
+
+        960 rights (A-H, a-h) only tell where the rook is; they report e1 or
+        e8, and callers accept a king anywhere on that rank.
+        """
+        return _expected_squares()[self][1]
 
     @property
     def color(self) -> Color:
@@ -165,6 +145,25 @@ class CastlingRight(StrEnum):
         return tuple(rights)
 
 
+@cache
+def _expected_squares() -> dict[CastlingRight, tuple["Square", "Square"]]:
+    """Builds the expected rook and king squares of every castling right."""
+    from v_chess.square import Square
+    squares = {CastlingRight.NONE: (Square(None), Square(None))}
+    for right in CastlingRight:
+        if right == CastlingRight.NONE:
+            continue
+        row = 7 if right.value.isupper() else 0
+        if right in (CastlingRight.WHITE_SHORT, CastlingRight.BLACK_SHORT):
+            col = 7
+        elif right in (CastlingRight.WHITE_LONG, CastlingRight.BLACK_LONG):
+            col = 0
+        else:
+            col = ord(right.value.lower()) - ord("a")
+        squares[right] = (Square(row, col), Square(row, 4))
+    return squares
+
+
 class Direction(Enum):
     """Directions a piece can move in.
 
@@ -280,6 +279,12 @@ class Direction(Enum):
             else:
                 break
 
+    @property
+    def offset(self) -> int:
+        """The change in square index of one step in this direction."""
+        d_col, d_row = self.value
+        return d_row * 8 + d_col
+
     def shift(self, bb: int) -> int:
         """Shifts a bitboard in this direction.
 
@@ -292,19 +297,20 @@ class Direction(Enum):
             The shifted bitboard.
         """
         d_col, d_row = self.value
-        shift_amt = d_row * 8 + d_col
+        shift_amt = self.offset
 
         FILE_A = 0x0101010101010101
         FILE_H = 0x8080808080808080
 
+        # Squares that would leave the board sideways are dropped first.
         if d_col == 1: # Right
-            return (bb & ~FILE_H) << 1
+            bb &= ~FILE_H
         elif d_col == -1: # Left
-            return (bb & ~FILE_A) >> 1
+            bb &= ~FILE_A
         elif d_col == 2: # Two Right
-            return (bb & ~FILE_H & ~(FILE_H >> 1)) << 2
+            bb &= ~FILE_H & ~(FILE_H >> 1)
         elif d_col == -2: # Two Left
-            return (bb & ~FILE_A & ~(FILE_A << 1)) >> 2
+            bb &= ~FILE_A & ~(FILE_A << 1)
 
         if shift_amt > 0:
             return (bb << shift_amt) & 0xFFFFFFFFFFFFFFFF
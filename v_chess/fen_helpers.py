@@ -1,47 +1,76 @@
+from dataclasses import replace
+from functools import lru_cache
 from typing import TYPE_CHECKING
+from v_chess.bitboard import Bitboard
 from v_chess.enums import CastlingRight, Color
 from v_chess.piece.piece import Piece
 from v_chess.square import Square
-from v_chess.piece import piece_from_char
+from v_chess.piece import piece_from_char, POCKET_TYPES, POCKET_INDEX
 
 if TYPE_CHECKING:
     from v_chess.game_state import GameState
     from v_chess.board import Board
 
+# Parsed states kept per process, keyed by the full FEN. Large enough to hold
+# every Chess960 start position alongside the variant starting FENs.
+FEN_CACHE_SIZE = 1024
 
-def board_from_fen(fen_board: str) -> dict[Square, Piece]:
-    """Parses the piece placement part of a FEN string.
+_PIECE_BY_CHAR: dict[str, Piece] = {
+    char: p_type(Color.WHITE if char.isupper() else Color.BLACK)
+    for char, p_type in piece_from_char.items()
+}
+
+
+def bitboard_from_fen(fen_board: str) -> Bitboard:
+    """Parses the piece placement part of a FEN string into a Bitboard.
 
     Args:
         fen_board: The piece placement part of a FEN string.
 
     Returns:
-        A dictionary mapping Squares to Pieces.
+        A Bitboard holding the pieces.
 
     Raises:
-        ValueError: If the FEN string contains invalid characters.
+        ValueError: If the FEN string contains invalid characters or squares.
     """
     # Strip pocket info if present for board parsing
     if "[" in fen_board:
         fen_board = fen_board.split("[")[0]
 
-    board: dict[Square, Piece] = {}
-    fen_rows = fen_board.split("/")
-    for row, fen_row in enumerate(fen_rows):
-        empty_squares = 0
-        for col, char in enumerate(fen_row):
+    bb = Bitboard()
+    pieces, mailbox = bb.pieces, bb.mailbox
+    for row, fen_row in enumerate(fen_board.split("/")):
+        col = 0
+        for char in fen_row:
             if char.isdigit():
-                empty_squares += int(char) - 1
-            else:
-                is_white = char.isupper()
-                piece_color = Color.WHITE if is_white else Color.BLACK
-                piece_type = piece_from_char.get(char)
-                if piece_type is None:
-                    raise ValueError(f"Invalid piece in FEN: {char}")
-                piece = piece_type(piece_color)
-                coord = Square(row, col + empty_squares)
-                board[coord] = piece
-    return board
+                col += int(char)
+                continue
+            piece = _PIECE_BY_CHAR.get(char)
+            if piece is None:
+                raise ValueError(f"Invalid piece in FEN: {char}")
+            if not Square.is_valid(row, col):
+                raise ValueError(f"Invalid Square: row={row}, col={col}")
+            idx = row * 8 + col
+            pieces[piece.color][type(piece)] |= 1 << idx
+            mailbox[idx] = piece
+            col += 1
+    bb.update_occupancy()
+    return bb
+
+def board_from_fen(fen_board: str) -> dict[Square, Piece]:
+    """Parses the piece placement part of a FEN string.
+
+    Args:
+        fen_board: The piece placement part of a FEN string.
+
+    Returns:
+        A dictionary mapping Squares to Pieces.
+
+    Raises:
+        ValueError: If the FEN string contains invalid characters.
+    """
+    mailbox = bitboard_from_fen(fen_board).mailbox
+    return {Square(divmod(idx, 8)): piece for idx, piece in enumerate(mailbox) if piece is not None}
 
 def get_fen_from_board(board: "Board") -> str:
     """Generates the piece placement part of a FEN string from a board.
@@ -52,74 +81,73 @@ def get_fen_from_board(board: "Board") -> str:
     Returns:
         The FEN piece placement string.
     """
+    mailbox = board.bitboard.mailbox
     fen_rows = []
-    for row in range(8):
+    for start in range(0, 64, 8):
         empty_squares = 0
-        fen_row_string = ""
-        for col in range(8):
-            coord = Square(row, col)
-            piece = board.get_piece(coord)
-
+        fen_row = []
+        for piece in mailbox[start:start + 8]:
             if piece is None:
                 empty_squares += 1
                 continue
-
             if empty_squares > 0:
-                fen_row_string += str(empty_squares)
+                fen_row.append(str(empty_squares))
                 empty_squares = 0
-
-            fen_row_string += piece.fen
-
+            fen_row.append(piece.fen)
         if empty_squares > 0:
-            fen_row_string += str(empty_squares)
-        fen_rows.append(fen_row_string)
+            fen_row.append(str(empty_squares))
+        fen_rows.append("".join(fen_row))
 
     return "/".join(fen_rows)
 
-def _parse_pocket(pocket_str: str) -> tuple[tuple[Piece, ...], tuple[Piece, ...]]:
-    """Parses a Crazyhouse pocket string into piece tuples.
+def _parse_pocket(pocket_str: str) -> tuple[tuple[int, ...], tuple[int, ...]]:
+    """Parses a Crazyhouse pocket string into piece counts.
 
     Args:
         pocket_str: The pocket string (e.g., 'QNp').
 
     Returns:
-        A tuple (white_pocket, black_pocket).
+        A tuple (white_pocket, black_pocket) of counts in POCKET_TYPES order.
     """
     # content inside []
-    white_pocket: list[Piece] = []
-    black_pocket: list[Piece] = []
+    white_pocket = [0] * len(POCKET_TYPES)
+    black_pocket = [0] * len(POCKET_TYPES)
 
     for char in pocket_str:
-        piece_cls = piece_from_char.get(char)
-        if piece_cls:
+        idx = POCKET_INDEX.get(piece_from_char.get(char))
+        if idx is not None:
             # Uppercase = White, Lowercase = Black
             if char.isupper():
-                white_pocket.append(piece_cls(Color.WHITE))
+                white_pocket[idx] += 1
             else:
-                black_pocket.append(piece_cls(Color.BLACK))
+                black_pocket[idx] += 1
 
     return (tuple(white_pocket), tuple(black_pocket))
 
-def _serialize_pocket(white_pocket: tuple[Piece, ...], black_pocket: tuple[Piece, ...]) -> str:
+def _serialize_pocket(white_pocket: tuple[int, ...], black_pocket: tuple[int, ...]) -> str:
     """Serializes Crazyhouse pockets to a string.
 
+    Pieces are written from queen down to pawn, White's first.
+
     Args:
-        white_pocket: Pieces in White's pocket.
-        black_pocket: Pieces in Black's pocket.
+        white_pocket: Piece counts of White's pocket.
+        black_pocket: Piece counts of Black's pocket.
 
     Returns:
         The FEN-compatible pocket string.
     """
     s = ""
-    for p in white_pocket:
-        s += p.fen
-    for p in black_pocket:
-        s += p.fen
+    for pocket, chars in ((white_pocket, "PNBRQ"), (black_pocket, "pnbrq")):
+        for idx in reversed(range(len(POCKET_TYPES))):
+            s += chars[idx] * pocket[idx]
     return f"[{s}]" if s else ""
 
 def state_from_fen(fen: str) -> "GameState":
     """Creates a GameState object from a full FEN string.
 
+    Parsed FENs are kept in a bounded LRU cache; each call returns a state
+    with its own copy of the board.
+
     Args:
         fen: The full FEN string.
 
@@ -129,6 +157,12 @@ def state_from_fen(fen: str) -> "GameState":
     Raises:
         ValueError: If the FEN string is malformed.
     """
+    template = _parse_fen(fen)
+    return replace(template, board=template.board.copy(), zobrist=template.zobrist_key)
+
+@lru_cache(maxsize=FEN_CACHE_SIZE)
+def _parse_fen(fen: str) -> "GameState":
+    """Parses a full FEN string; results are shared and must not be mutated."""
     from v_chess.game_state import GameState, ThreeCheckGameState, CrazyhouseGameState
     from v_chess.board import Board
 
@@ -1,12 +1,49 @@
 import time
-from dataclasses import replace
+from collections import Counter
+from dataclasses import dataclass, replace
 from v_chess.game_state import GameState
 from v_chess.move import Move
-from v_chess.rules import Rules
+from v_chess.packed_move import from_move, from_uci
+from v_chess.piece import King
+from v_chess.rules import Rules, GameStatus
+from v_chess.square import Square
 from v_chess.exceptions import IllegalMoveException, IllegalBoardException
 from v_chess.enums import MoveLegalityReason, BoardLegalityReason, GameOverReason, Color
 
 
+@dataclass(frozen=True, slots=True)
+class LegalMoveIndex:
+    """The legal moves of a position, indexed for constant time lookups.
+
+    Attributes:
+        moves: The legal moves, in generation order.
+        by_packed: Maps the packed form of each move to the move.
+        by_origin: Maps origin square indices to the board moves starting there.
+    """
+    moves: list[Move]
+    by_packed: dict[int, Move]
+    by_origin: dict[int, list[Move]]
+
+    @classmethod
+    def build(cls, moves: list[Move]) -> "LegalMoveIndex":
+        """Indexes a list of legal moves."""
+        by_origin: dict[int, list[Move]] = {}
+        for move in moves:
+            if not move.is_drop:
+                by_origin.setdefault(move.start.index, []).append(move)
+        return cls(moves, {from_move(move): move for move in moves}, by_origin)
+
+    def get(self, uci: str) -> Move | None:
+        """Returns the legal move with the given UCI string, or None."""
+        try:
+            return self.by_packed.get(from_uci(uci))
+        except ValueError:
+            return None
+
+    def __contains__(self, move: Move) -> bool:
+        return from_move(move) in self.by_packed
+
+
 class Game:
     """Represents a chess game.
 
@@ -39,6 +76,11 @@ class Game:
         self.move_history: list[str] = [] # SAN
         self.uci_history: list[str] = [] # UCI (for highlighting)
 
+        # Occurrences of each position (by Zobrist key) since the last
+        # irreversible move; earlier windows are stacked for undo_move.
+        self._position_counts: Counter[int] = Counter({self.state.zobrist_key: 1})
+        self._position_counts_stack: list[Counter[int]] = []
+
         # Timing
         self.time_control = time_control # {starting_time: min, increment: sec} OR {limit: sec, increment: sec}
         self.clocks = None
@@ -47,8 +89,10 @@ class Game:
         self.winner_override = None
         self.game_over_reason_override = None
 
-        self._status_cache = {}
-        self._status_cache_fen = None
+        self._status: GameStatus | None = None
+        self._status_state: GameState | None = None
+        self._legal_move_index: LegalMoveIndex | None = None
+        self._legal_move_index_state: GameState | None = None
 
         if self.time_control:
             if 'limit' in self.time_control:
@@ -123,8 +167,12 @@ class Game:
         if board_status != BoardLegalityReason.VALID:
              raise IllegalBoardException(f"Board state is illegal. Reason: {board_status}")
 
-        move_status = self.rules.validate_move(self.state, move)
-        if move_status != MoveLegalityReason.LEGAL:
+        if not self.is_move_legal(move):
+            move_status = self.rules.validate_move(self.state, move)
+            if move_status == MoveLegalityReason.LEGAL:
+                # The validators accept a few moves the generator rightly
+                # does not, such as a Racing Kings king moving two squares.
+                move_status = MoveLegalityReason.NOT_IN_MOVESET
             raise IllegalMoveException(f"Illegal move: {move_status.value} (attempted: {move.uci})")
 
         san = move.get_san(self)
@@ -144,23 +192,21 @@ class Game:
         self.add_to_history()
         new_state = self.apply_move(self.state, move)
 
-        current_fen_key = " ".join(new_state.fen.split()[:4])
-
-        count = 1
-        for past_state in self.history:
-            past_fen_key = " ".join(past_state.fen.split()[:4])
-            if past_fen_key == current_fen_key:
-                count += 1
+        if new_state.halfmove_clock == 0:
+            self._position_counts_stack.append(self._position_counts)
+            self._position_counts = Counter()
+        self._position_counts[new_state.zobrist_key] += 1
+        count = self._position_counts[new_state.zobrist_key]
 
-        self.state = replace(new_state, repetition_count=count)
+        self.state = replace(new_state, repetition_count=count, zobrist=new_state.zobrist_key)
 
+        status = self.status
         is_game_over = self.is_over
-        is_check = self.is_check
 
         if is_game_over:
             if self.game_over_reason == GameOverReason.CHECKMATE:
                  san += "#"
-        elif is_check:
+        elif status.is_check:
              san += "+"
 
         if offer_draw:
@@ -171,7 +217,7 @@ class Game:
 
         if is_game_over:
              result = "1/2-1/2"
-             winner_color = self.rules.get_winner(self.state)
+             winner_color = status.winner
              if winner_color == Color.WHITE:
                  result = "1-0"
              elif winner_color == Color.BLACK:
@@ -213,6 +259,9 @@ class Game:
         if self.move_history and self.move_history[-1] in ["1-0", "0-1", "1/2-1/2"]:
             self.move_history.pop()
 
+        self._position_counts[self.state.zobrist_key] -= 1
+        if self.state.halfmove_clock == 0 and self._position_counts_stack:
+            self._position_counts = self._position_counts_stack.pop()
         self.state = self.history.pop()
         if self.move_history:
             self.move_history.pop()
@@ -234,52 +283,62 @@ class Game:
         """Returns the number of times the current position has occurred."""
         return self.state.repetition_count
 
-    def _get_from_cache(self, key: str, provider):
-        """Retrieves a value from the cache or computes it if not present."""
-        if self._status_cache_fen != self.state.fen:
-            self._status_cache = {}
-            self._status_cache_fen = self.state.fen
-        
-        if key not in self._status_cache:
-            self._status_cache[key] = provider()
-        return self._status_cache[key]
+    @property
+    def status(self) -> GameStatus:
+        """The GameStatus of the current state, evaluated once per state."""
+        if self._status_state is not self.state:
+            self._status = self.rules.evaluate_status(self.state)
+            self._status_state = self.state
+        return self._status
 
     @property
     def is_check(self) -> bool:
         """Checks if the current side to move is in check."""
-        return self._get_from_cache("is_check", lambda: self.rules.is_check(self.state))
+        return self.status.is_check
 
     @property
     def is_checkmate(self) -> bool:
         """Checks if the current side to move is checkmated."""
-        return self._get_from_cache("is_checkmate", lambda: self.rules.is_checkmate(self.state))
+        return self.status.reason == GameOverReason.CHECKMATE
 
     @property
     def is_stalemate(self) -> bool:
         """Whether the game is over by stalemate."""
-        return self._get_from_cache("is_stalemate", lambda: self.rules.is_stalemate(self.state))
+        return self.status.reason == GameOverReason.STALEMATE
 
     @property
     def is_draw(self) -> bool:
         """Checks if the game is a draw."""
-        return self._get_from_cache("is_draw", lambda: self.rules.is_draw(self.state))
+        return self.status.is_draw
 
     @property
     def is_over(self) -> bool:
         """Checks if the game is over."""
         if self.is_over_by_timeout or self.game_over_reason_override is not None or self.winner_override is not None:
             return True
-        return self._get_from_cache("is_over", lambda: self.rules.is_game_over(self.state))
+        return self.status.is_over
+
+    @property
+    def legal_move_index(self) -> LegalMoveIndex:
+        """The indexed legal moves of the current state, generated once per state."""
+        if self._legal_move_index_state is not self.state:
+            self._legal_move_index = LegalMoveIndex.build(self.rules.legal_moves(self.state))
+            self._legal_move_index_state = self.state
+        return self._legal_move_index
 
     @property
     def legal_moves(self) -> list[Move]:
         """Returns a list of all legal moves in the current position."""
-        return [move for move in self.rules.get_possible_moves(self.state) if self.is_move_legal(move)]
+        return list(self.legal_move_index.moves)
+
+    def legal_moves_from(self, square: Square) -> list[Move]:
+        """Returns the legal moves starting on a square."""
+        return list(self.legal_move_index.by_origin.get(square.index, ()))
 
     @property
     def has_legal_moves(self) -> bool:
         """Checks if there is at least one legal move."""
-        return self._get_from_cache("has_legal_moves", lambda: self.rules.has_legal_moves(self.state))
+        return self.status.has_legal_moves
 
     @property
     def game_over_reason(self) -> GameOverReason:
@@ -288,7 +347,7 @@ class Game:
             return self.game_over_reason_override
         if self.is_over_by_timeout:
              return GameOverReason.TIMEOUT
-        return self._get_from_cache("game_over_reason", lambda: self.rules.get_game_over_reason(self.state))
+        return self.status.reason
 
     @property
     def winner(self) -> str | None:
@@ -301,7 +360,7 @@ class Game:
              # If timeout, the winner is the one NOT on turn (simplification)
              return self.state.turn.opposite.value
 
-        color = self._get_from_cache("winner", lambda: self.rules.get_winner(self.state))
+        color = self.status.winner
         return color.value if color else None
 
     def is_move_legal(self, move: Move) -> bool:
@@ -313,6 +372,23 @@ class Game:
         Returns:
             True if the move is legal, False otherwise.
         """
+        if move.is_drop and move.player_to_move not in (None, self.state.turn):
+            return False
+        return move in self.legal_move_index or self._is_castling_to_target(move)
+
+    def _is_castling_to_target(self, move: Move) -> bool:
+        """Checks for a legal Chess960 castle written as the king moving to the c or g file.
+
+        The legal moves list each Chess960 castle once, as the king taking
+        its rook, but UCI engines and earlier move histories give the king's
+        target square instead.
+        """
+        if not self.rules.allows_king_rook_castling or move.is_drop:
+            return False
+        if move.end.col not in (2, 6) or abs(move.start.col - move.end.col) < 2:
+            return False
+        if not isinstance(self.state.board.get_piece(move.start), King):
+            return False
         return self.rules.validate_move(self.state, move) == MoveLegalityReason.LEGAL
 
     def is_move_pseudo_legal(self, move: Move) -> tuple[bool, MoveLegalityReason]:
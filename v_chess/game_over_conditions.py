@@ -1,4 +1,5 @@
 from typing import TYPE_CHECKING, Optional
+from v_chess.bitboard import CENTER, RANK_8
 from v_chess.enums import GameOverReason, Color
 from v_chess.piece import King
 
@@ -34,11 +35,9 @@ def evaluate_stalemate(state: "GameState", rules: "Rules") -> Optional[GameOverR
 
 def evaluate_king_center_win(state: "GameState", rules: "Rules") -> Optional[GameOverReason]:
     """Win by moving King to the center (KOTH)."""
-    center_squares = {(3, 3), (3, 4), (4, 3), (4, 4)}
-    for sq, piece in state.board.items():
-        if isinstance(piece, King):
-            if (sq.row, sq.col) in center_squares:
-                return GameOverReason.KING_ON_HILL
+    pieces = state.board.bitboard.pieces
+    if (pieces[Color.WHITE][King] | pieces[Color.BLACK][King]) & CENTER:
+        return GameOverReason.KING_ON_HILL
     return None
 
 def evaluate_three_check_win(state: "GameState", rules: "Rules") -> Optional[GameOverReason]:
@@ -51,9 +50,8 @@ def evaluate_three_check_win(state: "GameState", rules: "Rules") -> Optional[Gam
 
 def evaluate_atomic_king_exploded(state: "GameState", rules: "Rules") -> Optional[GameOverReason]:
     """Game over if a king explodes."""
-    wk = any(isinstance(p, King) and p.color == Color.WHITE for p in state.board.values())
-    bk = any(isinstance(p, King) and p.color == Color.BLACK for p in state.board.values())
-    if not wk or not bk:
+    pieces = state.board.bitboard.pieces
+    if not pieces[Color.WHITE][King] or not pieces[Color.BLACK][King]:
         return GameOverReason.KING_EXPLODED
     return None
 
@@ -84,15 +82,9 @@ def evaluate_horde_win(state: "GameState", rules: "Rules") -> Optional[GameOverR
 
 def evaluate_racing_kings_win(state: "GameState", rules: "Rules") -> Optional[GameOverReason]:
     """Win by reaching the 8th rank."""
-    wk_on_8 = False
-    bk_on_8 = False
-    for sq, piece in state.board.items():
-        if isinstance(piece, King) and sq.row == 0:
-            if piece.color == Color.WHITE:
-                wk_on_8 = True
-            else:
-                bk_on_8 = True
-    
+    pieces = state.board.bitboard.pieces
+    wk_on_8 = pieces[Color.WHITE][King] & RANK_8
+    bk_on_8 = pieces[Color.BLACK][King] & RANK_8
     if wk_on_8 and bk_on_8:
         return GameOverReason.STALEMATE
     if bk_on_8:
@@ -1,15 +1,16 @@
 from __future__ import annotations
-from dataclasses import dataclass
-from functools import cached_property
+from dataclasses import dataclass, field, InitVar
 
 from v_chess.board import Board
 from v_chess.square import Square
 from v_chess.enums import Color, CastlingRight
 from v_chess.fen_helpers import state_from_fen, state_to_fen
-from v_chess.piece import Piece
+from v_chess.move_generator import CheckInfo, compute_check_info
+from v_chess.piece import Piece, EMPTY_POCKETS
+from v_chess.zobrist import compute_key
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GameState:
     """Represents the state of a chess game at a specific point in time.
 
@@ -22,6 +23,8 @@ class GameState:
         fullmove_count: The number of the full move.
         repetition_count: Number of times this position has occurred.
         explosion_square: The square where an explosion occurred (Atomic chess).
+        zobrist_key: 64-bit Zobrist key of the position. Computed from the
+            position unless passed in as `zobrist` by an incremental update.
     """
     board: Board
     turn: Color
@@ -31,10 +34,19 @@ class GameState:
     fullmove_count: int
     repetition_count: int = 1
     explosion_square: Square | None = None
+    zobrist: InitVar[int | None] = None
+    zobrist_key: int = field(init=False, repr=False, compare=False)
+    # Per-instance memos; declared as fields because the class uses slots.
+    _fen: str | None = field(default=None, init=False, repr=False, compare=False)
+    _check_info: CheckInfo | None = field(default=None, init=False, repr=False, compare=False)
+    _legal_moves_memo: tuple[object, list] | None = field(default=None, init=False, repr=False, compare=False)
 
     STARTING_FEN = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
     EMPTY_BOARD_FEN = "8/8/8/8/8/8/8/8 w KQkq - 0 1"
 
+    def __post_init__(self, zobrist: int | None):
+        object.__setattr__(self, "zobrist_key", compute_key(self) if zobrist is None else zobrist)
+
     @classmethod
     def starting_setup(cls) -> GameState:
         """Creates a GameState with the standard starting position."""
@@ -50,17 +62,26 @@ class GameState:
         """Creates a GameState with an empty board."""
         return state_from_fen(cls.EMPTY_BOARD_FEN)
 
-    @cached_property
+    @property
     def fen(self) -> str:
-        """The FEN string representation of the game state."""
-        return state_to_fen(self)
+        """The FEN string representation of the game state, computed once."""
+        if self._fen is None:
+            object.__setattr__(self, "_fen", state_to_fen(self))
+        return self._fen
+
+    @property
+    def check_info(self) -> CheckInfo:
+        """Checkers, pins and enemy attacks for the side to move, computed once."""
+        if self._check_info is None:
+            object.__setattr__(self, "_check_info", compute_check_info(self))
+        return self._check_info
 
     def __hash__(self):
-        """Returns the hash of the FEN string."""
-        return hash(self.fen)
+        """Returns the Zobrist key of the position."""
+        return self.zobrist_key
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ThreeCheckGameState(GameState):
     """GameState for Three-Check Chess.
 
@@ -69,12 +90,17 @@ class ThreeCheckGameState(GameState):
     """
     checks: tuple[int, int] = (0, 0)
 
+    __hash__ = GameState.__hash__
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CrazyhouseGameState(GameState):
     """GameState for Crazyhouse Chess.
 
     Attributes:
-        pockets: Tuple (white_pocket, black_pocket) tracking available drop pieces.
+        pockets: Tuple (white_pocket, black_pocket) of piece counts in
+            POCKET_TYPES order.
     """
-    pockets: tuple[tuple[Piece, ...], tuple[Piece, ...]] = ((), ())
+    pockets: tuple[tuple[int, ...], tuple[int, ...]] = EMPTY_POCKETS
+
+    __hash__ = GameState.__hash__
@@ -1,10 +1,8 @@
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
-from v_chess.piece.pawn import Pawn
-from v_chess.piece.king import King
 from v_chess.square import Square
-from v_chess.enums import Color, MoveLegalityReason
+from v_chess.enums import Color
 from v_chess.piece.piece import Piece
 from v_chess.piece import piece_from_char
 
@@ -12,7 +10,7 @@ if TYPE_CHECKING:
     from v_chess.game import Game
 
 
-@dataclass(frozen=True, eq=True)
+@dataclass(frozen=True, eq=True, slots=True)
 class Move:
     """A piece moving from one square to another."""
     start: Square = field(compare=True)
@@ -121,74 +119,13 @@ class Move:
         """Generates the Standard Algebraic Notation (SAN) for the move.
 
         Args:
-            game: The game context, used to resolve ambiguity and checks.
+            game: The game context, whose legal moves resolve ambiguity.
 
         Returns:
             The SAN string (e.g., 'Nf3', 'O-O', 'exd5').
         """
-        if self.is_drop:
-            # SAN for drop is usually same as UCI/special: N@e4
-            return self.uci
-
-        piece = game.state.board.get_piece(self.start)
-        if piece is None:
-            return self.uci
-
-        if isinstance(piece, King) and abs(self.start.col - self.end.col) == 2:
-            if self.end.col > self.start.col:
-                return "O-O"
-            else:
-                return "O-O-O"
-
-        san = ""
-        piece_char = piece.fen.upper()
-        if not isinstance(piece, Pawn):
-            san += piece_char
-
-        candidates = []
-
-        for sq, p in game.state.board.items():
-            if p and isinstance(p, type(piece)) and p.color == piece.color:
-                if sq == self.start:
-                    continue
-
-                candidate_move = Move(sq, self.end, self.promotion_piece, player_to_move=game.state.turn)
-                if game.rules.validate_move(game.state, candidate_move) == MoveLegalityReason.LEGAL:
-                    candidates.append(sq)
-
-        if candidates:
-            file_distinct = True
-            for c_sq in candidates:
-                if c_sq.col == self.start.col:
-                    file_distinct = False
-                    break
-
-            rank_distinct = True
-            for c_sq in candidates:
-                if c_sq.row == self.start.row:
-                    rank_distinct = False
-                    break
-
-            if file_distinct:
-                san += str(self.start).lower()[0]
-            elif rank_distinct:
-                san += str(self.start).lower()[1]
-            else:
-                san += str(self.start).lower()
-
-        target = game.state.board.get_piece(self.end)
-        is_en_passant = isinstance(piece, Pawn) and self.start.col != self.end.col and target is None
-
-        if target is not None or is_en_passant:
-            if isinstance(piece, Pawn):
-                san += str(self.start).lower()[0]
-            san += "x"
-
-        san += str(self.end).lower()
-        if self.promotion_piece:
-            san += "=" + str(self.promotion_piece).upper()
-
-        return san
+        from v_chess.san import move_to_san
+        return move_to_san(game.state, self, game.legal_move_index.moves)
 
     @staticmethod
     def is_uci_valid(uci_str: str):
@@ -218,28 +155,6 @@ class Move:
         except:
             return False
 
-    @classmethod
-    def from_san_castling(cls, san_str: str, game: "Game") -> "Move":
-        """Creates a castling Move from a SAN string."""
-        color = game.state.turn
-        
-        # Find the king's actual position
-        king_sq = None
-        for sq, piece in game.state.board.items():
-            if isinstance(piece, King) and piece.color == color:
-                king_sq = sq
-                break
-        
-        if king_sq is None:
-            # Fallback to standard if king missing (should be caught by validators)
-            king_sq = Square("e1") if color == Color.WHITE else Square("e8")
-
-        rank = 7 if color == Color.WHITE else 0
-        if san_str == "O-O":
-            return Move(king_sq, Square(rank, 6), player_to_move=color)
-        else:
-            return Move(king_sq, Square(rank, 2), player_to_move=color)
-
     @classmethod
     def from_san_move(cls, san_str: str, game: "Game") -> "Move":
         """Parses a Standard Algebraic Notation string into a Move object.
@@ -254,73 +169,12 @@ class Move:
         Raises:
              ValueError: If the SAN string is ambiguous or illegal.
         """
-
-        # Handle Drops in SAN if strictly parsing
-        if "@" in san_str:
-            # Assume it's UCI/Drop notation like P@e4
-            return Move(san_str, player_to_move=game.state.turn)
-
-        clean_san = san_str.replace("x", "").replace("+", "").replace("#", "").replace("(", "").replace(")", "")
-
-        promotion_piece = None
-        if "=" in clean_san:
-            clean_san, promotion_char = clean_san.split("=")
-            promotion_piece = piece_from_char[promotion_char](
-                game.state.turn
-            )
-        elif clean_san and clean_san[-1].isalpha() and clean_san[-1].upper() in piece_from_char:
-
-            promotion_char = clean_san[-1]
-            clean_san = clean_san[:-1]
-            promotion_piece = piece_from_char[promotion_char](
-                game.state.turn
-            )
-
-        end_square = Square(clean_san[-2:])
-        piece_indicator = clean_san[:-2]
-
-        if piece_indicator and piece_indicator[0].isupper():
-            piece_type = piece_from_char[piece_indicator[0]]
-            disambiguation = piece_indicator[1:]
-        else:
-            piece_type = Pawn
-            disambiguation = piece_indicator
-
-        candidates = []
-        for sq, p in game.state.board.items():
-            if p and isinstance(p, piece_type) and p.color == game.state.turn:
-                 candidates.append(sq)
-
-        if disambiguation:
-            if disambiguation.isalpha():
-                col = ord(disambiguation) - ord("a")
-                candidates = [sq for sq in candidates if sq.col == col]
-
-            elif disambiguation.isdigit():
-                row = 8 - int(disambiguation)
-                candidates = [sq for sq in candidates if sq.row == row]
-
-            elif len(disambiguation) == 2:
-                col = ord(disambiguation[0]) - ord("a")
-                row = 8 - int(disambiguation[1])
-                candidates = [sq for sq in candidates if sq.col == col and sq.row == row]
-
-        legal_moves = [
-            Move(sq, end_square, promotion_piece, player_to_move=game.state.turn)
-            for sq in candidates
-            if game.rules.validate_move(game.state, Move(sq, end_square, promotion_piece, player_to_move=game.state.turn)) == MoveLegalityReason.LEGAL
-        ]
-        if len(legal_moves) != 1:
-            raise ValueError(f"San {san_str} is ambiguous or illegal. Found {len(legal_moves)} matches.")
-
-        return legal_moves[0]
+        from v_chess.san import san_to_move
+        return san_to_move(game.state, san_str, game.legal_move_index.moves)
 
     @classmethod
     def from_san(cls, san_str: str, game: "Game") -> "Move":
         """Creates a Move from a SAN string (including castling)."""
-        if san_str in ("O-O", "O-O-O"):
-            return cls.from_san_castling(san_str, game)
-
         return cls.from_san_move(san_str, game)
 
     def __str__(self) -> str:
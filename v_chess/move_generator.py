@@ -0,0 +1,534 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from v_chess.bitboard import (
+    ALL_SQUARES, BETWEEN, RANK_1, RANK_2, RANK_7, RANK_8, AttackTables, Bitboard, pawn_attack_mask
+)
+from v_chess.enums import Color, Direction, MoveLegalityReason
+from v_chess.move import Move
+from v_chess.packed_move import MoveList, DROP_FLAG, FROM_SHIFT, TO_MASK, TYPE_CODES, TYPE_SHIFT, pack, to_move
+from v_chess.piece import Pawn, Knight, Bishop, Rook, Queen, King, Piece, POCKET_TYPES
+
+if TYPE_CHECKING:
+    from v_chess.game_state import GameState
+
+PROMOTION_TYPES: tuple[type[Piece], ...] = (Queen, Rook, Bishop, Knight)
+
+_BACK_RANKS = RANK_1 | RANK_8
+
+
+def checkers_and_pins(state: "GameState", king_sq: int) -> tuple[int, dict[int, int]]:
+    """Finds the pieces giving check to the side to move and its pinned pieces.
+
+    Args:
+        state: The position to analyse.
+        king_sq: Square index of the side to move's king.
+
+    Returns:
+        A tuple (checkers, pins) where checkers is a bitmask of enemy pieces
+        attacking the king and pins maps each pinned square to the ray
+        (including the pinning piece) it may still move along.
+    """
+    bb = state.board.bitboard
+    us = state.turn
+    theirs = bb.pieces[us.opposite]
+    occ = bb.occupied
+    orthogonal = theirs[Rook] | theirs[Queen]
+    diagonal = theirs[Bishop] | theirs[Queen]
+
+    checkers = (
+        (AttackTables.knight_attacks(king_sq) & theirs[Knight]) |
+        (AttackTables.pawn_attacks(us, king_sq) & theirs[Pawn]) |
+        (AttackTables.king_attacks(king_sq) & theirs[King]) |
+        (AttackTables.rook_attacks(king_sq, occ) & orthogonal) |
+        (AttackTables.bishop_attacks(king_sq, occ) & diagonal)
+    )
+
+    pins = {}
+    own = bb.occupied_co[us]
+    snipers = (
+        (AttackTables.rook_attacks(king_sq, 0) & orthogonal) |
+        (AttackTables.bishop_attacks(king_sq, 0) & diagonal)
+    )
+    while snipers:
+        sniper = (snipers & -snipers).bit_length() - 1
+        ray = BETWEEN[king_sq][sniper]
+        blockers = ray & occ
+        if blockers and not (blockers & (blockers - 1)) and blockers & own:
+            pins[blockers.bit_length() - 1] = ray | (1 << sniper)
+        snipers &= snipers - 1
+
+    return checkers, pins
+
+
+@dataclass(slots=True)
+class CheckInfo:
+    """Check analysis of a position for the side to move.
+
+    Attributes:
+        king_sq: Square index of the side to move's king, or -1 if it has none.
+        checkers: Bitmask of enemy pieces attacking the king.
+        pins: Maps each pinned square to the ray (including the pinning
+            piece) it may still move along.
+        evasions: Squares a non-king move must land on to resolve check;
+            every square when not in check and none in double check.
+    """
+    king_sq: int
+    checkers: int
+    pins: dict[int, int]
+    evasions: int
+    bitboard: Bitboard | None = field(default=None, repr=False, compare=False)
+    color: Color | None = field(default=None, repr=False, compare=False)
+    _attacked: int | None = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def attacked(self) -> int:
+        """Squares attacked by the opponent, computed on first use.
+
+        The king is removed from the occupancy, so squares behind it along
+        a checking ray count as attacked.
+        """
+        if self._attacked is None:
+            bb = self.bitboard
+            attacked = 0
+            if bb is not None:
+                them = self.color.opposite
+                attacked = bb.attacks_by(them, bb.occupied & ~(1 << self.king_sq))
+            self._attacked = attacked
+        return self._attacked
+
+
+_NO_KING = CheckInfo(-1, 0, {}, ~0)
+
+
+def compute_check_info(state: "GameState") -> CheckInfo:
+    """Analyses checks and pins for the side to move.
+
+    Uses the lowest-indexed king when the side to move has several.
+
+    Args:
+        state: The position to analyse.
+
+    Returns:
+        The CheckInfo of the position.
+    """
+    bb = state.board.bitboard
+    us = state.turn
+    king_mask = bb.pieces[us][King]
+    if not king_mask:
+        return _NO_KING
+    king_sq = (king_mask & -king_mask).bit_length() - 1
+    checkers, pins = checkers_and_pins(state, king_sq)
+    if checkers & (checkers - 1):
+        evasions = 0
+    elif checkers:
+        evasions = checkers | BETWEEN[king_sq][checkers.bit_length() - 1]
+    else:
+        evasions = ~0
+    return CheckInfo(king_sq, checkers, pins, evasions, bb, us)
+
+
+def has_capture(state: "GameState") -> bool:
+    """Checks whether the side to move has any capture, en passant included.
+
+    Works set-wise on attack masks and ignores king safety, as suits
+    variants with forced captures.
+    """
+    bb = state.board.bitboard
+    us = state.turn
+    ours = bb.pieces[us]
+    enemy = bb.occupied_co[us.opposite]
+    if not enemy:
+        return False
+    targets = enemy
+    if state.ep_square is not None and not state.ep_square.is_none_square:
+        targets |= 1 << state.ep_square.index
+    if pawn_attack_mask(ours[Pawn], us) & targets:
+        return True
+    occ = bb.occupied
+    for p_type, table in ((Knight, AttackTables.knight_attacks), (King, AttackTables.king_attacks)):
+        mask = ours[p_type]
+        while mask:
+            if table((mask & -mask).bit_length() - 1) & enemy:
+                return True
+            mask &= mask - 1
+    for p_type, table in ((Bishop, AttackTables.bishop_attacks), (Rook, AttackTables.rook_attacks)):
+        mask = ours[p_type] | ours[Queen]
+        while mask:
+            if table((mask & -mask).bit_length() - 1, occ) & enemy:
+                return True
+            mask &= mask - 1
+    return False
+
+
+def generate_moves(
+    state: "GameState",
+    *,
+    king_safety: bool = True,
+    promotion_types: tuple[type[Piece], ...] = PROMOTION_TYPES,
+    first_rank_double_push: bool = False,
+    captures_only: bool = False,
+) -> list[Move]:
+    """Generates board moves for the side to move directly from the bitboards.
+
+    Castling and drops are not included; rules add those separately.
+
+    Args:
+        state: The position to generate moves for.
+        king_safety: Whether moves leaving the king in check are excluded.
+            Ignored when the side to move has no king.
+        promotion_types: Piece types a pawn may promote to.
+        first_rank_double_push: Whether white pawns on the first rank may
+            advance two squares (Horde).
+        captures_only: Whether only captures, en passant included, are
+            generated.
+
+    Returns:
+        The generated moves.
+    """
+    moves = MoveList()
+    generate_packed_moves(
+        state, moves, king_safety=king_safety, promotion_types=promotion_types,
+        first_rank_double_push=first_rank_double_push, captures_only=captures_only
+    )
+    return moves.to_moves(state.turn)
+
+
+def generate_packed_moves(
+    state: "GameState",
+    moves: MoveList,
+    *,
+    king_safety: bool = True,
+    promotion_types: tuple[type[Piece], ...] = PROMOTION_TYPES,
+    first_rank_double_push: bool = False,
+    captures_only: bool = False,
+):
+    """Appends the board moves of the side to move to a MoveList as packed moves.
+
+    Takes the same options as generate_moves.
+
+    Args:
+        state: The position to generate moves for.
+        moves: The list to append to.
+    """
+    bb = state.board.bitboard
+    us = state.turn
+    ours = bb.pieces[us]
+    own = bb.occupied_co[us]
+    enemy = bb.occupied_co[us.opposite]
+    occ = bb.occupied
+
+    king_mask = ours[King]
+    info = state.check_info if king_safety else _NO_KING
+    allowed = enemy if captures_only else ~own
+    pins, evasions, king_sq = info.pins, info.evasions & allowed, info.king_sq
+
+    # Kings
+    mask = king_mask
+    while mask:
+        sq = (mask & -mask).bit_length() - 1
+        targets = AttackTables.king_attacks(sq) & allowed
+        if sq == king_sq and targets:
+            targets &= ~info.attacked
+        _add_moves(moves, sq, targets)
+        mask &= mask - 1
+
+    # Knights and sliders
+    for p_type in (Knight, Bishop, Rook, Queen):
+        mask = ours[p_type]
+        while mask:
+            sq = (mask & -mask).bit_length() - 1
+            if p_type is Knight:
+                targets = AttackTables.knight_attacks(sq)
+            elif p_type is Bishop:
+                targets = AttackTables.bishop_attacks(sq, occ)
+            elif p_type is Rook:
+                targets = AttackTables.rook_attacks(sq, occ)
+            else:
+                targets = AttackTables.queen_attacks(sq, occ)
+            targets &= evasions
+            if sq in pins:
+                targets &= pins[sq]
+            _add_moves(moves, sq, targets)
+            mask &= mask - 1
+
+    # Pawns
+    pawns = ours[Pawn]
+    if not pawns:
+        return
+    if us == Color.WHITE:
+        start_ranks, promotion_rank = RANK_2, RANK_8
+        if first_rank_double_push:
+            start_ranks |= RANK_1
+    else:
+        start_ranks, promotion_rank = RANK_7, RANK_1
+    empty = 0 if captures_only else ~occ & ALL_SQUARES
+
+    # Pinned pawns keep to their pin ray; the rest move as one set.
+    pinned = 0
+    for sq, ray in pins.items():
+        if pawns & (1 << sq):
+            pinned |= 1 << sq
+            _add_pawn_moves(moves, 1 << sq, us, empty, enemy, evasions & ray, start_ranks, promotion_rank, promotion_types)
+    _add_pawn_moves(moves, pawns & ~pinned, us, empty, enemy, evasions, start_ranks, promotion_rank, promotion_types)
+
+    if state.ep_square is not None and not state.ep_square.is_none_square:
+        ep = state.ep_square.index
+        if not occ & (1 << ep):
+            mask = AttackTables.pawn_attacks(us.opposite, ep) & pawns
+            while mask:
+                ep_move = ((mask & -mask).bit_length() - 1) << FROM_SHIFT | ep
+                if king_sq == -1 or not bb.is_king_attacked_after_move(to_move(ep_move, us), us, state.board, state.ep_square):
+                    moves.append(ep_move)
+                mask &= mask - 1
+
+
+_PAWN_DIRECTIONS: dict[Color, tuple[Direction, Direction, Direction]] = {
+    Color.WHITE: (Direction.UP, Direction.UP_LEFT, Direction.UP_RIGHT),
+    Color.BLACK: (Direction.DOWN, Direction.DOWN_LEFT, Direction.DOWN_RIGHT),
+}
+
+
+def _add_pawn_moves(
+    moves: MoveList,
+    pawns: int,
+    color: Color,
+    empty: int,
+    enemy: int,
+    allowed: int,
+    start_ranks: int,
+    promotion_rank: int,
+    promotion_types: tuple[type[Piece], ...],
+):
+    """Appends the pushes and captures of a set of pawns, computed set-wise.
+
+    Args:
+        moves: The list to append to.
+        pawns: The pawns to move.
+        color: The color of the pawns.
+        empty: The squares pawns may push to; 0 for captures only.
+        enemy: The squares pawns may capture on.
+        allowed: The destination squares that keep the king safe.
+        start_ranks: The ranks pawns may double push from.
+        promotion_rank: The rank pawns promote on.
+        promotion_types: Piece types a pawn may promote to.
+    """
+    push, left, right = _PAWN_DIRECTIONS[color]
+    single = push.shift(pawns) & empty
+    double = push.shift(push.shift(pawns & start_ranks) & empty) & empty
+    step = push.offset
+    for targets, offset in (
+        (single & allowed, step), (double & allowed, 2 * step),
+        (left.shift(pawns) & enemy & allowed, left.offset), (right.shift(pawns) & enemy & allowed, right.offset),
+    ):
+        while targets:
+            dest_bit = targets & -targets
+            dest = dest_bit.bit_length() - 1
+            if dest_bit & promotion_rank:
+                for promo_type in promotion_types:
+                    moves.append(pack(dest - offset, dest, promo_type))
+            else:
+                moves.append((dest - offset) << FROM_SHIFT | dest)
+            targets &= targets - 1
+
+
+def _add_moves(moves: MoveList, sq: int, targets: int):
+    """Appends a packed move from sq to every square in the targets mask."""
+    origin = sq << FROM_SHIFT
+    while targets:
+        moves.append(origin | (targets & -targets).bit_length() - 1)
+        targets &= targets - 1
+
+
+def generate_drops(state: "GameState", *, king_safety: bool = True) -> list[Move]:
+    """Generates the Crazyhouse drops of the side to move from the bitboards.
+
+    Args:
+        state: The position to generate drops for.
+        king_safety: Whether drops that leave the king in check are excluded.
+
+    Returns:
+        The generated drops.
+    """
+    moves = MoveList()
+    generate_packed_drops(state, moves, king_safety=king_safety)
+    return moves.to_moves(state.turn)
+
+
+def generate_packed_drops(state: "GameState", moves: MoveList, *, king_safety: bool = True):
+    """Appends the Crazyhouse drops of the side to move to a MoveList.
+
+    Drops land on empty squares, pawns never on the first or last rank.
+    With king_safety, a king in check only allows drops on the squares
+    between it and a single checker.
+
+    Args:
+        state: The position to generate drops for.
+        moves: The list to append to.
+        king_safety: Whether drops that leave the king in check are excluded.
+    """
+    pockets = getattr(state, "pockets", None)
+    if pockets is None:
+        return
+    pocket = pockets[0 if state.turn == Color.WHITE else 1]
+    if not any(pocket):
+        return
+    targets = ~state.board.bitboard.occupied & ALL_SQUARES
+    if king_safety:
+        targets &= state.check_info.evasions
+    for p_type, count in zip(POCKET_TYPES, pocket):
+        if not count:
+            continue
+        mask = targets & ~_BACK_RANKS if p_type is Pawn else targets
+        drop = DROP_FLAG | TYPE_CODES[p_type] << TYPE_SHIFT
+        while mask:
+            moves.append(drop | (mask & -mask).bit_length() - 1)
+            mask &= mask - 1
+
+
+def explosion(bb: Bitboard, sq: int, occ: int) -> int:
+    """Returns the squares an Atomic capture on sq clears.
+
+    The capture square always explodes; around it, every piece but pawns.
+
+    Args:
+        bb: The bitboard, for the pawn masks.
+        sq: The capture square index.
+        occ: The occupancy once the capturing move is made.
+
+    Returns:
+        The mask of exploded squares.
+    """
+    pawns = bb.pieces[Color.WHITE][Pawn] | bb.pieces[Color.BLACK][Pawn]
+    return 1 << sq | AttackTables.king_attacks(sq) & occ & ~pawns
+
+
+def atomic_move_reason(state: "GameState", start: int, end: int) -> MoveLegalityReason | None:
+    """Judges an Atomic move of the side to move with mask arithmetic.
+
+    Kings may not capture, a move may not blow up its own king, and unless
+    the enemy king explodes the mover's king must not be attacked afterwards.
+    A king touching the enemy king cannot be checked, since no capture next
+    to it could avoid blowing up both. Castling is judged as the king's move
+    alone.
+
+    Args:
+        state: The position the move is made in.
+        start: Origin square index.
+        end: Destination square index.
+
+    Returns:
+        The reason the move is illegal, or None if it is legal.
+    """
+    bb = state.board.bitboard
+    us = state.turn
+    ours = bb.pieces[us]
+    theirs = bb.pieces[us.opposite]
+    start_bit, end_bit = 1 << start, 1 << end
+    ep = state.ep_square
+    ep_idx = ep.index if ep is not None and not ep.is_none_square else -1
+
+    our_kings = ours[King]
+    if our_kings & start_bit:
+        if bb.occupied & end_bit or end == ep_idx:
+            return MoveLegalityReason.OWN_PIECE_CAPTURE
+        our_kings ^= start_bit | end_bit
+
+    occ = bb.occupied & ~start_bit | end_bit
+    if bb.occupied_co[us.opposite] & end_bit or (end == ep_idx and ours[Pawn] & start_bit):
+        if end == ep_idx:
+            occ &= ~(1 << (end + 8 if us == Color.WHITE else end - 8))
+        blast = explosion(bb, end, occ)
+        occ &= ~blast
+        our_kings &= ~blast
+        if not our_kings:
+            return MoveLegalityReason.KING_EXPLODED
+        if not theirs[King] & ~blast:
+            return None
+
+    knights, kings, pawns = theirs[Knight] & occ, theirs[King] & occ, theirs[Pawn] & occ
+    diagonal = (theirs[Bishop] | theirs[Queen]) & occ
+    straight = (theirs[Rook] | theirs[Queen]) & occ
+    while our_kings:
+        sq = (our_kings & -our_kings).bit_length() - 1
+        if AttackTables.king_attacks(sq) & kings:
+            our_kings &= our_kings - 1
+            continue
+        if (
+            AttackTables.knight_attacks(sq) & knights
+            or AttackTables.pawn_attacks(us, sq) & pawns
+            or diagonal and AttackTables.bishop_attacks(sq, occ) & diagonal
+            or straight and AttackTables.rook_attacks(sq, occ) & straight
+        ):
+            return MoveLegalityReason.KING_LEFT_IN_CHECK
+        our_kings &= our_kings - 1
+    return None
+
+
+def generate_atomic_moves(state: "GameState") -> list[Move]:
+    """Generates the legal Atomic board moves of the side to move.
+
+    Castling is not included.
+
+    Args:
+        state: The position to generate moves for.
+
+    Returns:
+        The generated moves.
+    """
+    candidates = MoveList()
+    generate_packed_moves(state, candidates, king_safety=False)
+    moves = MoveList()
+    for packed in candidates:
+        if atomic_move_reason(state, packed >> FROM_SHIFT & TO_MASK, packed & TO_MASK) is None:
+            moves.append(packed)
+    return moves.to_moves(state.turn)
+
+
+def piece_attacks(p_type: type[Piece], color: Color, sq: int, occ: int) -> int:
+    """Returns the squares a piece of the given type and color on sq attacks."""
+    if p_type is Pawn:
+        return AttackTables.pawn_attacks(color, sq)
+    if p_type is Knight:
+        return AttackTables.knight_attacks(sq)
+    if p_type is Bishop:
+        return AttackTables.bishop_attacks(sq, occ)
+    if p_type is Rook:
+        return AttackTables.rook_attacks(sq, occ)
+    if p_type is Queen:
+        return AttackTables.queen_attacks(sq, occ)
+    return AttackTables.king_attacks(sq)
+
+
+def gives_check(state: "GameState", start: int, end: int, p_type: type[Piece]) -> bool:
+    """Checks whether a board move of the side to move attacks an enemy king.
+
+    Answered on the current bitboards: the moved piece is tested from its
+    destination, and the other pieces under the occupancy after the move,
+    which covers discovered checks.
+
+    Args:
+        state: The position the move is made in.
+        start: Origin square index.
+        end: Destination square index.
+        p_type: The type of the moved piece once on end, promotions included.
+
+    Returns:
+        Whether an enemy king is attacked after the move.
+    """
+    bb = state.board.bitboard
+    us = state.turn
+    kings = bb.pieces[us.opposite][King]
+    if not kings:
+        return False
+    occ = bb.occupied & ~(1 << start) | 1 << end
+    ep = state.ep_square
+    if ep is not None and not ep.is_none_square and end == ep.index and bb.pieces[us][Pawn] & (1 << start):
+        occ &= ~(1 << (end + 8 if us == Color.WHITE else end - 8))
+    if piece_attacks(p_type, us, end, occ) & kings:
+        return True
+    while kings:
+        if bb.attackers((kings & -kings).bit_length() - 1, us, occ) & ~(1 << start):
+            return True
+        kings &= kings - 1
+    return False
@@ -1,12 +1,13 @@
 from typing import TYPE_CHECKING, Optional
 from v_chess.enums import MoveLegalityReason, Color
+from v_chess.bitboard import BETWEEN, PSEUDO_MOVES
+from v_chess.piece import POCKET_INDEX
+from v_chess.move_generator import atomic_move_reason, gives_check, has_capture
 
 if TYPE_CHECKING:
     from v_chess.game_state import GameState
     from v_chess.move import Move
     from v_chess.rules import Rules
-    from v_chess.rules.chess960 import Chess960Rules
-    from v_chess.rules.horde import HordeRules
 
 def validate_piece_presence(state: "GameState", move: "Move", rules: "Rules") -> Optional[MoveLegalityReason]:
     """Ensures a piece exists at the starting square (unless it's a drop)."""
@@ -34,10 +35,9 @@ def validate_friendly_capture(state: "GameState", move: "Move", rules: "Rules")
     target = state.board.get_piece(move.end)
     if target and target.color == state.turn:
         from v_chess.piece import King, Rook
-        from v_chess.rules.chess960 import Chess960Rules
         piece = state.board.get_piece(move.start)
         if isinstance(piece, King) and isinstance(target, Rook):
-             if isinstance(rules, Chess960Rules):
+             if rules.allows_king_rook_castling:
                   return None
         
         return MoveLegalityReason.OWN_PIECE_CAPTURE
@@ -52,15 +52,13 @@ def validate_moveset(state: "GameState", move: "Move", rules: "Rules") -> Option
     if not piece: return None
     
     from v_chess.piece import Pawn, King
-    from v_chess.rules.horde import HordeRules
-    from v_chess.rules.chess960 import Chess960Rules
     
-    in_moveset = move.end in piece.theoretical_moves(move.start)
+    in_moveset = PSEUDO_MOVES[piece.color][type(piece)][move.start.index] & (1 << move.end.index)
     
     is_pawn_double_push = False
     if isinstance(piece, Pawn):
         is_start_rank = (move.start.row == 6 if piece.color == Color.WHITE else move.start.row == 1)
-        if isinstance(rules, HordeRules) and piece.color == Color.WHITE and move.start.row == 7:
+        if rules.horde_first_rank_double_push and piece.color == Color.WHITE and move.start.row == 7:
             is_start_rank = True
             
         direction = piece.direction
@@ -73,7 +71,7 @@ def validate_moveset(state: "GameState", move: "Move", rules: "Rules") -> Option
     if isinstance(piece, King):
         if abs(move.start.col - move.end.col) == 2:
             is_castling_attempt = True
-        elif isinstance(rules, Chess960Rules):
+        elif rules.allows_king_rook_castling:
             target = state.board.get_piece(move.end)
             from v_chess.piece import Rook
             if isinstance(target, Rook) and target.color == piece.color:
@@ -92,34 +90,39 @@ def validate_path(state: "GameState", move: "Move", rules: "Rules") -> Optional[
     if not piece: return None
     
     from v_chess.piece import Pawn, King, Rook
-    from v_chess.rules.chess960 import Chess960Rules
     if isinstance(piece, King):
-         if abs(move.start.col - move.end.col) < 2:
-              if isinstance(rules, Chess960Rules):
-                   target = state.board.get_piece(move.end)
-                   if isinstance(target, Rook) and target.color == piece.color:
-                        return None
-              return None
-         elif abs(move.start.col - move.end.col) == 2:
+         # Castling onto the own rook may span any distance; its path is
+         # checked by the castling validator.
+         if rules.allows_king_rook_castling:
+              target = state.board.get_piece(move.end)
+              if isinstance(target, Rook) and target.color == piece.color:
+                   return None
+         if abs(move.start.col - move.end.col) <= 2:
               return None
 
     from v_chess.piece import Knight
     if isinstance(piece, Knight):
         return None
 
+    bb = state.board.bitboard
+    start, end = move.start.index, move.end.index
     if isinstance(piece, Pawn):
         direction = piece.direction
         one_step = move.start.get_step(direction)
         two_step = one_step.get_step(direction) if one_step and not one_step.is_none_square else None
         if move.end == two_step:
-            if state.board.get_piece(one_step) is not None or state.board.get_piece(two_step) is not None:
+            if bb.occupied & (1 << one_step.index | 1 << end):
                 return MoveLegalityReason.PATH_BLOCKED
             return None
 
-    unblocked = rules.unblocked_paths(state.board, piece, piece.theoretical_move_paths(move.start))
-    if move.end not in unblocked:
+    # The destination must be reachable on an empty board, free of own
+    # pieces, with nothing in between.
+    if (
+        not PSEUDO_MOVES[piece.color][type(piece)][start] & (1 << end)
+        or bb.occupied_co[piece.color] & (1 << end)
+        or bb.occupied & BETWEEN[start][end]
+    ):
         return MoveLegalityReason.PATH_BLOCKED
-        
     return None
 
 def validate_pawn_capture(state: "GameState", move: "Move", rules: "Rules") -> Optional[MoveLegalityReason]:
@@ -155,8 +158,7 @@ def validate_promotion(state: "GameState", move: "Move", rules: "Rules") -> Opti
         if not is_pawn or not is_promo_rank:
             return MoveLegalityReason.EARLY_PROMOTION
         if isinstance(move.promotion_piece, King):
-            from v_chess.rules.antichess import AntichessRules
-            if not isinstance(rules, AntichessRules):
+            if not rules.king_promotion_allowed:
                 return MoveLegalityReason.KING_PROMOTION
             
     return None
@@ -173,12 +175,12 @@ def validate_standard_castling(state: "GameState", move: "Move", rules: "Rules")
 
 def validate_king_safety(state: "GameState", move: "Move", rules: "Rules") -> Optional[MoveLegalityReason]:
     """Ensures the move does not leave the player's own King in check."""
-    from v_chess.piece import King
-    has_king = any(isinstance(p, King) and p.color == state.turn for p in state.board.values())
-    if has_king and rules.king_left_in_check(state, move):
+    if state.check_info.king_sq != -1 and rules.king_left_in_check(state, move):
         return MoveLegalityReason.KING_LEFT_IN_CHECK
     return None
 
+validate_king_safety.checks_full_legality = True
+
 def validate_mandatory_capture(state: "GameState", move: "Move", rules: "Rules") -> Optional[MoveLegalityReason]:
     """Enforces mandatory captures (e.g., in Antichess)."""
     from v_chess.piece import Pawn
@@ -190,52 +192,11 @@ def validate_mandatory_capture(state: "GameState", move: "Move", rules: "Rules")
         if piece and isinstance(piece, Pawn) and move.end == state.ep_square:
             is_capture = True
     
-    if is_capture:
-        return None
-        
-    # If we got here, the current move is NOT a capture. 
-    # We must check if ANY other legal move IS a capture.
-    
-    # OPTIMIZATION: Check if this state has been cached for captures.
-    cached_has_cap = getattr(state, "_has_mandatory_captures", None)
-    if cached_has_cap is not None:
-        if cached_has_cap:
-            return MoveLegalityReason.MANDATORY_CAPTURE
+    if is_capture or not has_capture(state):
         return None
+    return MoveLegalityReason.MANDATORY_CAPTURE
 
-    has_cap = False
-    possible_moves = rules.get_possible_moves(state)
-    for opt_move in possible_moves:
-        # We only check for physical captures here to avoid recursion back into validate_mandatory_capture.
-        # A move is a capture if it ends on a piece or is an EP move.
-        opt_is_cap = state.board.get_piece(opt_move.end) is not None
-        if not opt_is_cap:
-            opt_piece = state.board.get_piece(opt_move.start)
-            if opt_piece and isinstance(opt_piece, Pawn) and opt_move.end == state.ep_square:
-                opt_is_cap = True
-        
-        if opt_is_cap:
-            # Check pseudo-legality (except mandatory capture itself)
-            # This is tricky because we don't want to call validate_move which calls us.
-            # We check the other validators.
-            validators_to_check = [v for v in rules.move_validators if v != validate_mandatory_capture]
-            is_pseudo_legal = True
-            for val in validators_to_check:
-                if val(state, opt_move, rules) is not None:
-                    is_pseudo_legal = False
-                    break
-            
-            if is_pseudo_legal:
-                has_cap = True
-                break
-    
-    # Cache the result on the state object for subsequent moves in the same validation batch.
-    # Use object.__setattr__ because GameState is a frozen dataclass.
-    object.__setattr__(state, "_has_mandatory_captures", has_cap)
-    if has_cap:
-        return MoveLegalityReason.MANDATORY_CAPTURE
-    
-    return None
+validate_mandatory_capture.checks_full_legality = True
 
 def validate_horde_pawn(state: "GameState", move: "Move", rules: "Rules") -> Optional[MoveLegalityReason]:
     """Handles Horde-specific pawn rules (rank 1 double push)."""
@@ -271,10 +232,8 @@ def validate_crazyhouse_drop(state: "GameState", move: "Move", rules: "Rules") -
         return MoveLegalityReason.NO_PIECE
 
     pocket_idx = 0 if state.turn == Color.WHITE else 1
-    pocket = state.pockets[pocket_idx]
-
-    has_piece = any(type(p) == type(move.drop_piece) for p in pocket)
-    if not has_piece:
+    type_idx = POCKET_INDEX.get(type(move.drop_piece))
+    if type_idx is None or not state.pockets[pocket_idx][type_idx]:
         return MoveLegalityReason.NO_PIECE
 
     if state.board.get_piece(move.end) is not None:
@@ -287,60 +246,21 @@ def validate_crazyhouse_drop(state: "GameState", move: "Move", rules: "Rules") -
 
 def validate_atomic_move(state: "GameState", move: "Move", rules: "Rules") -> Optional[MoveLegalityReason]:
     """Enforces Atomic-specific move constraints."""
-    from v_chess.piece import King, Pawn
-    from v_chess.enums import Direction
-    from dataclasses import replace
-    
-    piece = state.board.get_piece(move.start)
-    if isinstance(piece, King):
-        if state.board.get_piece(move.end) or move.end == state.ep_square:
-            return MoveLegalityReason.OWN_PIECE_CAPTURE
-
-    sim_board = state.board.copy()
-    sim_board.move_piece(piece, move.start, move.end)
-    
-    is_ep = isinstance(piece, Pawn) and move.end == state.ep_square
-    if is_ep:
-        d = Direction.DOWN if piece.color == Color.WHITE else Direction.UP
-        sim_board.remove_piece(move.end.adjacent(d))
-        
-    dummy_next = replace(state, board=sim_board, turn=state.turn.opposite)
-    final_state = rules.post_move_actions(state, move, dummy_next)
-    
-    own_king_exists = any(isinstance(p, King) and p.color == state.turn 
-                          for p in final_state.board.values())
-
-    if not own_king_exists:
-        return MoveLegalityReason.KING_EXPLODED
-
-    opp_king_exists = any(isinstance(p, King) and p.color == state.turn.opposite 
-                           for p in final_state.board.values())
-
-    if not opp_king_exists:
-        return None
-
-    if rules.inactive_player_in_check(final_state):
-         return MoveLegalityReason.KING_LEFT_IN_CHECK
+    return atomic_move_reason(state, move.start.index, move.end.index)
 
-    wk = [sq for sq, p in final_state.board.items() if isinstance(p, King) and p.color == Color.WHITE]
-    bk = [sq for sq, p in final_state.board.items() if isinstance(p, King) and p.color == Color.BLACK]
-    if wk and bk and wk[0].is_adjacent_to(bk[0]):
-        return MoveLegalityReason.KING_EXPLODED
-
-    return None
+validate_atomic_move.checks_full_legality = True
 
 def validate_racing_kings_move(state: "GameState", move: "Move", rules: "Rules") -> Optional[MoveLegalityReason]:
     """Enforces Racing Kings constraints."""
-    next_state = rules.apply_move(state, move)
-    
-    if rules.is_check(next_state):
+    piece = move.promotion_piece or state.board.get_piece(move.start)
+    if gives_check(state, move.start.index, move.end.index, type(piece)):
         return MoveLegalityReason.GIVES_CHECK
-
-    if rules.inactive_player_in_check(next_state):
-         return MoveLegalityReason.KING_LEFT_IN_CHECK
-         
+    if rules.king_left_in_check(state, move):
+        return MoveLegalityReason.KING_LEFT_IN_CHECK
     return None
 
+validate_racing_kings_move.checks_full_legality = True
+
 def validate_chess960_castling(state: "GameState", move: "Move", rules: "Rules") -> Optional[MoveLegalityReason]:
     """Validates 960-specific castling."""
     piece = state.board.get_piece(move.start)
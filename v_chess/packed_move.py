@@ -0,0 +1,165 @@
+from array import array
+from typing import Iterator
+
+from v_chess.enums import Color
+from v_chess.move import Move
+from v_chess.piece import Piece, Pawn, Knight, Bishop, Rook, Queen, King, piece_from_char
+from v_chess.square import Square
+
+# A packed move is a 16-bit int:
+#   bits  0-5   destination square index
+#   bits  6-11  origin square index (0 for drops)
+#   bits 12-14  promotion piece type, or the dropped piece type for drops
+#   bit  15     drop flag
+# Packed moves carry no color; the side to move supplies it when converting
+# back. The Move for each packed value is built once per color and reused.
+TO_MASK = 0x3F
+FROM_SHIFT = 6
+TYPE_SHIFT = 12
+TYPE_MASK = 0x7
+DROP_FLAG = 1 << 15
+
+TYPE_CODES: dict[type[Piece], int] = {Pawn: 1, Knight: 2, Bishop: 3, Rook: 4, Queen: 5, King: 6}
+CODE_TYPES: dict[int, type[Piece]] = {code: p_type for p_type, code in TYPE_CODES.items()}
+
+_SQUARES = tuple(Square(divmod(idx, 8)) for idx in range(64))
+_MOVES: dict[Color, list[Move | None]] = {
+    Color.WHITE: [None] * (1 << 16),
+    Color.BLACK: [None] * (1 << 16),
+}
+
+
+def pack(start: int, end: int, promotion: type[Piece] | None = None) -> int:
+    """Packs a board move.
+
+    Args:
+        start: Origin square index.
+        end: Destination square index.
+        promotion: Piece type promoted to, if any.
+
+    Returns:
+        The packed move.
+    """
+    packed = start << FROM_SHIFT | end
+    if promotion is not None:
+        packed |= TYPE_CODES[promotion] << TYPE_SHIFT
+    return packed
+
+
+def pack_drop(p_type: type[Piece], end: int) -> int:
+    """Packs a drop of a piece type onto a square index."""
+    return DROP_FLAG | TYPE_CODES[p_type] << TYPE_SHIFT | end
+
+
+def from_move(move: Move) -> int:
+    """Packs a Move.
+
+    Args:
+        move: The move to pack.
+
+    Returns:
+        The packed move.
+    """
+    if move.is_drop:
+        return pack_drop(type(move.drop_piece), move.end.index)
+    promotion = type(move.promotion_piece) if move.promotion_piece is not None else None
+    return pack(move.start.index, move.end.index, promotion)
+
+
+def to_move(packed: int, color: Color) -> Move:
+    """Returns the Move for a packed move.
+
+    The same Move instance is returned for equal arguments.
+
+    Args:
+        packed: The packed move.
+        color: The player making the move.
+
+    Returns:
+        The corresponding Move.
+    """
+    table = _MOVES[color]
+    move = table[packed]
+    if move is None:
+        end = _SQUARES[packed & TO_MASK]
+        code = packed >> TYPE_SHIFT & TYPE_MASK
+        if packed & DROP_FLAG:
+            move = Move(Square(None), end, None, CODE_TYPES[code](color), player_to_move=color)
+        else:
+            start = _SQUARES[packed >> FROM_SHIFT & TO_MASK]
+            promotion = CODE_TYPES[code](color) if code else None
+            move = Move(start, end, promotion, player_to_move=color)
+        table[packed] = move
+    return move
+
+
+def from_uci(uci: str) -> int:
+    """Packs a UCI string such as 'e2e4', 'a7a8q' or 'N@f3'.
+
+    Raises:
+        ValueError: If the string is not a valid UCI move.
+    """
+    if "@" in uci:
+        piece_char, square_str = uci.split("@")
+        if piece_char not in piece_from_char or not Move.is_square_valid(square_str):
+            raise ValueError(f"Invalid Drop UCI: {uci}")
+        return pack_drop(piece_from_char[piece_char], Square(square_str).index)
+    if not Move.is_uci_valid(uci):
+        raise ValueError(f"Invalid UCI string: {uci}")
+    promotion = piece_from_char[uci[4]] if len(uci) == 5 else None
+    return pack(Square(uci[:2]).index, Square(uci[2:4]).index, promotion)
+
+
+def to_uci(packed: int, color: Color) -> str:
+    """Returns the UCI string of a packed move, as Move.uci spells it."""
+    return to_move(packed, color).uci
+
+
+class MoveList:
+    """A growable list of packed moves backed by an unsigned 16-bit array.
+
+    The buffer is allocated once and reused across clear() calls, so a
+    search can keep one MoveList per ply.
+    """
+
+    def __init__(self, capacity: int = 256):
+        """Initializes an empty MoveList.
+
+        Args:
+            capacity: Number of moves to preallocate room for.
+        """
+        self._data = array("H", bytes(2 * capacity))
+        self._len = 0
+
+    def append(self, packed: int):
+        """Adds a packed move."""
+        if self._len == len(self._data):
+            self._data.extend(array("H", bytes(2 * len(self._data))))
+        self._data[self._len] = packed
+        self._len += 1
+
+    def clear(self):
+        """Removes all moves, keeping the buffer."""
+        self._len = 0
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, idx: int) -> int:
+        if not -self._len <= idx < self._len:
+            raise IndexError("MoveList index out of range")
+        return self._data[idx % self._len]
+
+    def __iter__(self) -> Iterator[int]:
+        data = self._data
+        for idx in range(self._len):
+            yield data[idx]
+
+    def to_moves(self, color: Color) -> list[Move]:
+        """Converts the packed moves to Moves for the given player."""
+        table = _MOVES[color]
+        moves = []
+        for packed in self:
+            move = table[packed]
+            moves.append(move if move is not None else to_move(packed, color))
+        return moves
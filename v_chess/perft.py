@@ -0,0 +1,217 @@
+import time
+from dataclasses import dataclass
+
+from v_chess.game_over_conditions import (
+    evaluate_checkmate, evaluate_stalemate, evaluate_repetition, evaluate_fifty_move_rule
+)
+from v_chess.game_state import GameState
+from v_chess.position import Position
+from v_chess.rules import (
+    Rules, StandardRules, AntichessRules, AtomicRules, Chess960Rules,
+    CrazyhouseRules, HordeRules, KingOfTheHillRules, RacingKingsRules,
+    ThreeCheckRules
+)
+
+VARIANTS: dict[str, type[Rules]] = {
+    "standard": StandardRules,
+    "antichess": AntichessRules,
+    "atomic": AtomicRules,
+    "chess960": Chess960Rules,
+    "crazyhouse": CrazyhouseRules,
+    "horde": HordeRules,
+    "kingofthehill": KingOfTheHillRules,
+    "racingkings": RacingKingsRules,
+    "threecheck": ThreeCheckRules,
+}
+
+# Perft counts paths through the move tree, so draws that depend on the game
+# history or clocks are ignored and "no legal moves" is covered by the
+# generator itself.
+_NON_TERMINAL_CONDITIONS = (
+    evaluate_checkmate, evaluate_stalemate, evaluate_repetition, evaluate_fifty_move_rule
+)
+
+
+@dataclass(frozen=True)
+class PerftPosition:
+    """A reference position with known node counts.
+
+    Attributes:
+        name: Short identifier of the position.
+        fen: The position to search from.
+        counts: Expected node counts, where counts[i] is the count at depth i + 1.
+    """
+    name: str
+    fen: str
+    counts: tuple[int, ...]
+
+
+@dataclass(frozen=True)
+class PerftResult:
+    """The outcome of a timed perft run.
+
+    Attributes:
+        nodes: Number of leaf nodes found.
+        seconds: Wall-clock time the search took.
+        divide: Node counts per root move in UCI, if requested.
+    """
+    nodes: int
+    seconds: float
+    divide: dict[str, int] | None = None
+
+    @property
+    def nodes_per_second(self) -> float:
+        """Search speed in leaf nodes per second."""
+        return self.nodes / self.seconds if self.seconds > 0 else 0.0
+
+
+REFERENCE_POSITIONS: dict[str, tuple[PerftPosition, ...]] = {
+    "standard": (
+        PerftPosition("start", "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1", (20, 400, 8902, 197281)),
+        PerftPosition("kiwipete", "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1", (48, 2039, 97862)),
+        PerftPosition("endgame", "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1", (14, 191, 2812, 43238)),
+        PerftPosition("promotions", "r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1", (6, 264, 9467)),
+        PerftPosition("discovered", "rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8", (44, 1486, 62379)),
+    ),
+    "chess960": (
+        PerftPosition("castling-hf", "bqnb1rkr/pp3ppp/3ppn2/2p5/5P2/P2P4/NPP1P1PP/BQ1BNRKR w HFhf - 2 9", (21, 528, 12189)),
+        PerftPosition("castling-he", "2nnrbkr/p1qppppp/8/1ppb4/6PP/3PP3/PPP2P2/BQNNRBKR w HEhe - 1 9", (21, 807, 18002)),
+        PerftPosition("castling-fb", "brqnkr1b/pppppppp/5n2/8/3P4/4P3/PPP2PPP/BRQNKRNB b FBfb - 0 2", (23, 480, 11769)),
+    ),
+    "atomic": (
+        PerftPosition("start", "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1", (20, 400, 8902)),
+        PerftPosition("explosions", "rnbqkb1r/pp1p1ppp/2p2n2/4p3/4P3/2N2N2/PPPP1PPP/R1BQKB1R w KQkq - 0 4", (29, 810, 24574)),
+    ),
+    "crazyhouse": (
+        PerftPosition("start", "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR[] w KQkq - 0 1", (20, 400, 8902, 197281)),
+        PerftPosition("pockets", "r1bqkbnr/pppp1ppp/2n5/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R[Pp] w KQkq - 2 3", (57, 3414, 141848)),
+    ),
+    "antichess": (
+        PerftPosition("start", "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w - - 0 1", (20, 400, 8067, 153299)),
+        PerftPosition("forced-capture", "rnbqkbnr/pppp1ppp/8/4p3/3P4/8/PPP1PPPP/RNBQKBNR w - - 0 2", (1, 29, 42, 215)),
+    ),
+    "horde": (
+        PerftPosition("start", "rnbqkbnr/pppppppp/8/1PP2PP1/PPPPPPPP/PPPPPPPP/PPPPPPPP/PPPPPPPP w kq - 0 1", (8, 128, 1274, 23310)),
+    ),
+    "racingkings": (
+        PerftPosition("start", "8/8/8/8/8/8/krbnNBRK/qrbnNBRQ w - - 0 1", (21, 421, 11264, 296242)),
+    ),
+    "threecheck": (
+        PerftPosition("start", "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1 +0+0", (20, 400, 8902, 197281)),
+        PerftPosition("two-checks", "r1bqkbnr/pppp1ppp/2n5/1B2p3/4P3/5N2/PPPP1PPP/RNBQK2R w KQkq - 4 4 +2+0", (32, 961, 30885, 920386)),
+    ),
+    "kingofthehill": (
+        PerftPosition("start", "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1", (20, 400, 8902, 197281)),
+        PerftPosition("kings", "8/8/8/2k5/8/8/3K4/8 w - - 0 1", (8, 58, 293, 2057)),
+    ),
+}
+
+
+def is_terminal(rules: Rules, state: GameState) -> bool:
+    """Checks whether a variant-specific win or draw ends the search at state.
+
+    Args:
+        rules: The rules of the variant being searched.
+        state: The position to check.
+
+    Returns:
+        True if the variant declares the game over regardless of legal moves.
+    """
+    for condition in rules.pipeline.game_over_conditions:
+        if condition in _NON_TERMINAL_CONDITIONS:
+            continue
+        if condition(state, rules):
+            return True
+    return False
+
+
+def perft(rules: Rules, state: GameState, depth: int, table: dict | None = None) -> int:
+    """Counts the leaf nodes of the legal move tree below state.
+
+    Args:
+        rules: The rules of the variant being searched.
+        state: The root position.
+        depth: Number of plies to search.
+        table: Optional transposition table reused across calls.
+
+    Returns:
+        The number of leaf nodes at the given depth.
+    """
+    return _perft(Position(state, rules), depth, table)
+
+
+def _perft(position: Position, depth: int, table: dict | None) -> int:
+    """Counts leaf nodes by making and unmaking moves on a Position."""
+    if depth == 0:
+        return 1
+    rules = position.rules
+    state = position.view()
+    if is_terminal(rules, state):
+        return 0
+
+    if table is not None:
+        key = (position.zobrist_key, depth)
+        if key in table:
+            return table[key]
+
+    moves = rules.generate_legal_moves(state)
+    if depth == 1:
+        nodes = len(moves)
+    else:
+        nodes = 0
+        for move in moves:
+            position.push(move)
+            nodes += _perft(position, depth - 1, table)
+            position.pop()
+
+    if table is not None:
+        table[key] = nodes
+    return nodes
+
+
+def divide(rules: Rules, state: GameState, depth: int, table: dict | None = None) -> dict[str, int]:
+    """Splits a perft count by root move.
+
+    Args:
+        rules: The rules of the variant being searched.
+        state: The root position.
+        depth: Number of plies to search, including the root move.
+        table: Optional transposition table reused across calls.
+
+    Returns:
+        A mapping of each root move in UCI to the leaf nodes below it.
+    """
+    if depth < 1 or is_terminal(rules, state):
+        return {}
+    position = Position(state, rules)
+    result = {}
+    for move in rules.generate_legal_moves(state):
+        position.push(move)
+        result[move.uci] = _perft(position, depth - 1, table)
+        position.pop()
+    return result
+
+
+def run_perft(rules: Rules, fen: str, depth: int, use_table: bool = False, split: bool = False) -> PerftResult:
+    """Runs a timed perft search from a FEN.
+
+    Args:
+        rules: The rules of the variant being searched.
+        fen: The root position.
+        depth: Number of plies to search.
+        use_table: Whether to use a transposition table.
+        split: Whether to record a divide breakdown.
+
+    Returns:
+        The node count, elapsed time and optional divide breakdown.
+    """
+    state = GameState.from_fen(fen)
+    table = {} if use_table else None
+    start = time.perf_counter()
+    if split:
+        breakdown = divide(rules, state, depth, table)
+        nodes = sum(breakdown.values())
+    else:
+        breakdown = None
+        nodes = perft(rules, state, depth, table)
+    return PerftResult(nodes, time.perf_counter() - start, breakdown)
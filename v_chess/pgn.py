@@ -0,0 +1,290 @@
+import re
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import IO, Iterable, Iterator
+
+from v_chess.enums import Color
+from v_chess.game import Game
+from v_chess.game_state import GameState
+from v_chess.rules import (
+    Rules, StandardRules, AntichessRules, AtomicRules, Chess960Rules, CrazyhouseRules,
+    HordeRules, KingOfTheHillRules, RacingKingsRules, ThreeCheckRules
+)
+from v_chess.san import san_to_move, uci_to_san
+
+# Variant header values, as written by lichess.
+VARIANT_NAMES: dict[type[Rules], str] = {
+    StandardRules: "Standard",
+    AntichessRules: "Antichess",
+    AtomicRules: "Atomic",
+    Chess960Rules: "Chess960",
+    CrazyhouseRules: "Crazyhouse",
+    HordeRules: "Horde",
+    KingOfTheHillRules: "King of the Hill",
+    RacingKingsRules: "Racing Kings",
+    ThreeCheckRules: "Three-check",
+}
+_RULES_BY_KEY = {name.replace(" ", "").replace("-", "").lower(): rules for rules, name in VARIANT_NAMES.items()}
+
+RESULTS = ("1-0", "0-1", "1/2-1/2", "*")
+SEVEN_TAG_ROSTER = ("Event", "Site", "Date", "Round", "White", "Black", "Result")
+_ROSTER_DEFAULTS = {"Event": "?", "Site": "?", "Date": "????.??.??", "Round": "?", "White": "?", "Black": "?"}
+_SUFFIX_NAGS = {"!": 1, "?": 2, "!!": 3, "??": 4, "!?": 5, "?!": 6}
+_LINE_LENGTH = 79
+
+_TAG = re.compile(r'\[\s*(\w+)\s+"((?:[^"\\]|\\.)*)"\s*\]')
+_TOKEN = re.compile(r"""
+    (?P<comment>\{) | (?P<rest_of_line>;) | (?P<open>\() | (?P<close>\)) |
+    (?P<nag>\$\d+) | (?P<result>1-0|0-1|1/2-1/2|\*) | (?P<number>\d+(?:\.+|(?![^\s(){};$]))) |
+    (?P<san>[^\s(){};$]+)
+""", re.VERBOSE)
+
+
+class TokenKind(Enum):
+    """Kinds of tokens in a PGN stream."""
+    TAG = "tag"
+    SAN = "san"
+    COMMENT = "comment"
+    NAG = "nag"
+    VARIATION_START = "("
+    VARIATION_END = ")"
+    RESULT = "result"
+
+
+def tokenize(handle: Iterable[str]) -> Iterator[tuple[TokenKind, object]]:
+    """Splits a PGN stream into tokens, one line at a time.
+
+    Move numbers are dropped and move suffix annotations such as '!?' are
+    emitted as their NAG. Tags are yielded as (name, value) pairs.
+
+    Args:
+        handle: A text file object or any iterable of lines.
+
+    Yields:
+        (kind, value) tuples.
+    """
+    comment: list[str] | None = None
+    for line in handle:
+        if comment is not None:
+            end = line.find("}")
+            if end == -1:
+                comment.append(line.rstrip("\n"))
+                continue
+            comment.append(line[:end])
+            yield TokenKind.COMMENT, "\n".join(comment).strip()
+            comment = None
+            line = line[end + 1:]
+        elif line.startswith("%"):
+            continue
+        elif line.lstrip().startswith("["):
+            for name, value in _TAG.findall(line):
+                yield TokenKind.TAG, (name, value.replace('\\"', '"').replace("\\\\", "\\"))
+            continue
+
+        pos = 0
+        while comment is None:
+            match = _TOKEN.search(line, pos)
+            if match is None:
+                break
+            pos = match.end()
+            kind = match.lastgroup
+            if kind == "comment":
+                end = line.find("}", pos)
+                if end == -1:
+                    comment = [line[pos:].rstrip("\n")]
+                else:
+                    yield TokenKind.COMMENT, line[pos:end].strip()
+                    pos = end + 1
+            elif kind == "rest_of_line":
+                yield TokenKind.COMMENT, line[pos:].strip()
+                break
+            elif kind == "open":
+                yield TokenKind.VARIATION_START, "("
+            elif kind == "close":
+                yield TokenKind.VARIATION_END, ")"
+            elif kind == "nag":
+                yield TokenKind.NAG, int(match.group()[1:])
+            elif kind == "result":
+                yield TokenKind.RESULT, match.group()
+            elif kind == "san":
+                san = match.group()
+                stripped = san.rstrip("!?")
+                if stripped:
+                    yield TokenKind.SAN, stripped
+                if stripped != san and san[len(stripped):] in _SUFFIX_NAGS:
+                    yield TokenKind.NAG, _SUFFIX_NAGS[san[len(stripped):]]
+
+    if comment is not None:
+        yield TokenKind.COMMENT, "\n".join(comment).strip()
+
+
+@dataclass(slots=True)
+class PGNGame:
+    """A game read from PGN.
+
+    Attributes:
+        headers: The tag pairs, in file order.
+        moves: The mainline moves in SAN, without annotations.
+        result: The game termination marker ('1-0', '0-1', '1/2-1/2' or '*').
+        comments: Comments on the mainline, keyed by the number of moves
+            played before them.
+        nags: Numeric annotation glyphs, keyed like comments.
+    """
+    headers: dict[str, str] = field(default_factory=dict)
+    moves: list[str] = field(default_factory=list)
+    result: str = "*"
+    comments: dict[int, str] = field(default_factory=dict)
+    nags: dict[int, list[int]] = field(default_factory=dict)
+
+    @property
+    def variant(self) -> str:
+        """The Variant header normalized to a key like 'kingofthehill'."""
+        return self.headers.get("Variant", "standard").replace(" ", "").replace("-", "").lower()
+
+    @property
+    def fen(self) -> str | None:
+        """The starting position from the FEN header, if any."""
+        return self.headers.get("FEN")
+
+    @property
+    def rules(self) -> Rules:
+        """A Rules instance for the game's variant; standard if unknown."""
+        return _RULES_BY_KEY.get(self.variant, StandardRules)()
+
+    def to_game(self) -> Game:
+        """Replays the mainline into a Game.
+
+        Raises:
+            ValueError: If a move is ambiguous or illegal.
+            IllegalMoveException: If a move is not legal.
+        """
+        game = Game(state=self.fen, rules=self.rules)
+        for san in self.moves:
+            game.take_turn(san_to_move(game.state, san, game.legal_move_index.moves))
+        return game
+
+
+def read_games(handle: Iterable[str]) -> Iterator[PGNGame]:
+    """Reads games from a PGN stream lazily.
+
+    Only the game being parsed is held in memory, so arbitrarily large
+    files can be streamed. Moves inside variations are skipped.
+
+    Args:
+        handle: A text file object or any iterable of lines.
+
+    Yields:
+        The games in the stream, in order.
+    """
+    game = PGNGame()
+    depth = 0
+    in_movetext = False
+    for kind, value in tokenize(handle):
+        if kind is TokenKind.TAG:
+            if in_movetext:
+                yield game
+                game, depth, in_movetext = PGNGame(), 0, False
+            name, text = value
+            game.headers[name] = text
+            continue
+
+        in_movetext = True
+        if kind is TokenKind.VARIATION_START:
+            depth += 1
+        elif kind is TokenKind.VARIATION_END:
+            depth = max(depth - 1, 0)
+        elif depth:
+            continue
+        elif kind is TokenKind.SAN:
+            game.moves.append(value)
+        elif kind is TokenKind.COMMENT:
+            ply = len(game.moves)
+            game.comments[ply] = f"{game.comments[ply]} {value}" if ply in game.comments else value
+        elif kind is TokenKind.NAG:
+            game.nags.setdefault(len(game.moves), []).append(value)
+        elif kind is TokenKind.RESULT:
+            game.result = value
+            yield game
+            game, in_movetext = PGNGame(), False
+
+    if in_movetext or game.headers:
+        yield game
+
+
+def game_result(game: Game) -> str:
+    """Returns the PGN result of a game, '*' while it is in progress."""
+    if not game.is_over:
+        return "*"
+    winner = game.winner
+    if winner == Color.WHITE.value:
+        return "1-0"
+    if winner == Color.BLACK.value:
+        return "0-1"
+    return "*" if winner == "aborted" else "1/2-1/2"
+
+
+def write_game(game: Game, headers: dict[str, str] | None = None) -> str:
+    """Exports a game as PGN.
+
+    The Seven Tag Roster is always written, followed by any extra headers
+    and, where needed, the Variant, SetUp and FEN headers. SAN is derived
+    from the UCI history in one replay.
+
+    Args:
+        game: The game to export.
+        headers: Tag pairs to write, overriding the defaults.
+
+    Returns:
+        The game in PGN, ending with a blank line.
+    """
+    start = game.history[0] if game.history else game.state
+    result = game_result(game)
+
+    tags = {**_ROSTER_DEFAULTS, **(headers or {}), "Result": result}
+    variant = VARIANT_NAMES.get(type(game.rules))
+    if variant and variant != "Standard":
+        tags.setdefault("Variant", variant)
+    if start.fen != GameState.STARTING_FEN:
+        tags.setdefault("SetUp", "1")
+        tags.setdefault("FEN", start.fen)
+    ordered = [*SEVEN_TAG_ROSTER, *(name for name in tags if name not in SEVEN_TAG_ROSTER)]
+    lines = [f'[{name} "{_escape(tags[name])}"]' for name in ordered]
+    lines.append("")
+
+    tokens = []
+    number, turn = start.fullmove_count, start.turn
+    for i, san in enumerate(uci_to_san(game.rules, start, game.uci_history)):
+        if turn == Color.WHITE:
+            tokens.append(f"{number}.")
+        elif i == 0:
+            tokens.append(f"{number}...")
+        tokens.append(san)
+        if turn == Color.BLACK:
+            number += 1
+        turn = turn.opposite
+    tokens.append(result)
+    lines.extend(_wrap(tokens))
+    return "\n".join(lines) + "\n\n"
+
+
+def write_games(games: Iterable[Game], handle: IO[str]):
+    """Writes games to a text file object as PGN, one at a time."""
+    for game in games:
+        handle.write(write_game(game))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"')
+
+
+def _wrap(tokens: list[str]) -> list[str]:
+    """Joins movetext tokens into lines of at most _LINE_LENGTH characters."""
+    lines, line = [], ""
+    for token in tokens:
+        if line and len(line) + 1 + len(token) > _LINE_LENGTH:
+            lines.append(line)
+            line = token
+        else:
+            line = f"{line} {token}" if line else token
+    lines.append(line)
+    return lines
@@ -1,4 +1,4 @@
-from .piece import Piece
+from .piece import Piece, piece_of
 from .rook import Rook
 from .knight import Knight
 from .bishop import Bishop
@@ -22,3 +22,8 @@ piece_from_char: dict[str, type[Piece]] = {
     "p": Pawn,
 }
 
+# Crazyhouse pockets count the pieces of each droppable type, in this order.
+POCKET_TYPES: tuple[type[Piece], ...] = (Pawn, Knight, Bishop, Rook, Queen)
+POCKET_INDEX: dict[type[Piece], int] = {p_type: idx for idx, p_type in enumerate(POCKET_TYPES)}
+EMPTY_POCKETS: tuple[tuple[int, ...], tuple[int, ...]] = ((0,) * len(POCKET_TYPES),) * 2
+
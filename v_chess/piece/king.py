@@ -5,7 +5,7 @@ from v_chess.piece.piece import Piece
 from v_chess.enums import Color, Direction
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class King(Piece):
     """King piece representation.
 
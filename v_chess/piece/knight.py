@@ -4,7 +4,7 @@ from v_chess.enums import Color, Direction
 from v_chess.piece.piece import Piece
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Knight(Piece):
     """Knight piece representation.
 
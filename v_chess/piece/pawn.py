@@ -5,7 +5,7 @@ from v_chess.enums import Color, Direction
 from v_chess.piece.piece import Piece
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Pawn(Piece):
     """Pawn piece representation.
 
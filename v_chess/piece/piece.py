@@ -6,7 +6,10 @@ from v_chess.square import Square
 from v_chess.enums import Color, Direction
 
 
-@dataclass(frozen=True)
+_INSTANCES: dict[tuple[type, Color], "Piece"] = {}
+
+
+@dataclass(frozen=True, slots=True)
 class Piece(ABC):
     """Abstract base class for all chess pieces.
 
@@ -17,6 +20,21 @@ class Piece(ABC):
     color: Color
     MAX_STEPS = 7
 
+    def __new__(cls, color: Color) -> "Piece":
+        """Returns the shared instance for this piece type and color.
+
+        Pieces are immutable, so one instance per (type, color) is interned
+        and reused instead of allocating a new object for every lookup.
+        """
+        instance = _INSTANCES.get((cls, color))
+        if instance is None:
+            instance = object.__new__(cls)
+            _INSTANCES[(cls, color)] = instance
+        return instance
+
+    def __reduce__(self):
+        return type(self), (self.color,)
+
     @property
     @abstractmethod
     def moveset(self) -> set[Direction]:
@@ -89,3 +107,12 @@ class Piece(ABC):
         """
         return list(chain.from_iterable(self.capture_paths(start)))
 
+
+def piece_of(p_type: type[Piece], color: Color) -> Piece:
+    """Returns the interned piece of a type and color.
+
+    Equivalent to p_type(color) but skips the constructor once the piece
+    has been created.
+    """
+    instance = _INSTANCES.get((p_type, color))
+    return instance if instance is not None else p_type(color)
@@ -4,7 +4,7 @@ from v_chess.piece.piece import Piece
 from v_chess.enums import Color, Direction
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Rook(Piece):
     """Rook piece representation.
 
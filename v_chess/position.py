@@ -0,0 +1,346 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from v_chess.board import Board
+from v_chess.castling import castling_right_for_move, mask_after_move, rights_from_mask, rights_mask
+from v_chess.enums import Color, CastlingRight
+from v_chess.game_state import GameState, ThreeCheckGameState, CrazyhouseGameState
+from v_chess.move import Move
+from v_chess.piece import Piece, Pawn, Rook, King, POCKET_INDEX, EMPTY_POCKETS
+from v_chess.square import Square
+from v_chess import zobrist
+
+if TYPE_CHECKING:
+    from v_chess.rules import Rules
+
+
+@dataclass(slots=True)
+class UndoRecord:
+    """Everything needed to take back one pushed move.
+
+    Attributes:
+        move: The move that was pushed.
+        toggles: Bitboard bits flipped by the move as (square index, piece
+            type, color); flipping them again in reverse order restores the
+            board.
+        turn: Side to move before the move.
+        castling_mask: Castling rights mask before the move.
+        castling_rights: The rights tuple derived from it, if any was.
+        ep_square: En passant target before the move.
+        halfmove_clock: Halfmove clock before the move.
+        fullmove_count: Fullmove count before the move.
+        zobrist_key: Zobrist key before the move.
+        pockets: Crazyhouse pockets before the move, if tracked.
+        checks: Three-check counters before the move, if tracked.
+        explosion_square: Atomic explosion square before the move.
+    """
+    move: Move
+    toggles: list[tuple[int, type[Piece], Color]]
+    turn: Color
+    castling_mask: int
+    castling_rights: tuple[CastlingRight, ...] | None
+    ep_square: Square | None
+    halfmove_clock: int
+    fullmove_count: int
+    zobrist_key: int
+    pockets: tuple[tuple[int, ...], tuple[int, ...]] | None
+    checks: tuple[int, int] | None
+    explosion_square: Square | None
+
+
+class Position:
+    """A mutable position that makes and unmakes moves in place.
+
+    Intended for search, perft and bulk replay, where allocating a new
+    GameState per move dominates the cost. The board's bitboards are
+    updated in place and every push records an UndoRecord so pop can
+    restore the previous position exactly. GameState remains the immutable
+    type at API boundaries: use snapshot() to hand a position to callers.
+
+    Attributes:
+        rules: The rules whose move semantics are applied.
+        board: The board, mutated in place.
+        turn: The color to move.
+        castling_mask: Available castling rights as a mask of RIGHT_BITS.
+        castling_rights: The same rights as a tuple, derived on demand.
+        ep_square: The en passant target square, if any.
+        halfmove_clock: Number of halfmoves since the last capture or pawn move.
+        fullmove_count: The number of the full move.
+        zobrist_key: Zobrist key of the current position.
+        pockets: Crazyhouse pockets, or None when the variant has none.
+        checks: Three-check counters, or None when the variant has none.
+        explosion_square: The square of the last Atomic explosion.
+    """
+
+    def __init__(self, state: GameState, rules: "Rules"):
+        """Initializes a Position from a GameState.
+
+        Args:
+            state: The starting position; its board is copied.
+            rules: The rules whose move semantics are applied.
+        """
+        self.rules = rules
+        self.board = state.board.copy()
+        self.turn = state.turn
+        self.castling_mask = rights_mask(state.castling_rights)
+        self._castling_rights = state.castling_rights
+        self.ep_square = state.ep_square
+        self.halfmove_clock = state.halfmove_clock
+        self.fullmove_count = state.fullmove_count
+        self.zobrist_key = state.zobrist_key
+        self.pockets = state.pockets if isinstance(state, CrazyhouseGameState) else None
+        self.checks = state.checks if isinstance(state, ThreeCheckGameState) else None
+        self.explosion_square = state.explosion_square
+        self._stack: list[UndoRecord] = []
+        self._toggles: list[tuple[int, type[Piece], Color]] = []
+
+    @classmethod
+    def from_fen(cls, fen: str, rules: "Rules") -> Position:
+        """Creates a Position from a FEN string."""
+        return cls(GameState.from_fen(fen), rules)
+
+    @property
+    def castling_rights(self) -> tuple[CastlingRight, ...]:
+        """Returns the castling rights, sorted by their FEN letter once changed."""
+        if self._castling_rights is None:
+            self._castling_rights = rights_from_mask(self.castling_mask)
+        return self._castling_rights
+
+    def __len__(self) -> int:
+        """Returns the number of moves that can be popped."""
+        return len(self._stack)
+
+    def view(self) -> GameState:
+        """Returns a GameState sharing this position's board.
+
+        The view is only valid until the next push or pop. It lets the
+        GameState based generators and validators inspect the position
+        without copying the board.
+        """
+        return self._state(self.board)
+
+    def snapshot(self) -> GameState:
+        """Returns an independent GameState of the current position."""
+        return self._state(self.board.copy())
+
+    def _state(self, board: Board) -> GameState:
+        fields = dict(
+            board=board,
+            turn=self.turn,
+            castling_rights=self.castling_rights,
+            ep_square=self.ep_square,
+            halfmove_clock=self.halfmove_clock,
+            fullmove_count=self.fullmove_count,
+            explosion_square=self.explosion_square,
+            zobrist=self.zobrist_key,
+        )
+        if self.pockets is not None:
+            return CrazyhouseGameState(**fields, pockets=self.pockets)
+        if self.checks is not None:
+            return ThreeCheckGameState(**fields, checks=self.checks)
+        return GameState(**fields)
+
+    def legal_moves(self) -> list[Move]:
+        """Generates the legal moves of the current position."""
+        return self.rules.generate_legal_moves(self.view())
+
+    # -------------------------------------------------------------------------
+    # Make / unmake
+    # -------------------------------------------------------------------------
+
+    def push(self, move: Move):
+        """Makes a move in place, with the same semantics as Rules.apply_move.
+
+        The move is not validated.
+
+        Args:
+            move: The move to make.
+        """
+        self._toggles = []
+        self._stack.append(UndoRecord(
+            move, self._toggles, self.turn, self.castling_mask, self._castling_rights, self.ep_square,
+            self.halfmove_clock, self.fullmove_count, self.zobrist_key,
+            self.pockets, self.checks, self.explosion_square
+        ))
+        mover = self.turn
+        if mover == Color.BLACK:
+            self.fullmove_count += 1
+        self.turn = mover.opposite
+        self.zobrist_key ^= zobrist.BLACK_TO_MOVE_KEY
+        self.explosion_square = None
+
+        if move.is_drop:
+            self.set_piece(move.drop_piece, move.end)
+            self.halfmove_clock += 1
+            self.set_ep_square(None)
+            self.rules.post_push_actions(self, move, None)
+            return
+
+        piece = self.board.get_piece(move.start)
+        target = self.board.get_piece(move.end)
+
+        is_castling = False
+        rook_sq = None
+        if isinstance(piece, King):
+            if isinstance(target, Rook) and target.color == piece.color:
+                is_castling = True
+                rook_sq = move.end
+            elif abs(move.start.col - move.end.col) > 1:
+                is_castling = True
+
+        is_en_passant = isinstance(piece, Pawn) and move.end == self.ep_square
+        # A king moving onto its own rook castles rather than captures.
+        captured = target if rook_sq is None else None
+        if is_en_passant:
+            captured = self.board.get_piece(self._square_behind(move.end, piece.color))
+
+        if isinstance(piece, Pawn) or captured is not None:
+            self.halfmove_clock = 0
+        else:
+            self.halfmove_clock += 1
+
+        right = None
+        if is_castling:
+            right, rook_idx = castling_right_for_move(
+                self.castling_rights, self.board.bitboard.pieces, piece.color,
+                move.start.index, move.end.index, rook_sq is not None
+            )
+            if right:
+                rook_sq = Square(divmod(rook_idx, 8))
+        # Rights follow the rooks as they stand before the move.
+        mask = mask_after_move(
+            self.castling_mask, self.board.bitboard.pieces, piece, target, move.start.index, move.end.index,
+            rook_sq.index if is_castling and rook_sq else None
+        )
+
+        if right:
+            rook = self.board.get_piece(rook_sq)
+            rank = move.start.row
+            if rook_sq.col < move.start.col:
+                king_dest, rook_dest = Square(rank, 2), Square(rank, 3)
+            else:
+                king_dest, rook_dest = Square(rank, 6), Square(rank, 5)
+            self.remove_piece(move.start)
+            self.remove_piece(rook_sq)
+            self.set_piece(piece, king_dest)
+            if rook:
+                self.set_piece(rook, rook_dest)
+        else:
+            self.remove_piece(move.start)
+            self.set_piece(piece, move.end)
+
+        if is_en_passant:
+            self.remove_piece(self._square_behind(move.end, piece.color))
+
+        if move.promotion_piece is not None:
+            self.set_piece(move.promotion_piece, move.end)
+
+        # Like apply_move, a board move leaves the rights sorted.
+        self.set_castling_mask(mask)
+
+        new_ep_square = None
+        if isinstance(piece, Pawn) and abs(move.start.row - move.end.row) > 1:
+            new_ep_square = self._square_behind(move.end, piece.color)
+        self.set_ep_square(new_ep_square)
+
+        self.rules.post_push_actions(self, move, captured)
+
+    def pop(self) -> Move:
+        """Takes back the last pushed move.
+
+        Returns:
+            The move that was taken back.
+
+        Raises:
+            IndexError: If there is no move to take back.
+        """
+        record = self._stack.pop()
+        bb = self.board.bitboard
+        for sq_idx, p_type, color in reversed(record.toggles):
+            bb.toggle_piece(sq_idx, p_type, color)
+
+        self.turn = record.turn
+        self.castling_mask = record.castling_mask
+        self._castling_rights = record.castling_rights
+        self.ep_square = record.ep_square
+        self.halfmove_clock = record.halfmove_clock
+        self.fullmove_count = record.fullmove_count
+        self.zobrist_key = record.zobrist_key
+        self.pockets = record.pockets
+        self.checks = record.checks
+        self.explosion_square = record.explosion_square
+        return record.move
+
+    # -------------------------------------------------------------------------
+    # In-place edits used by push and by variant hooks
+    # -------------------------------------------------------------------------
+
+    def remove_piece(self, square: Square) -> Piece | None:
+        """Removes and returns the piece on a square, if any."""
+        piece = self.board.bitboard.mailbox[square.index]
+        if piece is not None:
+            self._toggle(square.index, type(piece), piece.color)
+        return piece
+
+    def set_piece(self, piece: Piece, square: Square):
+        """Places a piece on a square, replacing any piece already there."""
+        self.remove_piece(square)
+        self._toggle(square.index, type(piece), piece.color)
+
+    def set_castling_rights(self, rights: tuple[CastlingRight, ...]):
+        """Replaces the castling rights."""
+        self.set_castling_mask(rights_mask(rights))
+        self._castling_rights = rights
+
+    def set_castling_mask(self, mask: int):
+        """Replaces the castling rights by their mask."""
+        self.zobrist_key ^= zobrist.castling_key(self.castling_mask ^ mask)
+        self.castling_mask = mask
+        self._castling_rights = None
+
+    def set_ep_square(self, ep_square: Square | None):
+        """Replaces the en passant target square."""
+        self.zobrist_key ^= zobrist.ep_key(self.ep_square) ^ zobrist.ep_key(ep_square)
+        self.ep_square = ep_square
+
+    def set_pockets(self, pockets: tuple[tuple[int, ...], tuple[int, ...]]):
+        """Replaces the Crazyhouse pockets."""
+        old = self.pockets if self.pockets is not None else EMPTY_POCKETS
+        self.zobrist_key ^= zobrist.pocket_key(old) ^ zobrist.pocket_key(pockets)
+        self.pockets = pockets
+
+    def add_to_pocket(self, color: Color, p_type: type[Piece], delta: int):
+        """Changes the count of a piece type in a Crazyhouse pocket.
+
+        Args:
+            color: The pocket's owner.
+            p_type: The piece type to count.
+            delta: Number of pieces added; negative to remove.
+        """
+        pockets = self.pockets if self.pockets is not None else EMPTY_POCKETS
+        side = 0 if color == Color.WHITE else 1
+        idx = POCKET_INDEX[p_type]
+        pocket = list(pockets[side])
+        old = pocket[idx]
+        pocket[idx] = old + delta
+        self.zobrist_key ^= zobrist.pocket_count_key(color, p_type, old) ^ zobrist.pocket_count_key(color, p_type, old + delta)
+        self.pockets = (tuple(pocket), pockets[1]) if side == 0 else (pockets[0], tuple(pocket))
+
+    def set_checks(self, checks: tuple[int, int]):
+        """Replaces the Three-check counters."""
+        old = self.checks if self.checks is not None else (0, 0)
+        self.zobrist_key ^= zobrist.checks_key(old) ^ zobrist.checks_key(checks)
+        self.checks = checks
+
+    def _toggle(self, sq_idx: int, p_type: type[Piece], color: Color):
+        """Flips one piece bit and records it for pop."""
+        self.board.bitboard.toggle_piece(sq_idx, p_type, color)
+        self.zobrist_key ^= zobrist.PIECE_KEYS[color][p_type][sq_idx]
+        self._toggles.append((sq_idx, p_type, color))
+
+    @staticmethod
+    def _square_behind(square: Square, color: Color) -> Square:
+        """Returns the square one step behind square from color's side."""
+        return Square(square.row + (1 if color == Color.WHITE else -1), square.col)
+
@@ -0,0 +1,132 @@
+import time
+from dataclasses import dataclass, field
+from itertools import islice
+from multiprocessing import Pool
+from typing import Iterable, Iterator
+
+from v_chess.game import Game
+from v_chess.pgn import PGNGame, game_result
+from v_chess.san import san_to_move
+
+
+@dataclass(frozen=True, slots=True)
+class ReplayResult:
+    """The outcome of replaying one game through Game.take_turn.
+
+    Attributes:
+        index: Position of the game in the input, starting at 0.
+        variant: Normalized variant key of the game.
+        plies: Number of moves played before the game ended or failed.
+        result: The PGN result reached by the replay, '*' if unfinished.
+        expected: The result recorded in the PGN.
+        error: Why the replay failed, or None if every move was played.
+        san: The move that failed, if any.
+        seconds: Time the replay took; not part of equality.
+    """
+    index: int
+    variant: str
+    plies: int
+    result: str
+    expected: str
+    error: str | None = None
+    san: str | None = None
+    seconds: float = field(default=0.0, compare=False)
+
+    @property
+    def ok(self) -> bool:
+        """Whether every move of the game was replayed."""
+        return self.error is None
+
+
+@dataclass(slots=True)
+class ReplayStats:
+    """Replay totals for one variant.
+
+    Attributes:
+        games: Number of games replayed.
+        plies: Number of moves played.
+        failures: Number of games that failed.
+        seconds: Summed replay time of the games.
+    """
+    games: int = 0
+    plies: int = 0
+    failures: int = 0
+    seconds: float = 0.0
+
+    def add(self, result: ReplayResult):
+        """Counts a game result."""
+        self.games += 1
+        self.plies += result.plies
+        self.failures += not result.ok
+        self.seconds += result.seconds
+
+    @property
+    def games_per_second(self) -> float:
+        """Games replayed per second of replay time."""
+        return self.games / self.seconds if self.seconds > 0 else 0.0
+
+    @property
+    def plies_per_second(self) -> float:
+        """Moves played per second of replay time."""
+        return self.plies / self.seconds if self.seconds > 0 else 0.0
+
+
+def replay_game(index: int, pgn_game: PGNGame) -> ReplayResult:
+    """Replays the mainline of a PGN game move by move.
+
+    Errors are captured in the result rather than raised, so one bad game
+    does not stop a bulk run.
+
+    Args:
+        index: Position of the game in the input.
+        pgn_game: The game to replay.
+
+    Returns:
+        The ReplayResult of the game.
+    """
+    start = time.perf_counter()
+    game = None
+    san = None
+    try:
+        game = Game(state=pgn_game.fen, rules=pgn_game.rules)
+        for san in pgn_game.moves:
+            game.take_turn(san_to_move(game.state, san, game.legal_move_index.moves))
+    except Exception as e:
+        return ReplayResult(
+            index, pgn_game.variant, len(game.uci_history) if game else 0,
+            game_result(game) if game else "*", pgn_game.result,
+            f"{type(e).__name__}: {e}", san, time.perf_counter() - start
+        )
+    return ReplayResult(
+        index, pgn_game.variant, len(game.uci_history), game_result(game), pgn_game.result,
+        seconds=time.perf_counter() - start
+    )
+
+
+def _replay_item(item: tuple[int, PGNGame]) -> ReplayResult:
+    return replay_game(*item)
+
+
+def replay_games(games: Iterable[PGNGame], workers: int = 1, chunksize: int = 8) -> Iterator[ReplayResult]:
+    """Replays games, optionally sharded across a process pool.
+
+    Games are read from the iterable in bounded batches and results are
+    yielded in input order, so memory stays flat on large inputs and the
+    output is identical for any number of workers.
+
+    Args:
+        games: The games to replay, e.g. from pgn.read_games.
+        workers: Number of processes; 1 replays in this process.
+        chunksize: Number of games sent to a worker at a time.
+
+    Yields:
+        A ReplayResult per game, in input order.
+    """
+    items = enumerate(games)
+    if workers <= 1:
+        for item in items:
+            yield _replay_item(item)
+        return
+    with Pool(workers) as pool:
+        while batch := list(islice(items, workers * chunksize * 4)):
+            yield from pool.imap(_replay_item, batch, chunksize)
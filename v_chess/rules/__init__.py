@@ -1,4 +1,4 @@
-from .core import Rules
+from .core import Rules, GameStatus
 from .standard import StandardRules
 from .antichess import AntichessRules
 from .king_of_the_hill import KingOfTheHillRules
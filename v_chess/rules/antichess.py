@@ -1,7 +1,8 @@
 from typing import List, Callable, Optional
 from v_chess.enums import Color, MoveLegalityReason, BoardLegalityReason, GameOverReason
 from v_chess.move import Move
-from v_chess.piece import King, Pawn
+from v_chess.piece import King
+from v_chess.move_generator import generate_moves, has_capture, PROMOTION_TYPES
 from v_chess.game_state import GameState
 from v_chess.game_over_conditions import (
     evaluate_repetition, evaluate_fifty_move_rule, evaluate_antichess_win
@@ -23,6 +24,8 @@ from .standard import StandardRules
 
 
 class AntichessRules(StandardRules):
+    king_promotion_allowed = True
+
     @property
     def game_over_conditions(self) -> List[Callable[[GameState, "StandardRules"], Optional[GameOverReason]]]:
         return [
@@ -64,14 +67,21 @@ class AntichessRules(StandardRules):
             pawn_double_push
         ]
 
+    def generate_legal_moves(self, state: GameState) -> list[Move]:
+        """Generates all legal moves, keeping only captures when one exists."""
+        return generate_moves(
+            state, king_safety=False, promotion_types=PROMOTION_TYPES + (King,), captures_only=has_capture(state)
+        )
+
     def is_check(self, state: GameState) -> bool:
         return False
 
     def inactive_player_in_check(self, state: GameState) -> bool:
         return False
 
-    def get_winner(self, state: GameState) -> Color | None:
-        reason = self.get_game_over_reason(state)
+    def get_winner(self, state: GameState, reason: GameOverReason | None = None) -> Color | None:
+        if reason is None:
+            reason = self.get_game_over_reason(state)
         if reason == GameOverReason.ALL_PIECES_CAPTURED:
              white_pieces = any(p.color == Color.WHITE for p in state.board.values())
              if not white_pieces: return Color.WHITE
@@ -1,5 +1,5 @@
 from typing import List, Callable, Optional
-from v_chess.enums import GameOverReason, MoveLegalityReason, BoardLegalityReason, Color, Direction
+from v_chess.enums import GameOverReason, MoveLegalityReason, BoardLegalityReason, Color
 from v_chess.game_state import GameState
 from v_chess.move import Move
 from v_chess.piece import Pawn, King
@@ -7,17 +7,22 @@ from v_chess.game_over_conditions import evaluate_atomic_king_exploded
 from v_chess.move_validators import (
     validate_piece_presence, validate_turn, 
     validate_moveset, validate_friendly_capture, validate_pawn_capture, 
-    validate_path, validate_promotion, validate_atomic_move
+    validate_path, validate_promotion, validate_standard_castling, validate_atomic_move
 )
 from v_chess.state_validators import (
     atomic_king_count, pawn_on_backrank,
     pawn_count_standard, piece_count_promotion_consistency, castling_rights_consistency,
-    en_passant_target_validity, inactive_player_check_safety, atomic_kings_proximity
+    en_passant_target_validity, inactive_player_check_safety
 )
 from v_chess.special_moves import (
     PieceMoveRule, GlobalMoveRule, basic_moves,
     pawn_promotions, pawn_double_push, standard_castling
 )
+from v_chess.castling import rights_mask
+from v_chess.bitboard import AttackTables
+from v_chess.move_generator import explosion, generate_atomic_moves
+from v_chess.square import Square
+from v_chess import zobrist
 from .standard import StandardRules
 from dataclasses import replace
 
@@ -38,6 +43,7 @@ class AtomicRules(StandardRules):
             validate_pawn_capture,
             validate_path,
             validate_promotion,
+            validate_standard_castling,
             validate_atomic_move
         ]
 
@@ -51,7 +57,6 @@ class AtomicRules(StandardRules):
             piece_count_promotion_consistency,
             castling_rights_consistency,
             en_passant_target_validity,
-            atomic_kings_proximity,
             inactive_player_check_safety
         ]
 
@@ -65,6 +70,31 @@ class AtomicRules(StandardRules):
             standard_castling
         ]
 
+    def is_check(self, state: GameState) -> bool:
+        """Checks if the current player is in check; touching kings never are."""
+        return not self._kings_adjacent(state.board) and super().is_check(state)
+
+    def inactive_player_in_check(self, state: GameState) -> bool:
+        """Checks if the player who just moved is in check; touching kings never are."""
+        return not self._kings_adjacent(state.board) and super().inactive_player_in_check(state)
+
+    def generate_legal_moves(self, state: GameState) -> list[Move]:
+        """Generates the legal moves from the bitboards, castling included."""
+        return generate_atomic_moves(state) + self.get_legal_castling_moves(state)
+
+    def get_legal_castling_moves(self, state: GameState) -> list[Move]:
+        """Returns the castling moves accepted by the Atomic validator pipeline."""
+        moves = []
+        king_mask = state.board.bitboard.pieces[state.turn][King]
+        while king_mask:
+            sq_idx = (king_mask & -king_mask).bit_length() - 1
+            king_sq = Square(divmod(sq_idx, 8))
+            for move in standard_castling(state, king_sq, King(state.turn)):
+                if self.validate_move(state, move) == MoveLegalityReason.LEGAL:
+                    moves.append(move)
+            king_mask &= king_mask - 1
+        return moves
+
     def post_move_actions(self, old_state: GameState, move: Move, new_state: GameState) -> GameState:
         moving_piece = old_state.board.get_piece(move.start)
         target_piece = old_state.board.get_piece(move.end)
@@ -74,26 +104,41 @@ class AtomicRules(StandardRules):
             return new_state
             
         final_board = new_state.board.copy()
-        final_board.remove_piece(move.end)
-        
-        neighbors = [
-            move.end.adjacent(d) for d in Direction.straight_and_diagonal()
-        ]
-        
-        for sq in neighbors:
-            if not sq.is_none_square:
-                p = final_board.get_piece(sq)
-                if p and not isinstance(p, Pawn):
-                    final_board.remove_piece(sq)
-                    
+        bb = final_board.bitboard
+        key = new_state.zobrist_key
+        blast = explosion(bb, move.end.index, bb.occupied)
+        while blast:
+            sq = (blast & -blast).bit_length() - 1
+            p = bb.mailbox[sq]
+            key ^= zobrist.piece_key(p, sq)
+            bb.remove_piece(sq, p)
+            blast &= blast - 1
+
         new_rights = self._update_castling_rights_after_explosion(old_state, final_board)
+        key ^= zobrist.castling_key(rights_mask(new_state.castling_rights) ^ rights_mask(new_rights))
+        key ^= zobrist.ep_key(new_state.ep_square)
         
         return replace(new_state, 
                        board=final_board, 
                        castling_rights=new_rights,
                        ep_square=None, 
                        halfmove_clock=0, 
-                       explosion_square=move.end)
+                       explosion_square=move.end,
+                       zobrist=key)
+
+    def post_push_actions(self, position, move: Move, captured):
+        """Explodes the capture square of a pushed capture in place."""
+        if not captured:
+            return
+        bb = position.board.bitboard
+        blast = explosion(bb, move.end.index, bb.occupied)
+        while blast:
+            position.remove_piece(Square(divmod((blast & -blast).bit_length() - 1, 8)))
+            blast &= blast - 1
+        position.set_castling_rights(self._update_castling_rights_after_explosion(position, position.board))
+        position.set_ep_square(None)
+        position.halfmove_clock = 0
+        position.explosion_square = move.end
 
     def _update_castling_rights_after_explosion(self, state: GameState, board) -> tuple:
         from v_chess.enums import CastlingRight
@@ -109,15 +154,16 @@ class AtomicRules(StandardRules):
         return tuple(new_rights)
 
     def _kings_adjacent(self, board) -> bool:
-        wk = [sq for sq, p in board.items() if isinstance(p, King) and p.color == Color.WHITE]
-        bk = [sq for sq, p in board.items() if isinstance(p, King) and p.color == Color.BLACK]
-        if not wk or not bk: return False
-        return wk[0].is_adjacent_to(bk[0])
+        pieces = board.bitboard.pieces
+        white_kings = pieces[Color.WHITE][King]
+        if not white_kings:
+            return False
+        return bool(AttackTables.king_attacks((white_kings & -white_kings).bit_length() - 1) & pieces[Color.BLACK][King])
 
-    def get_winner(self, state: GameState) -> Color | None:
-        reason = self.get_game_over_reason(state)
+    def get_winner(self, state: GameState, reason: GameOverReason | None = None) -> Color | None:
+        if reason is None:
+            reason = self.get_game_over_reason(state)
         if reason == GameOverReason.KING_EXPLODED:
-            wk = any(isinstance(p, King) and p.color == Color.WHITE for p in state.board.values())
-            if not wk: return Color.BLACK
+            if not state.board.bitboard.pieces[Color.WHITE][King]: return Color.BLACK
             return Color.WHITE
-        return super().get_winner(state)
+        return super().get_winner(state, reason)
@@ -1,6 +1,7 @@
 from typing import List, Callable, Optional
 from v_chess.enums import GameOverReason, MoveLegalityReason, BoardLegalityReason, Color, CastlingRight
 from v_chess.move import Move
+from v_chess.castling import HOME_RANKS, castling_right_for_move
 from v_chess.piece import King, Rook
 from v_chess.square import Square
 from v_chess.game_state import GameState
@@ -24,6 +25,8 @@ from dataclasses import replace
 
 
 class Chess960Rules(StandardRules):
+    allows_king_rook_castling = True
+
     @property
     def move_validators(self) -> List[Callable[[GameState, Move, "StandardRules"], Optional[MoveLegalityReason]]]:
         """Returns a list of move validators."""
@@ -109,76 +112,75 @@ class Chess960Rules(StandardRules):
         
         return new_state
 
+    def get_legal_castling_moves(self, state: GameState) -> list[Move]:
+        """Returns all legal castling moves, each as the king taking its rook.
+
+        The king-to-target notation (c/g file) names the same castles and is
+        still accepted by validate_move, but listing it too would count every
+        castle twice. Castling candidates are rare and their 960 semantics
+        live in the validators, so each one is checked through the validator
+        pipeline.
+        """
+        if not any(r != CastlingRight.NONE and r.color == state.turn for r in state.castling_rights):
+            return []
+
+        moves = []
+        rook_mask = state.board.bitboard.pieces[state.turn][Rook]
+        king_mask = state.board.bitboard.pieces[state.turn][King]
+        while king_mask:
+            sq_idx = (king_mask & -king_mask).bit_length() - 1
+            king_sq = Square(divmod(sq_idx, 8))
+            for move in chess960_castling(state, king_sq, King(state.turn)):
+                is_castling_attempt = bool(rook_mask & (1 << move.end.index))
+                if is_castling_attempt and move not in moves and self.validate_move(state, move) == MoveLegalityReason.LEGAL:
+                    moves.append(move)
+            king_mask &= king_mask - 1
+        return moves
+
     def invalid_castling_rights(self, state: GameState) -> list[CastlingRight]:
+        pieces = state.board.bitboard.pieces
         invalid = []
         for right in state.castling_rights:
             if right == CastlingRight.NONE: continue
-            row = 7 if right.color == Color.WHITE else 0
-            
-            # Find the king on the correct rank
-            king_sq = next((sq for sq, p in state.board.items() 
-                            if isinstance(p, King) and p.color == right.color and sq.row == row), None)
-            if not king_sq:
+            rank = HOME_RANKS[right.color]
+            kings = pieces[right.color][King] & rank
+            rooks = pieces[right.color][Rook] & rank
+            if not kings or not rooks:
                 invalid.append(right)
                 continue
-
-            # In Chess960, K/Q might refer to the outermost rooks relative to the king
-            # if they are not at h/a.
-            rooks_on_rank = [sq for sq, p in state.board.items()
-                             if isinstance(p, Rook) and p.color == right.color and sq.row == row]
-            
-            if not rooks_on_rank:
-                invalid.append(right)
+            if rooks & (1 << right.expected_rook_square.index):
                 continue
 
-            # Check if specified rook exists
-            rook_sq = right.expected_rook_square
-            rook = state.board.get_piece(rook_sq)
-            
-            if not (isinstance(rook, Rook) and rook.color == right.color):
-                # Fallback for K/Q shorthand in non-standard positions
-                if right in (CastlingRight.WHITE_SHORT, CastlingRight.BLACK_SHORT):
-                    # K: needs at least one rook to the right of king
-                    if not any(r_sq.col > king_sq.col for r_sq in rooks_on_rank):
-                        invalid.append(right)
-                elif right in (CastlingRight.WHITE_LONG, CastlingRight.BLACK_LONG):
-                    # Q: needs at least one rook to the left of king
-                    if not any(r_sq.col < king_sq.col for r_sq in rooks_on_rank):
-                        invalid.append(right)
-                else:
-                    # Specific column right (A-H), already failed standard check above
+            # K/Q shorthand may name the outermost rook on either side of the
+            # king when it is not on the h or a file.
+            king_bit = kings & -kings
+            if right in (CastlingRight.WHITE_SHORT, CastlingRight.BLACK_SHORT):
+                if not rooks & ~(king_bit | king_bit - 1):
+                    invalid.append(right)
+            elif right in (CastlingRight.WHITE_LONG, CastlingRight.BLACK_LONG):
+                if not rooks & (king_bit - 1):
                     invalid.append(right)
-                    
+            else:
+                invalid.append(right)
         return invalid
 
     def castling_legality_reason(self, state: GameState, move: Move, piece: King) -> MoveLegalityReason:
-        target_king_sq = move.end
         row = 7 if piece.color == Color.WHITE else 0
-        
-        # Check if target is Rook (KxR notation)
-        target_piece = state.board.get_piece(target_king_sq)
-        if isinstance(target_piece, Rook) and target_piece.color == piece.color:
-             # Map to standard target based on direction
-             if target_king_sq.col > move.start.col:
-                 target_king_sq = Square(row, 6) # Kingside
-             else:
-                 target_king_sq = Square(row, 2) # Queenside
-
-        is_kingside = target_king_sq.col > move.start.col
-
-        right = None
-        if target_king_sq == Square(row, 6): # Kingside
-             for r in state.castling_rights:
-                 if r.color == piece.color and r.expected_rook_square.col > move.start.col:
-                     right = r; break
-        elif target_king_sq == Square(row, 2): # Queenside
-             for r in state.castling_rights:
-                 if r.color == piece.color and r.expected_rook_square.col < move.start.col:
-                     right = r; break
-
+        # Taken from the move itself: the king may already stand on its target.
+        is_kingside = move.end.col > move.start.col
+
+        # KxR notation names the rook; otherwise the c/g target picks the side.
+        target_piece = state.board.get_piece(move.end)
+        onto_rook = isinstance(target_piece, Rook) and target_piece.color == piece.color
+        if not onto_rook and move.end.col not in (2, 6):
+            return MoveLegalityReason.NO_CASTLING_RIGHT
+        right, rook_idx = castling_right_for_move(
+            state.castling_rights, state.board.bitboard.pieces, piece.color,
+            move.start.index, move.end.index, onto_rook
+        )
         if not right: return MoveLegalityReason.NO_CASTLING_RIGHT
 
-        rook_sq = right.expected_rook_square
+        rook_sq = Square(divmod(rook_idx, 8))
         target_king = Square(row, 6) if is_kingside else Square(row, 2)
         target_rook = Square(row, 5) if is_kingside else Square(row, 3)
 
@@ -198,13 +200,18 @@ class Chess960Rules(StandardRules):
 
         if self.is_check(state): return MoveLegalityReason.CASTLING_FROM_CHECK
 
+        # The king may already stand on its destination, in which case only
+        # the check test above applies.
+        attacked = state.check_info.attacked
         step = 1 if target_king.col > move.start.col else -1
-        curr_col = move.start.col + step
-        while True:
-            sq = Square(row, curr_col)
-            if self.is_under_attack(state.board, sq, piece.color.opposite):
+        for curr_col in range(move.start.col + step, target_king.col + step, step):
+            if attacked & (1 << (row * 8 + curr_col)):
                 return MoveLegalityReason.CASTLING_THROUGH_CHECK
-            if curr_col == target_king.col: break
-            curr_col += step
+
+        # The rook may have shielded the king's target along the rank.
+        bb = state.board.bitboard
+        occ = bb.occupied & ~(1 << move.start.index | 1 << rook_idx) | 1 << target_rook.index
+        if bb.attackers(target_king.index, piece.color.opposite, occ):
+            return MoveLegalityReason.CASTLING_THROUGH_CHECK
 
         return MoveLegalityReason.LEGAL
\ No newline at end of file
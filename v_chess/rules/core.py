@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from functools import cached_property
 from typing import TYPE_CHECKING, List, Callable, Optional
 
 from v_chess.enums import Color, MoveLegalityReason, BoardLegalityReason, GameOverReason
@@ -6,22 +8,91 @@ from v_chess.move import Move
 
 if TYPE_CHECKING:
     from v_chess.game_state import GameState
+    from v_chess.piece import Piece
+    from v_chess.position import Position
     from v_chess.game_over_conditions import GameOverCondition
     from v_chess.move_validators import MoveValidator
     from v_chess.state_validators import StateValidator
     from v_chess.special_moves import PieceMoveRule, GlobalMoveRule
 
 
+@dataclass(frozen=True, slots=True)
+class RulesPipeline:
+    """The component lists of a Rules instance, collected once.
+
+    Attributes:
+        move_validators: All move validators, in order.
+        pseudo_legality_validators: The move validators that do not test full
+            legality (king safety or variant goals).
+        state_validators: Board state validators.
+        game_over_conditions: Conditions that can end the game.
+        piece_move_rules: Move rules called per piece.
+        global_move_rules: Move rules called once per position (e.g. drops).
+    """
+    move_validators: tuple[Callable, ...]
+    pseudo_legality_validators: tuple[Callable, ...]
+    state_validators: tuple[Callable, ...]
+    game_over_conditions: tuple[Callable, ...]
+    piece_move_rules: tuple[Callable, ...]
+    global_move_rules: tuple[Callable, ...]
+
+
+DRAW_REASONS = frozenset({
+    GameOverReason.STALEMATE,
+    GameOverReason.REPETITION,
+    GameOverReason.FIFTY_MOVE_RULE,
+    GameOverReason.MUTUAL_AGREEMENT,
+    GameOverReason.INSUFFICIENT_MATERIAL,
+})
+
+
+@dataclass(frozen=True, slots=True)
+class GameStatus:
+    """The status of a position, as computed by Rules.evaluate_status.
+
+    Attributes:
+        is_check: Whether the side to move is in check.
+        has_legal_moves: Whether the side to move has a legal move.
+        reason: Why the game ended, or ONGOING.
+        winner: The winning color, or None for a draw or an ongoing game.
+    """
+    is_check: bool
+    has_legal_moves: bool
+    reason: GameOverReason
+    winner: Color | None
+
+    @property
+    def is_over(self) -> bool:
+        """Whether the game has ended."""
+        return self.reason != GameOverReason.ONGOING
+
+    @property
+    def is_draw(self) -> bool:
+        """Whether the game ended in a draw."""
+        return self.reason in DRAW_REASONS
+
+
 class Rules(ABC):
     """Abstract base class for chess variant rules.
 
     Rules are stateless logic providers that answer questions about
     the legality and status of a given GameState.
+
+    Attributes:
+        allows_king_rook_castling: Whether castling may be written as the
+            king capturing its own rook (Chess960).
+        king_promotion_allowed: Whether pawns may promote to a king.
+        horde_first_rank_double_push: Whether white pawns on the first rank
+            may advance two squares (Horde).
     """
     GameOverReason = GameOverReason
     MoveLegalityReason = MoveLegalityReason
     BoardLegalityReason = BoardLegalityReason
 
+    allows_king_rook_castling: bool = False
+    king_promotion_allowed: bool = False
+    horde_first_rank_double_push: bool = False
+
     @property
     @abstractmethod
     def starting_fen(self) -> str:
@@ -56,14 +127,34 @@ class Rules(ABC):
         """
         ...
 
+    @cached_property
+    def pipeline(self) -> RulesPipeline:
+        """The validators, conditions and move rules of this variant.
+
+        The list properties build new lists on every access; the pipeline
+        collects them once per Rules instance.
+        """
+        move_validators = tuple(self.move_validators)
+        available_moves = tuple(self.available_moves)
+        return RulesPipeline(
+            move_validators=move_validators,
+            pseudo_legality_validators=tuple(
+                v for v in move_validators if not getattr(v, "checks_full_legality", False)
+            ),
+            state_validators=tuple(self.state_validators),
+            game_over_conditions=tuple(self.game_over_conditions),
+            piece_move_rules=tuple(r for r in available_moves if not getattr(r, "is_global", False)),
+            global_move_rules=tuple(r for r in available_moves if getattr(r, "is_global", False)),
+        )
+
     def get_possible_moves(self, state: "GameState") -> list[Move]:
         """Generates all moves possible on an empty board using modular rules."""
         moves = []
         bb = state.board.bitboard
         turn = state.turn
 
-        piece_rules = [r for r in self.available_moves if not getattr(r, "is_global", False)]
-        global_rules = [r for r in self.available_moves if getattr(r, "is_global", False)]
+        piece_rules = self.pipeline.piece_move_rules
+        global_rules = self.pipeline.global_move_rules
 
         # 1. Piece-specific moves
         for p_type, mask in bb.pieces[turn].items():
@@ -86,6 +177,14 @@ class Rules(ABC):
 
         return moves
 
+    def generate_legal_moves(self, state: "GameState") -> list[Move]:
+        """Generates all legal moves for the side to move.
+
+        The default implementation filters the possible moves through the
+        validator pipeline. Rules with a native generator override this.
+        """
+        return [move for move in self.get_possible_moves(state) if self.validate_move(state, move) == MoveLegalityReason.LEGAL]
+
     @abstractmethod
     def apply_move(self, state: "GameState", move: Move) -> "GameState":
         """Executes a move and returns the resulting state.
@@ -101,7 +200,7 @@ class Rules(ABC):
 
     def validate_board_state(self, state: "GameState") -> BoardLegalityReason:
         """Validates the overall board state using the component pipeline."""
-        for v in self.state_validators:
+        for v in self.pipeline.state_validators:
             reason = v(state, self)
             if reason:
                 return reason
@@ -109,19 +208,19 @@ class Rules(ABC):
 
     def validate_move(self, state: "GameState", move: "Move") -> MoveLegalityReason:
         """Validates a move using the component pipeline."""
-        for v in self.move_validators:
+        for v in self.pipeline.move_validators:
             reason = v(state, move, self)
             if reason:
                 return reason
         return MoveLegalityReason.LEGAL
 
     def move_pseudo_legality_reason(self, state: "GameState", move: Move) -> MoveLegalityReason:
-        """Checks pseudo-legality using the validator pipeline."""
-        for v in self.move_validators:
-            # Skip validators that check for 'full' legality (safety, variant goals)
-            name = v.__name__.lower()
-            if "safety" in name or "mandatory" in name or "atomic" in name or "racing" in name:
-                continue
+        """Checks pseudo-legality using the validator pipeline.
+
+        Validators marked with checks_full_legality (king safety, variant
+        goals) are skipped.
+        """
+        for v in self.pipeline.pseudo_legality_validators:
             reason = v(state, move, self)
             if reason:
                 return reason
@@ -129,17 +228,43 @@ class Rules(ABC):
 
     def get_game_over_reason(self, state: "GameState") -> GameOverReason:
         """Determines why the game ended."""
-        for condition in self.game_over_conditions:
+        for condition in self.pipeline.game_over_conditions:
             reason = condition(state, self)
             if reason:
                 return reason
         return GameOverReason.ONGOING
 
     @abstractmethod
-    def get_winner(self, state: "GameState") -> Color | None:
-        """Determines the winner of the game."""
+    def get_winner(self, state: "GameState", reason: GameOverReason | None = None) -> Color | None:
+        """Determines the winner of the game.
+
+        Args:
+            state: The position to judge.
+            reason: The game over reason of the position, if already known.
+
+        Returns:
+            The winning color, or None for a draw or an ongoing game.
+        """
         ...
 
+    def evaluate_status(self, state: "GameState") -> GameStatus:
+        """Computes check, legal move existence, game over reason and winner.
+
+        The game over conditions share one legal move search through the
+        legal_moves memo, and the winner reuses the computed reason.
+
+        Args:
+            state: The position to evaluate.
+
+        Returns:
+            The GameStatus of the position.
+        """
+        is_check = self.is_check(state)
+        has_legal_moves = self.has_legal_moves(state)
+        reason = self.get_game_over_reason(state)
+        winner = self.get_winner(state, reason) if reason != GameOverReason.ONGOING else None
+        return GameStatus(is_check, has_legal_moves, reason, winner)
+
     def post_move_actions(self, old_state: "GameState", move: Move, new_state: "GameState") -> "GameState":
         """Applies variant-specific side effects after a standard board transition.
 
@@ -147,13 +272,37 @@ class Rules(ABC):
         """
         return new_state
 
+    def post_push_actions(self, position: "Position", move: Move, captured: "Piece | None"):
+        """Applies variant-specific side effects to a Position after Position.push.
+
+        The in-place counterpart of post_move_actions; overrides must keep the
+        two in agreement.
+
+        Args:
+            position: The position, already updated by the standard transition.
+            move: The move that was pushed.
+            captured: The piece the move captured, if any.
+        """
+
     # -------------------------------------------------------------------------
     # Convenience / Helper methods exposed to Game
     # -------------------------------------------------------------------------
 
+    def legal_moves(self, state: "GameState") -> list[Move]:
+        """Returns the legal moves of a state, generated once per state.
+
+        The list is memoised on the state for this Rules instance and shared
+        between callers, so it must not be modified.
+        """
+        memo = state._legal_moves_memo
+        if memo is None or memo[0] is not self:
+            memo = (self, self.generate_legal_moves(state))
+            object.__setattr__(state, "_legal_moves_memo", memo)
+        return memo[1]
+
     def has_legal_moves(self, state: "GameState") -> bool:
         """Checks if there is at least one legal move."""
-        return any(self.validate_move(state, move) == MoveLegalityReason.LEGAL for move in self.get_possible_moves(state))
+        return bool(self.legal_moves(state))
 
     def is_game_over(self, state: "GameState") -> bool:
         """Convenience method to check if the game has ended."""
@@ -183,20 +332,7 @@ class Rules(ABC):
 
     def is_draw(self, state: "GameState") -> bool:
         """Checks if the game resulted in a draw."""
-        reason = self.get_game_over_reason(state)
-        cls = getattr(self, "GameOverReason", GameOverReason)
-        
-        # Explicit check against ONGOING to avoid accidental matches
-        if reason == GameOverReason.ONGOING:
-            return False
-            
-        draw_reasons = []
-        for attr in ("STALEMATE", "REPETITION", "FIFTY_MOVE_RULE", "MUTUAL_AGREEMENT", "INSUFFICIENT_MATERIAL"):
-            r = getattr(cls, attr, None)
-            if r is not None:
-                draw_reasons.append(r)
-        
-        return reason in draw_reasons
+        return self.get_game_over_reason(state) in DRAW_REASONS
     
     def is_fifty_moves(self, state: "GameState") -> bool:
         """Whether the 50-move rule has been triggered."""
@@ -2,8 +2,9 @@ from typing import List, Callable, Optional
 from v_chess.enums import GameOverReason, MoveLegalityReason, BoardLegalityReason, Color
 from v_chess.game_state import GameState, CrazyhouseGameState
 from v_chess.move import Move
-from v_chess.piece import Pawn, Piece
+from v_chess.piece import Pawn, Piece, POCKET_INDEX, EMPTY_POCKETS
 from v_chess.square import Square
+from v_chess import zobrist
 from v_chess.game_over_conditions import (
     evaluate_repetition, evaluate_fifty_move_rule, 
     evaluate_checkmate, evaluate_stalemate
@@ -19,6 +20,7 @@ from v_chess.state_validators import (
     pawn_count_standard, piece_count_promotion_consistency, castling_rights_consistency,
     en_passant_target_validity, inactive_player_check_safety
 )
+from v_chess.move_generator import generate_drops
 from v_chess.special_moves import (
     PieceMoveRule, GlobalMoveRule, basic_moves,
     pawn_promotions, pawn_double_push, standard_castling, crazyhouse_drops
@@ -68,6 +70,18 @@ class CrazyhouseRules(StandardRules):
             inactive_player_check_safety
         ]
 
+    def generate_legal_moves(self, state: GameState) -> list[Move]:
+        """Generates all legal board moves and drops from the bitboards."""
+        return super().generate_legal_moves(state) + generate_drops(state)
+
+    def post_push_actions(self, position, move: Move, captured: Piece | None):
+        """Updates the pockets of a Position in place."""
+        mover = position.turn.opposite
+        if move.is_drop:
+            position.add_to_pocket(mover, type(move.drop_piece), -1)
+        elif captured:
+            position.add_to_pocket(mover, type(captured), 1)
+
     @property
     def fen_type(self) -> str:
         """The FEN notation type used."""
@@ -76,28 +90,19 @@ class CrazyhouseRules(StandardRules):
     def post_move_actions(self, old_state: GameState, move: Move, new_state: GameState) -> GameState:
         """Updates pockets after a move (capture or drop)."""
         # Ensure we are working with a CrazyhouseGameState
-        current_pockets = ((), ())
+        current_pockets = EMPTY_POCKETS
         if isinstance(old_state, CrazyhouseGameState):
             current_pockets = old_state.pockets
-            
+
         new_pockets = [list(current_pockets[0]), list(current_pockets[1])]
-        
+        pocket_idx = 0 if old_state.turn == Color.WHITE else 1
+
         if move.is_drop:
             # Remove dropped piece from pocket
-            pocket_idx = 0 if old_state.turn == Color.WHITE else 1
-            my_pocket = new_pockets[pocket_idx]
-            
-            found = False
-            for i, p in enumerate(my_pocket):
-                if type(p) == type(move.drop_piece):
-                    my_pocket.pop(i)
-                    found = True
-                    break
-            
-            if not found:
-                # Should have been caught by validate_move/pseudo check
-                pass
-                
+            type_idx = POCKET_INDEX[type(move.drop_piece)]
+            if new_pockets[pocket_idx][type_idx]:
+                new_pockets[pocket_idx][type_idx] -= 1
+
         else:
             # Check capture
             moving_piece = old_state.board.get_piece(move.start)
@@ -114,12 +119,9 @@ class CrazyhouseRules(StandardRules):
                 captured_piece = old_state.board.get_piece(captured_sq)
                 
             if captured_piece:
-                pocket_color_idx = 0 if old_state.turn == Color.WHITE else 1
-                captured_piece_type = type(captured_piece)
-                new_piece = captured_piece_type(old_state.turn)
-                new_pockets[pocket_color_idx].append(new_piece)
-                new_pockets[pocket_color_idx].sort(key=lambda p: p.fen.upper())
+                new_pockets[pocket_idx][POCKET_INDEX[type(captured_piece)]] += 1
 
+        pockets = (tuple(new_pockets[0]), tuple(new_pockets[1]))
         return CrazyhouseGameState(
             board=new_state.board,
             turn=new_state.turn,
@@ -128,5 +130,6 @@ class CrazyhouseRules(StandardRules):
             halfmove_clock=new_state.halfmove_clock,
             fullmove_count=new_state.fullmove_count,
             repetition_count=new_state.repetition_count,
-            pockets=(tuple(new_pockets[0]), tuple(new_pockets[1]))
+            pockets=pockets,
+            zobrist=new_state.zobrist_key ^ zobrist.pocket_key(current_pockets) ^ zobrist.pocket_key(pockets)
         )
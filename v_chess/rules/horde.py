@@ -20,11 +20,13 @@ from v_chess.special_moves import (
     PieceMoveRule, GlobalMoveRule, basic_moves,
     pawn_promotions, pawn_double_push, standard_castling, horde_pawn_double_push
 )
+from v_chess.move_generator import generate_moves
 from .standard import StandardRules
 
 
 class HordeRules(StandardRules):
     """Rules for Horde chess variant."""
+    horde_first_rank_double_push = True
 
     @property
     def game_over_conditions(self) -> List[Callable[[GameState, "StandardRules"], Optional[GameOverReason]]]:
@@ -73,17 +75,22 @@ class HordeRules(StandardRules):
         """The default starting FEN for Horde."""
         return "rnbqkbnr/pppppppp/8/1PP2PP1/PPPPPPPP/PPPPPPPP/PPPPPPPP/PPPPPPPP w kq - 0 1"
 
+    def generate_legal_moves(self, state: GameState) -> list[Move]:
+        """Generates all legal moves, including first-rank double pushes."""
+        return generate_moves(state, first_rank_double_push=self.horde_first_rank_double_push) + self.get_legal_castling_moves(state)
+
     def is_check(self, state: GameState) -> bool:
         """Checks if the current player is in check (always False for White)."""
         if state.turn == Color.WHITE:
             return False # White has no King
         return super().is_check(state)
 
-    def get_winner(self, state: GameState) -> Color | None:
+    def get_winner(self, state: GameState, reason: GameOverReason | None = None) -> Color | None:
         """Determines the winner of the game."""
-        reason = self.get_game_over_reason(state)
+        if reason is None:
+            reason = self.get_game_over_reason(state)
         if reason == GameOverReason.CHECKMATE:
             return Color.WHITE
         if reason == GameOverReason.ALL_PIECES_CAPTURED:
             return Color.BLACK
-        return super().get_winner(state)
\ No newline at end of file
+        return super().get_winner(state, reason)
\ No newline at end of file
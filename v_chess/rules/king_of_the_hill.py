@@ -25,8 +25,9 @@ class KingOfTheHillRules(StandardRules):
             standard_castling
         ]
 
-    def get_winner(self, state: GameState) -> Color | None:
-        reason = self.get_game_over_reason(state)
+    def get_winner(self, state: GameState, reason: GameOverReason | None = None) -> Color | None:
+        if reason is None:
+            reason = self.get_game_over_reason(state)
         if reason == GameOverReason.KING_ON_HILL:
             return state.turn.opposite
-        return super().get_winner(state)
+        return super().get_winner(state, reason)
@@ -3,6 +3,7 @@ from v_chess.enums import GameOverReason, MoveLegalityReason, BoardLegalityReaso
 from v_chess.game_state import GameState
 from v_chess.move import Move
 from v_chess.piece import King
+from v_chess.bitboard import RANK_8
 from v_chess.game_over_conditions import evaluate_racing_kings_win, evaluate_repetition, evaluate_fifty_move_rule, evaluate_stalemate
 from v_chess.move_validators import (
     validate_piece_presence, validate_turn, 
@@ -17,6 +18,8 @@ from v_chess.state_validators import (
 from v_chess.special_moves import (
     basic_moves, pawn_promotions, pawn_double_push
 )
+from v_chess.move_generator import generate_packed_moves, gives_check
+from v_chess.packed_move import MoveList, FROM_SHIFT, TO_MASK
 from .standard import StandardRules
 
 
@@ -70,17 +73,22 @@ class RacingKingsRules(StandardRules):
     def starting_fen(self) -> str:
         return "8/8/8/8/8/8/krbnNBRK/qrbnNBRQ w - - 0 1"
 
-    def is_check(self, state: GameState) -> bool:
-        return self._is_color_in_check(state.board, state.turn)
+    def generate_legal_moves(self, state: GameState) -> list[Move]:
+        """Generates legal moves from the bitboards, dropping those that give check."""
+        candidates = MoveList()
+        generate_packed_moves(state, candidates)
+        mailbox = state.board.bitboard.mailbox
+        moves = MoveList()
+        for packed in candidates:
+            start = packed >> FROM_SHIFT & TO_MASK
+            if not gives_check(state, start, packed & TO_MASK, type(mailbox[start])):
+                moves.append(packed)
+        return moves.to_moves(state.turn)
 
-    def get_winner(self, state: GameState) -> Color | None:
-        reason = self.get_game_over_reason(state)
+    def get_winner(self, state: GameState, reason: GameOverReason | None = None) -> Color | None:
+        if reason is None:
+            reason = self.get_game_over_reason(state)
         if reason == GameOverReason.KING_TO_EIGHTH_RANK:
-            wk_on_8 = False
-            for sq, p in state.board.items():
-                if isinstance(p, King) and p.color == Color.WHITE and sq.row == 0:
-                    wk_on_8 = True
-                    break
-            if wk_on_8: return Color.WHITE
+            if state.board.bitboard.pieces[Color.WHITE][King] & RANK_8: return Color.WHITE
             return Color.BLACK
-        return super().get_winner(state)
+        return super().get_winner(state, reason)
@@ -1,7 +1,9 @@
 from typing import List, Callable, Optional
 from itertools import chain
 
+from v_chess.bitboard import BETWEEN, LINE
 from v_chess.board import Board
+from v_chess.castling import HOME_RANKS, castling_right_for_move, rights_after_move, rights_mask
 from v_chess.enums import Color, CastlingRight, Direction, MoveLegalityReason, BoardLegalityReason, GameOverReason
 from v_chess.move import Move
 from v_chess.piece import King, Pawn, Piece, Rook, Queen, Bishop, Knight
@@ -26,6 +28,8 @@ from v_chess.special_moves import (
     PieceMoveRule, GlobalMoveRule, basic_moves, 
     pawn_promotions, pawn_double_push, standard_castling
 )
+from v_chess.move_generator import generate_moves
+from v_chess import zobrist
 from .core import Rules
 
 
@@ -85,71 +89,78 @@ class StandardRules(Rules):
             standard_castling
         ]
 
-    def get_winner(self, state: GameState) -> Color | None:
+    def get_winner(self, state: GameState, reason: GameOverReason | None = None) -> Color | None:
         """Determines the winner of the game."""
-        reason = self.get_game_over_reason(state)
+        if reason is None:
+            reason = self.get_game_over_reason(state)
         if reason == GameOverReason.CHECKMATE:
             return state.turn.opposite
         return None
 
     def is_check(self, state: GameState) -> bool:
         """Checks if the current player is in check."""
-        return self._is_color_in_check(state.board, state.turn)
+        return bool(state.check_info.checkers)
+
+    def generate_legal_moves(self, state: GameState) -> list[Move]:
+        """Generates all legal moves from the bitboards, castling included."""
+        return generate_moves(state) + self.get_legal_castling_moves(state)
 
     def king_left_in_check(self, state: GameState, move: Move) -> bool:
-        """Checks if the king is left in check after a move."""
-        return state.board.bitboard.is_king_attacked_after_move(move, state.turn, state.board, state.ep_square)
+        """Checks if the king is left in check after a move.
+
+        Answered from the position's CheckInfo; only en passant captures and
+        moves of a second king replay the move on the board.
+        """
+        info = state.check_info
+        if info.king_sq == -1:
+            return False
+        end_bit = 1 << move.end.index
+        if move.is_drop:
+            return not info.evasions & end_bit
+        bb = state.board.bitboard
+        start = move.start.index
+        piece = bb.mailbox[start]
+        if piece is None:
+            return False
+        if start == info.king_sq:
+            # A king moving onto its own rook castles, and the castling
+            # validator has already judged where it lands.
+            if bb.occupied_co[state.turn] & end_bit:
+                return False
+            return bool(info.attacked & end_bit)
+        if isinstance(piece, King) or (isinstance(piece, Pawn) and move.end == state.ep_square):
+            return bb.is_king_attacked_after_move(move, state.turn, state.board, state.ep_square)
+        if not info.evasions & end_bit:
+            return True
+        return start in info.pins and not LINE[info.king_sq][start] & end_bit
 
     def castling_legality_reason(self, state: GameState, move: Move, piece: King) -> MoveLegalityReason:
         """Determines if a castling move is pseudo-legal."""
-        required_right = None
-        squares_to_check_attack = []
-        squares_to_check_occupancy = []
-        rook_start_square = None
-
-        if piece.color == Color.WHITE:
-            if move.end == Square(7, 6):
-                required_right = CastlingRight.WHITE_SHORT
-                squares_to_check_attack = [Square(7, 5), Square(7, 6)]
-                squares_to_check_occupancy = [Square(7, 5), Square(7, 6)]
-                rook_start_square = Square(7, 7)
-            else:
-                required_right = CastlingRight.WHITE_LONG
-                squares_to_check_attack = [Square(7, 3), Square(7, 2)]
-                squares_to_check_occupancy = [Square(7, 3), Square(7, 2), Square(7, 1)]
-                rook_start_square = Square(7, 0)
+        rank = 7 if piece.color == Color.WHITE else 0
+        king_idx = rank * 8 + 4
+        if move.end == Square(rank, 6):
+            required_right = CastlingRight.short(piece.color)
+            king_to, rook_idx = king_idx + 2, king_idx + 3
         else:
-            if move.end == Square(0, 6):
-                required_right = CastlingRight.BLACK_SHORT
-                squares_to_check_attack = [Square(0, 5), Square(0, 6)]
-                squares_to_check_occupancy = [Square(0, 5), Square(0, 6)]
-                rook_start_square = Square(0, 7)
-            else:
-                required_right = CastlingRight.BLACK_LONG
-                squares_to_check_attack = [Square(0, 3), Square(0, 2)]
-                squares_to_check_occupancy = [Square(0, 3), Square(0, 2), Square(0, 1)]
-                rook_start_square = Square(0, 0)
-
-        if required_right is None:
-            return MoveLegalityReason.NO_CASTLING_RIGHT
+            required_right = CastlingRight.long(piece.color)
+            king_to, rook_idx = king_idx - 2, king_idx - 4
 
         if required_right not in state.castling_rights:
             return MoveLegalityReason.NO_CASTLING_RIGHT
 
-        rook_piece = state.board.get_piece(rook_start_square)
-        if not (rook_piece and isinstance(rook_piece, Rook) and rook_piece.color == piece.color):
+        bb = state.board.bitboard
+        if not bb.pieces[piece.color][Rook] & (1 << rook_idx):
             return MoveLegalityReason.NO_CASTLING_RIGHT
 
-        for sq in squares_to_check_occupancy:
-            if state.board.get_piece(sq) is not None:
-                return MoveLegalityReason.PATH_BLOCKED
+        if bb.occupied & BETWEEN[king_idx][rook_idx]:
+            return MoveLegalityReason.PATH_BLOCKED
 
-        if self._is_color_in_check(state.board, piece.color):
+        info = state.check_info
+        if info.checkers:
             return MoveLegalityReason.CASTLING_FROM_CHECK
 
-        for sq in squares_to_check_attack:
-            if self.is_under_attack(state.board, sq, piece.color.opposite):
-                return MoveLegalityReason.CASTLING_THROUGH_CHECK
+        if info.attacked & (BETWEEN[king_idx][king_to] | 1 << king_to):
+            return MoveLegalityReason.CASTLING_THROUGH_CHECK
 
         return MoveLegalityReason.LEGAL
 
@@ -170,31 +181,16 @@ class StandardRules(Rules):
 
     def invalid_castling_rights(self, state: GameState) -> list[CastlingRight]:
         """Returns a list of castling rights that are no longer valid due to piece positions."""
+        pieces = state.board.bitboard.pieces
         invalid = []
         for right in state.castling_rights:
             if right == CastlingRight.NONE: continue
-            
-            row = 7 if right.color == Color.WHITE else 0
-            # In Chess960, king can be on any square on the rank initially.
-            # But the right is only valid if the king is STILL on that rank.
-            # Actually, standard rules are strict about e1/e8.
-            # We can use expected_king_square and check if a king is there.
-            
-            target_king_sq = right.expected_king_square
-            king = state.board.get_piece(target_king_sq)
-            
-            # If no king at expected square, check if any king exists on the rank (for 960 compatibility)
-            if not (isinstance(king, King) and king.color == right.color):
-                 kings_on_rank = [p for sq, p in state.board.items() 
-                                  if isinstance(p, King) and p.color == right.color and sq.row == row]
-                 if not kings_on_rank:
-                      invalid.append(right)
-                      continue
-
-            rook = state.board.get_piece(right.expected_rook_square)
-            if not (isinstance(rook, Rook) and rook.color == right.color):
+            # 960 rights report e1/e8 as the king square, so any king on the
+            # home rank keeps a right.
+            if not pieces[right.color][King] & HOME_RANKS[right.color]:
+                invalid.append(right)
+            elif not pieces[right.color][Rook] & (1 << right.expected_rook_square.index):
                 invalid.append(right)
-                continue
         return invalid
 
     def unblocked_path(self, board: Board, piece: Piece, path: list[Square]) -> list[Square]:
@@ -219,27 +215,23 @@ class StandardRules(Rules):
 
     def _is_color_in_check(self, board: Board, color: Color) -> bool:
         """Checks if the king of the given color is under attack."""
-        king_mask = board.bitboard.pieces[color][King]
-        while king_mask:
-            sq_idx = (king_mask & -king_mask).bit_length() - 1
-            if board.bitboard.is_attacked(sq_idx, color.opposite):
-                return True
-            king_mask &= king_mask - 1
-        return False
+        bb = board.bitboard
+        return bool(bb.pieces[color][King] and bb.attacks_by(color.opposite) & bb.pieces[color][King])
 
     def get_legal_castling_moves(self, state: GameState) -> list[Move]:
         """Returns all legal castling moves."""
+        rank = 7 if state.turn == Color.WHITE else 0
+        king_sq = Square(rank, 4)
+        if not state.board.bitboard.pieces[state.turn][King] & (1 << king_sq.index):
+            return []
+
         moves = []
-        for sq, piece in state.board.items():
-            if isinstance(piece, King) and piece.color == state.turn:
-                 # Check short
-                 m_short = Move(sq, Square(sq.row, 6))
-                 if self.validate_move(state, m_short) == MoveLegalityReason.LEGAL:
-                     moves.append(m_short)
-                 # Check long
-                 m_long = Move(sq, Square(sq.row, 2))
-                 if self.validate_move(state, m_long) == MoveLegalityReason.LEGAL:
-                     moves.append(m_long)
+        for right, col in ((CastlingRight.short(state.turn), 6), (CastlingRight.long(state.turn), 2)):
+            if right not in state.castling_rights:
+                continue
+            move = Move(king_sq, Square(rank, col), player_to_move=state.turn)
+            if self.castling_legality_reason(state, move, King(state.turn)) == MoveLegalityReason.LEGAL:
+                moves.append(move)
         return moves
 
     def get_legal_en_passant_moves(self, state: GameState) -> list[Move]:
@@ -292,6 +284,10 @@ class StandardRules(Rules):
 
              new_halfmove_clock = state.halfmove_clock + 1
              new_fullmove_count = state.fullmove_count + (1 if state.turn == Color.BLACK else 0)
+             key = (
+                 state.zobrist_key ^ zobrist.BLACK_TO_MOVE_KEY ^ zobrist.ep_key(state.ep_square) ^
+                 zobrist.piece_key(move.drop_piece, move.end.index)
+             )
 
              new_state = GameState(
                 board=new_board,
@@ -300,7 +296,8 @@ class StandardRules(Rules):
                 ep_square=None,
                 halfmove_clock=new_halfmove_clock,
                 fullmove_count=new_fullmove_count,
-                repetition_count=1
+                repetition_count=1,
+                zobrist=key
              )
 
              return self.post_move_actions(state, move, new_state)
@@ -313,17 +310,18 @@ class StandardRules(Rules):
         is_castling = False
         rook_sq = None
         if isinstance(piece, King):
-            # Standard/960 Target: King moves > 1 square OR to C/G file
-            if abs(move.start.col - move.end.col) > 1:
-                is_castling = True
             # 960 KxR Capture: Target is own Rook
-            elif isinstance(target, Rook) and target.color == piece.color:
+            if isinstance(target, Rook) and target.color == piece.color:
                 is_castling = True
                 rook_sq = move.end
+            # Standard/960 Target: King moves > 1 square OR to C/G file
+            elif abs(move.start.col - move.end.col) > 1:
+                is_castling = True
 
         is_pawn_move = isinstance(piece, Pawn)
         is_en_passant = is_pawn_move and move.end == state.ep_square
-        is_capture = target is not None or is_en_passant
+        # A king moving onto its own rook castles rather than captures.
+        is_capture = (target is not None and rook_sq is None) or is_en_passant
 
         new_halfmove_clock = state.halfmove_clock + 1
         if is_pawn_move or is_capture:
@@ -333,37 +331,22 @@ class StandardRules(Rules):
         if state.turn == Color.BLACK:
             new_fullmove_count += 1
 
-        if is_castling:
-            # Determine Castling Right involved
-            if rook_sq: # Known from KxR
-                # Find right matching this rook
-                right = next((r for r in state.castling_rights if r.expected_rook_square == rook_sq and r.color == piece.color), None)
-            else:
-                # Infer from direction
-                is_kingside = move.end.col > move.start.col
-                # For 960, we might need more robust matching if multiple rooks on same side (rare)
-                # Standard assumption: King moves towards the rook.
-                # In 960 standard notation (target c/g), g is kingside, c is queenside.
-                if move.end.col == 6: # g-file (Kingside)
-                     right = next((r for r in state.castling_rights if r.color == piece.color and r.expected_rook_square.col > move.start.col), None)
-                elif move.end.col == 2: # c-file (Queenside)
-                     right = next((r for r in state.castling_rights if r.color == piece.color and r.expected_rook_square.col < move.start.col), None)
-                else:
-                     # Non-standard target (manual 960 move?), fall back to direction
-                     if is_kingside:
-                         right = next((r for r in state.castling_rights if r.color == piece.color and r.expected_rook_square.col > move.start.col), None)
-                     else:
-                         right = next((r for r in state.castling_rights if r.color == piece.color and r.expected_rook_square.col < move.start.col), None)
+        key = state.zobrist_key ^ zobrist.BLACK_TO_MOVE_KEY ^ zobrist.piece_key(piece, move.start.index)
 
+        if is_castling:
+            right, rook_idx = castling_right_for_move(
+                state.castling_rights, state.board.bitboard.pieces, piece.color,
+                move.start.index, move.end.index, rook_sq is not None
+            )
             if right:
-                rook_sq = right.expected_rook_square
+                rook_sq = Square(divmod(rook_idx, 8))
                 rook = new_board.get_piece(rook_sq)
 
                 # Destination Squares (Fixed for Chess)
                 rank = move.start.row
                 king_dest = Square(rank, 6) # g-file
                 rook_dest = Square(rank, 5) # f-file
-                if right.expected_rook_square.col < move.start.col: # Queenside
+                if rook_sq.col < move.start.col: # Queenside
                     king_dest = Square(rank, 2) # c-file
                     rook_dest = Square(rank, 3) # d-file
 
@@ -373,61 +356,58 @@ class StandardRules(Rules):
                 new_board.remove_piece(rook_sq)
                 new_board.set_piece(piece, king_dest)
                 new_board.set_piece(rook, rook_dest)
+                key ^= zobrist.piece_key(piece, king_dest.index)
+                if rook:
+                    key ^= zobrist.piece_key(rook, rook_sq.index) ^ zobrist.piece_key(rook, rook_dest.index)
             else:
                 # Fallback (shouldn't happen if validated)
                 new_board.move_piece(piece, move.start, move.end)
+                key ^= zobrist.piece_key(piece, move.end.index)
+                if target:
+                    key ^= zobrist.piece_key(target, move.end.index)
 
         else:
             new_board.move_piece(piece, move.start, move.end)
+            key ^= zobrist.piece_key(piece, move.end.index)
+            if target:
+                key ^= zobrist.piece_key(target, move.end.index)
 
         if is_en_passant:
             direction = Direction.DOWN if piece.color == Color.WHITE else Direction.UP
             captured_coordinate = move.end.adjacent(direction)
+            captured = new_board.get_piece(captured_coordinate)
+            if captured:
+                key ^= zobrist.piece_key(captured, captured_coordinate.index)
             new_board.remove_piece(captured_coordinate)
 
         if move.promotion_piece is not None:
+            key ^= zobrist.piece_key(new_board.get_piece(move.end), move.end.index)
+            key ^= zobrist.piece_key(move.promotion_piece, move.end.index)
             new_board.set_piece(move.promotion_piece, move.end)
 
-        new_castling_rights = set(state.castling_rights)
-
-        def revoke_rights(color: Color):
-            to_remove = [r for r in new_castling_rights if r != CastlingRight.NONE and r.color == color]
-            for r in to_remove: new_castling_rights.discard(r)
-
-        def revoke_rook_right(square: Square):
-            to_remove = [r for r in new_castling_rights if r != CastlingRight.NONE and r.expected_rook_square == square]
-            for r in to_remove: new_castling_rights.discard(r)
-
-        if isinstance(piece, King):
-            revoke_rights(piece.color)
-
-        if isinstance(piece, Rook):
-            revoke_rook_right(move.start)
-
-        # If rook was captured (or involved in castling? No, castling rights revoked by King move)
-        # But if we capture a rook, we must revoke *that* rook's right.
-        # In castling KxR, target IS rook.
-        if isinstance(target, Rook):
-            revoke_rook_right(move.end)
-
-        # Explicit check for 960 KxR castling target revocation if not caught above
-        if is_castling and rook_sq:
-             revoke_rook_right(rook_sq)
+        new_castling_rights = rights_after_move(
+            state.castling_rights, state.board.bitboard.pieces, piece, target, move.start.index, move.end.index,
+            rook_sq.index if is_castling and rook_sq else None
+        )
 
         new_ep_square = None
         direction = Direction.DOWN if piece.color == Color.WHITE else Direction.UP
         if isinstance(piece, Pawn) and abs(move.start.row - move.end.row) > 1:
             new_ep_square = move.end.adjacent(direction)
 
+        key ^= zobrist.castling_key(rights_mask(state.castling_rights) ^ rights_mask(new_castling_rights))
+        key ^= zobrist.ep_key(state.ep_square) ^ zobrist.ep_key(new_ep_square)
+
         # Basic state transition
         new_state = GameState(
             board=new_board,
             turn=state.turn.opposite,
-            castling_rights=tuple(sorted(new_castling_rights, key=lambda x: x.value)),
+            castling_rights=new_castling_rights,
             ep_square=new_ep_square,
             halfmove_clock=new_halfmove_clock,
             fullmove_count=new_fullmove_count,
-            repetition_count=1
+            repetition_count=1,
+            zobrist=key
         )
 
         # Apply variant hooks
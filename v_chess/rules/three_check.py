@@ -2,6 +2,7 @@ from typing import List, Callable, Optional
 from v_chess.enums import GameOverReason, MoveLegalityReason, BoardLegalityReason, Color
 from v_chess.game_state import GameState, ThreeCheckGameState
 from v_chess.move import Move
+from v_chess import zobrist
 from v_chess.game_over_conditions import evaluate_three_check_win
 from v_chess.special_moves import (
     PieceMoveRule, GlobalMoveRule, basic_moves,
@@ -49,15 +50,27 @@ class ThreeCheckRules(StandardRules):
             halfmove_clock=new_state.halfmove_clock,
             fullmove_count=new_state.fullmove_count,
             repetition_count=new_state.repetition_count,
-            checks=(white_checks, black_checks)
+            checks=(white_checks, black_checks),
+            zobrist=new_state.zobrist_key ^ zobrist.checks_key(current_checks) ^ zobrist.checks_key((white_checks, black_checks))
         )
 
-    def get_winner(self, state: GameState) -> Color | None:
-        reason = self.get_game_over_reason(state)
+    def post_push_actions(self, position, move: Move, captured):
+        """Updates the check counter of a Position in place."""
+        white_checks, black_checks = position.checks or (0, 0)
+        if self.is_check(position.view()):
+            if position.turn == Color.BLACK:
+                white_checks += 1
+            else:
+                black_checks += 1
+        position.set_checks((white_checks, black_checks))
+
+    def get_winner(self, state: GameState, reason: GameOverReason | None = None) -> Color | None:
+        if reason is None:
+            reason = self.get_game_over_reason(state)
         if reason == GameOverReason.THREE_CHECKS:
             if isinstance(state, ThreeCheckGameState):
                 if state.checks[0] >= 3:
                     return Color.WHITE
                 if state.checks[1] >= 3:
                     return Color.BLACK
-        return super().get_winner(state)
+        return super().get_winner(state, reason)
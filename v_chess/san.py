@@ -0,0 +1,236 @@
+from collections import Counter
+from dataclasses import replace
+from typing import TYPE_CHECKING, Iterable
+
+from v_chess.enums import GameOverReason
+from v_chess.game_state import GameState
+from v_chess.move import Move
+from v_chess.packed_move import from_move, from_uci
+from v_chess.piece import King, Pawn, Rook, piece_from_char
+from v_chess.position import Position
+from v_chess.square import Square
+
+if TYPE_CHECKING:
+    from v_chess.rules import Rules, GameStatus
+
+
+def move_to_san(state: GameState, move: Move, legal_moves: Iterable[Move]) -> str:
+    """Returns the SAN of a move, without a check or mate suffix.
+
+    Ambiguity is resolved against the other legal moves of the same piece
+    type to the same square.
+
+    Args:
+        state: The position the move is played in.
+        move: The move to describe.
+        legal_moves: The legal moves of the position.
+
+    Returns:
+        The SAN string (e.g., 'Nf3', 'O-O', 'exd5').
+    """
+    if move.is_drop:
+        # SAN for drop is usually same as UCI/special: N@e4
+        return move.uci
+
+    piece = state.board.get_piece(move.start)
+    if piece is None:
+        return move.uci
+
+    castling = _castling_san(state, move)
+    if castling is not None:
+        return castling
+
+    san = "" if isinstance(piece, Pawn) else piece.fen.upper()
+
+    # Pawn captures already name their file, which is all a pawn ever needs.
+    promotion = type(move.promotion_piece) if move.promotion_piece is not None else None
+    candidates = [] if isinstance(piece, Pawn) else [
+        m.start for m in legal_moves
+        if m.end == move.end and not m.is_drop and m.start != move.start
+        and (type(m.promotion_piece) if m.promotion_piece is not None else None) is promotion
+        and type(state.board.get_piece(m.start)) is type(piece)
+    ]
+    start = str(move.start)
+    if candidates:
+        if all(sq.col != move.start.col for sq in candidates):
+            san += start[0]
+        elif all(sq.row != move.start.row for sq in candidates):
+            san += start[1]
+        else:
+            san += start
+
+    target = state.board.get_piece(move.end)
+    is_en_passant = isinstance(piece, Pawn) and move.start.col != move.end.col and target is None
+    if target is not None or is_en_passant:
+        if isinstance(piece, Pawn):
+            san += start[0]
+        san += "x"
+
+    san += str(move.end)
+    if move.promotion_piece:
+        san += "=" + move.promotion_piece.fen.upper()
+    return san
+
+
+def san_to_move(state: GameState, san: str, legal_moves: Iterable[Move]) -> Move:
+    """Finds the legal move a SAN string describes.
+
+    Args:
+        state: The position the move is played in.
+        san: The move in SAN. Drops are given as in UCI ('N@f3').
+        legal_moves: The legal moves of the position.
+
+    Returns:
+        The matching legal move.
+
+    Raises:
+        ValueError: If the SAN string is ambiguous or illegal.
+    """
+    turn = state.turn
+    if "@" in san:
+        return Move(san, player_to_move=turn)
+
+    castling = san.rstrip("+#").replace("0", "O")
+    if castling in ("O-O", "O-O-O"):
+        matches = [m for m in legal_moves if not m.is_drop and _castling_san(state, m) == castling]
+        if len(matches) != 1:
+            raise ValueError(f"San {san} is ambiguous or illegal. Found {len(matches)} matches.")
+        return matches[0]
+
+    clean_san = san.replace("x", "").replace("+", "").replace("#", "").replace("(", "").replace(")", "")
+
+    promotion = None
+    if "=" in clean_san:
+        clean_san, promotion_char = clean_san.split("=")
+        promotion = piece_from_char[promotion_char]
+    elif clean_san and clean_san[-1].isalpha() and clean_san[-1].upper() in piece_from_char:
+        promotion = piece_from_char[clean_san[-1]]
+        clean_san = clean_san[:-1]
+
+    end_square = Square(clean_san[-2:])
+    piece_indicator = clean_san[:-2]
+    if piece_indicator and piece_indicator[0].isupper():
+        piece_type = piece_from_char[piece_indicator[0]]
+        disambiguation = piece_indicator[1:]
+    else:
+        piece_type = Pawn
+        disambiguation = piece_indicator
+
+    col = row = None
+    if disambiguation.isalpha():
+        col = ord(disambiguation) - ord("a")
+    elif disambiguation.isdigit():
+        row = 8 - int(disambiguation)
+    elif len(disambiguation) == 2:
+        col = ord(disambiguation[0]) - ord("a")
+        row = 8 - int(disambiguation[1])
+
+    matches = [
+        m for m in legal_moves
+        if m.end == end_square and not m.is_drop
+        and (type(m.promotion_piece) if m.promotion_piece is not None else None) is promotion
+        and isinstance(state.board.get_piece(m.start), piece_type)
+        and (col is None or m.start.col == col) and (row is None or m.start.row == row)
+    ]
+    if len(matches) != 1:
+        raise ValueError(f"San {san} is ambiguous or illegal. Found {len(matches)} matches.")
+    return matches[0]
+
+
+def _castling_san(state: GameState, move: Move) -> str | None:
+    """Returns 'O-O' or 'O-O-O' if a move castles, otherwise None.
+
+    A king castles when it moves more than one file or, in Chess960, onto
+    its own rook.
+    """
+    if move.is_drop:
+        return None
+    piece = state.board.get_piece(move.start)
+    if not isinstance(piece, King):
+        return None
+    target = state.board.get_piece(move.end)
+    onto_rook = isinstance(target, Rook) and target.color == piece.color
+    if not onto_rook and abs(move.start.col - move.end.col) < 2:
+        return None
+    return "O-O" if move.end.col > move.start.col else "O-O-O"
+
+
+def check_suffix(status: "GameStatus") -> str:
+    """Returns the SAN suffix for the position a move leads to.
+
+    Checkmate gives '#' and check '+'. A move that ends the game any other
+    way gets no suffix.
+    """
+    if status.is_over:
+        return "#" if status.reason == GameOverReason.CHECKMATE else ""
+    return "+" if status.is_check else ""
+
+
+def uci_to_san(rules: "Rules", state: GameState, ucis: Iterable[str]) -> list[str]:
+    """Converts a sequence of UCI moves played from a position to SAN.
+
+    The moves are replayed on a Position, and the legal moves generated for
+    each position serve both its SAN and the check suffix of the move
+    before it.
+
+    Args:
+        rules: The rules of the variant.
+        state: The position the first move is played in.
+        ucis: The moves in UCI.
+
+    Returns:
+        The moves in SAN, with check and mate suffixes.
+
+    Raises:
+        ValueError: If a move is not legal in its position.
+    """
+    position = Position(state, rules)
+    counts = Counter({state.zobrist_key: 1})
+    sans = []
+    for uci in ucis:
+        legal_moves = rules.legal_moves(state)
+        packed = from_uci(uci)
+        move = next((m for m in legal_moves if from_move(m) == packed), None)
+        if move is None:
+            raise ValueError(f"Illegal move {uci} in position {state.fen}")
+        san = move_to_san(state, move, legal_moves)
+        position.push(move)
+        state = _next_state(position, counts)
+        sans.append(san + check_suffix(rules.evaluate_status(state)))
+    return sans
+
+
+def san_to_uci(rules: "Rules", state: GameState, sans: Iterable[str]) -> list[str]:
+    """Converts a sequence of SAN moves played from a position to UCI.
+
+    Args:
+        rules: The rules of the variant.
+        state: The position the first move is played in.
+        sans: The moves in SAN.
+
+    Returns:
+        The moves in UCI.
+
+    Raises:
+        ValueError: If a move is ambiguous or illegal.
+    """
+    position = Position(state, rules)
+    counts = Counter({state.zobrist_key: 1})
+    ucis = []
+    for san in sans:
+        legal_moves = rules.legal_moves(state)
+        move = san_to_move(state, san, legal_moves)
+        if move not in legal_moves:
+            raise ValueError(f"San {san} is illegal in position {state.fen}")
+        position.push(move)
+        state = _next_state(position, counts)
+        ucis.append(move.uci)
+    return ucis
+
+
+def _next_state(position: Position, counts: Counter[int]) -> GameState:
+    """Returns a view of the position after a push, counting repetitions as Game does."""
+    if position.halfmove_clock == 0:
+        counts.clear()
+    counts[position.zobrist_key] += 1
+    return replace(position.view(), repetition_count=counts[position.zobrist_key], zobrist=position.zobrist_key)
@@ -1,5 +1,7 @@
 from typing import TYPE_CHECKING, Iterable, Callable, Optional, List
 from v_chess.move import Move
+from v_chess.move_generator import generate_drops
+from v_chess.packed_move import pack, to_move
 from v_chess.enums import Color, Direction
 from v_chess.square import Square
 
@@ -19,7 +21,7 @@ def basic_moves(state: "GameState", sq: "Square", piece: "Piece") -> Iterable[Mo
     for end in piece.theoretical_moves(sq):
         if isinstance(piece, Pawn) and end.is_promotion_row(state.turn):
             continue
-        yield Move(sq, end, player_to_move=state.turn)
+        yield to_move(pack(sq.index, end.index), state.turn)
 
 def pawn_promotions(state: "GameState", sq: "Square", piece: "Piece") -> Iterable[Move]:
     """Generates promotion moves for pawns reaching the last rank."""
@@ -28,7 +30,7 @@ def pawn_promotions(state: "GameState", sq: "Square", piece: "Piece") -> Iterabl
         for end in piece.theoretical_moves(sq):
             if end.is_promotion_row(state.turn):
                 for promo_piece_type in [Queen, Rook, Bishop, Knight, King]:
-                    yield Move(sq, end, promo_piece_type(state.turn), player_to_move=state.turn)
+                    yield to_move(pack(sq.index, end.index, promo_piece_type), state.turn)
 
 def pawn_double_push(state: "GameState", sq: "Square", piece: "Piece") -> Iterable[Move]:
     """Generates double push moves for pawns on their starting rank."""
@@ -81,27 +83,7 @@ def horde_pawn_double_push(state: "GameState", sq: "Square", piece: "Piece") ->
             yield Move(sq, two_step, player_to_move=state.turn)
 
 def crazyhouse_drops(state: "GameState") -> Iterable[Move]:
-    """Generates all legal drops from the pocket in Crazyhouse."""
-    from v_chess.game_state import CrazyhouseGameState
-    from v_chess.piece import Pawn
-    
-    if not isinstance(state, CrazyhouseGameState):
-        return
-
-    pocket_idx = 0 if state.turn == Color.WHITE else 1
-    pocket = state.pockets[pocket_idx]
-    if not pocket:
-        return
-
-    unique_pieces = {type(p): p for p in pocket}.values()
-
-    for r in range(8):
-        for c in range(8):
-            target_sq = Square(r, c)
-            if state.board.get_piece(target_sq) is None:
-                for p in unique_pieces:
-                    if isinstance(p, Pawn) and (r == 0 or r == 7):
-                        continue
-                    yield Move(Square(None), target_sq, None, p, player_to_move=state.turn)
+    """Generates all pseudo-legal drops from the pocket in Crazyhouse."""
+    yield from generate_drops(state, king_safety=False)
 
 crazyhouse_drops.is_global = True
\ No newline at end of file
@@ -4,7 +4,7 @@ from enum import Enum
 from .enums import Direction, Color
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Square:
     """Represents a square on a chessboard.
 
@@ -67,7 +67,7 @@ class Square:
         if not (cls.is_valid(_row, _col) or (_row == -1 and _col == -1)):
              raise ValueError(f"Invalid Square: row={_row}, col={_col}")
 
-        instance = super().__new__(cls)
+        instance = object.__new__(cls)
         object.__setattr__(instance, 'row', _row)
         object.__setattr__(instance, 'col', _col)
         cls._CACHE[(_row, _col)] = instance
@@ -77,6 +77,9 @@ class Square:
         """Handled by __new__ for caching."""
         pass
 
+    def __reduce__(self):
+        return Square, (self.row, self.col)
+
     @property
     def is_none_square(self) -> bool:
         """True if this is the special NoneSquare (representing no square)."""
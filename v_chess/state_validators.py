@@ -65,8 +65,7 @@ def en_passant_target_validity(state: "GameState", rules: "Rules") -> Optional[B
     """Ensures en passant target square is valid."""
     if state.ep_square is not None:
         valid_rows = [2, 5]
-        from v_chess.rules.horde import HordeRules
-        if isinstance(rules, HordeRules):
+        if rules.horde_first_rank_double_push:
             valid_rows.append(6) # Rank 2 for white double push from rank 1
             
         if state.ep_square.row not in valid_rows:
@@ -87,12 +86,6 @@ def inactive_player_check_safety(state: "GameState", rules: "Rules") -> Optional
         return BoardLegalityReason.OPPOSITE_CHECK
     return None
 
-def atomic_kings_proximity(state: "GameState", rules: "Rules") -> Optional[BoardLegalityReason]:
-    """Ensures kings are not adjacent in Atomic chess."""
-    if rules._kings_adjacent(state.board):
-        return BoardLegalityReason.KINGS_ADJACENT
-    return None
-
 def racing_kings_check_illegality(state: "GameState", rules: "Rules") -> Optional[BoardLegalityReason]:
     """Ensures neither player is in check (used in Racing Kings)."""
     if rules.is_check(state) or rules.inactive_player_in_check(state):
@@ -0,0 +1,126 @@
+import random
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from v_chess.castling import RIGHT_BITS, rights_mask
+from v_chess.enums import Color, CastlingRight
+from v_chess.piece import Piece, Pawn, Knight, Bishop, Rook, Queen, King, POCKET_TYPES
+from v_chess.square import Square
+
+if TYPE_CHECKING:
+    from v_chess.game_state import GameState
+
+_rng = random.Random(0x5EED_C4E55)
+
+
+def _random_key() -> int:
+    return _rng.getrandbits(64)
+
+
+PIECE_KEYS: dict[Color, dict[type[Piece], list[int]]] = {
+    color: {p_type: [_random_key() for _ in range(64)] for p_type in (Pawn, Knight, Bishop, Rook, Queen, King)}
+    for color in (Color.WHITE, Color.BLACK)
+}
+BLACK_TO_MOVE_KEY = _random_key()
+CASTLING_KEYS: dict[CastlingRight, int] = {
+    right: 0 if right == CastlingRight.NONE else _random_key() for right in CastlingRight
+}
+EP_FILE_KEYS: list[int] = [_random_key() for _ in range(8)]
+
+# Count-indexed keys for Crazyhouse pockets and Three-check counters. Index 0
+# is zero so that empty pockets and (0, 0) checks leave the key unchanged.
+_MAX_COUNT = 16
+POCKET_KEYS: dict[Color, dict[type[Piece], list[int]]] = {
+    color: {p_type: [0] + [_random_key() for _ in range(_MAX_COUNT)] for p_type in (Pawn, Knight, Bishop, Rook, Queen, King)}
+    for color in (Color.WHITE, Color.BLACK)
+}
+CHECK_KEYS: dict[Color, list[int]] = {
+    color: [0] + [_random_key() for _ in range(_MAX_COUNT)] for color in (Color.WHITE, Color.BLACK)
+}
+
+
+def piece_key(piece: Piece, sq_idx: int) -> int:
+    """Returns the key of a piece standing on a square index."""
+    return PIECE_KEYS[piece.color][type(piece)][sq_idx]
+
+
+@lru_cache(maxsize=None)
+def castling_key(mask: int) -> int:
+    """Returns the combined key of a castling rights mask.
+
+    Keys combine by XOR, so castling_key(a ^ b) updates a key from the
+    rights in a to those in b.
+    """
+    key = 0
+    for right, bit in RIGHT_BITS.items():
+        if mask & bit:
+            key ^= CASTLING_KEYS[right]
+    return key
+
+
+def ep_key(ep_square: Square | None) -> int:
+    """Returns the key of an en passant target, keyed by file."""
+    if ep_square is None or ep_square.is_none_square:
+        return 0
+    return EP_FILE_KEYS[ep_square.col]
+
+
+def pocket_key(pockets: tuple[tuple[int, ...], tuple[int, ...]]) -> int:
+    """Returns the key of both Crazyhouse pockets.
+
+    Each pocket contributes one key per piece type, selected by how many
+    pieces of that type it holds.
+    """
+    key = 0
+    for color, pocket in zip((Color.WHITE, Color.BLACK), pockets):
+        keys = POCKET_KEYS[color]
+        for p_type, count in zip(POCKET_TYPES, pocket):
+            if count:
+                key ^= keys[p_type][min(count, _MAX_COUNT)]
+    return key
+
+
+def pocket_count_key(color: Color, p_type: type[Piece], count: int) -> int:
+    """Returns the key of one piece type's count in a Crazyhouse pocket."""
+    return POCKET_KEYS[color][p_type][min(count, _MAX_COUNT)]
+
+
+def checks_key(checks: tuple[int, int]) -> int:
+    """Returns the key of the Three-check counters."""
+    return (
+        CHECK_KEYS[Color.WHITE][min(checks[0], _MAX_COUNT)] ^
+        CHECK_KEYS[Color.BLACK][min(checks[1], _MAX_COUNT)]
+    )
+
+
+def compute_key(state: "GameState") -> int:
+    """Computes the Zobrist key of a state from scratch.
+
+    Args:
+        state: The state to hash.
+
+    Returns:
+        The 64-bit key covering pieces, side to move, castling rights, en
+        passant file and any variant extras the state carries.
+    """
+    from v_chess.game_state import ThreeCheckGameState, CrazyhouseGameState
+
+    key = 0
+    for color, pieces in state.board.bitboard.pieces.items():
+        color_keys = PIECE_KEYS[color]
+        for p_type, mask in pieces.items():
+            keys = color_keys[p_type]
+            while mask:
+                key ^= keys[(mask & -mask).bit_length() - 1]
+                mask &= mask - 1
+
+    if state.turn == Color.BLACK:
+        key ^= BLACK_TO_MOVE_KEY
+    key ^= castling_key(rights_mask(state.castling_rights))
+    key ^= ep_key(state.ep_square)
+
+    if isinstance(state, CrazyhouseGameState):
+        key ^= pocket_key(state.pockets)
+    if isinstance(state, ThreeCheckGameState):
+        key ^= checks_key(state.checks)
+    return key